@@ -0,0 +1,73 @@
+""" Comparison of the binary codec (`dumps_binary`/`loads_binary`) with the text engine (`dumps`/`loads`).
+
+Usage:
+    ```shell
+    python benchmarks/json/binary.py [--sizes 1KB,1MB] [--shapes flat-numeric,deep-strings] [--repeat 3]
+    ```
+
+The documents are the same of `suite.py`. For every shape and size one JSON
+object per line is written, with the size of both representations and the
+best time out of `REPEAT` runs of each function:
+
+```json
+{"binary_bytes": 820, "dumps_binary_seconds": 0.0001, "loads_binary_seconds": 0.0001, "text_bytes": 1205, ...}
+```
+"""
+import getopt
+import os
+import sys
+
+# Allow running the script from a clone of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "..", "..", "src"))
+
+import polyfills.json as json
+
+from suite import DEFAULT_SHAPES, best_time, build_document, interpreter_info, parse_size
+
+DEFAULT_SIZES = "1KB,100KB,1MB,10MB"
+
+
+def compare(document, repeat):
+    # type: (list, int) -> dict
+    """Measures the size and the encoding/decoding time of both representations of `document`."""
+    text = json.dumps(document)
+    data = json.dumps_binary(document)
+
+    return {
+        "text_bytes": len(text),
+        "binary_bytes": len(data),
+        "dumps_seconds": round(best_time(lambda document=document: json.dumps(document), repeat), 6),
+        "loads_seconds": round(best_time(lambda text=text: json.loads(text), repeat), 6),
+        "dumps_binary_seconds": round(best_time(lambda document=document: json.dumps_binary(document), repeat), 6),
+        "loads_binary_seconds": round(best_time(lambda data=data: json.loads_binary(data), repeat), 6),
+    }
+
+
+def main(arguments):
+    # type: (list[str]) -> None
+    options, _ = getopt.getopt(arguments, "", ["sizes=", "shapes=", "repeat="])
+
+    settings = {
+        "--sizes": DEFAULT_SIZES,
+        "--shapes": DEFAULT_SHAPES,
+        "--repeat": "3",
+    }
+    for name, value in options:
+        settings[name] = value
+
+    info = interpreter_info()
+    for shape in settings["--shapes"].split(","):
+        for size in settings["--sizes"].split(","):
+            result = compare(build_document(shape, parse_size(size)), int(settings["--repeat"]))
+            result["shape"] = shape
+            result["size"] = size
+
+            for key in info.keys():
+                result[key] = info[key]
+
+            sys.stdout.write(json.dumps(result, sort_keys=1 == 1) + "\n")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
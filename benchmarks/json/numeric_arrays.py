@@ -0,0 +1,134 @@
+""" Microbenchmark for the decoding of numeric arrays with `polyfills.json.loads`.
+
+Usage:
+    ```shell
+    python benchmarks/json/numeric_arrays.py [ELEMENTS] [REPEAT]
+    ```
+
+For every kind of array (integers, floats, mixed numbers and literals) the
+best time out of `REPEAT` runs is reported, together with the time spent
+on each element, for:
+
+- `current`: `loads()` as it is;
+- `regex`: `loads()` with the previous scalar decoding (the number grammar
+  compiled on every value and matched before the literals), to measure the
+  gain of the first-character dispatch;
+- `stdlib`: the standard `json` module, when available.
+"""
+import os
+import re
+import sys
+import time
+
+# Allow running the script from a clone of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "..", "..", "src"))
+
+import polyfills.json as json
+
+try:
+    import json as stdlib_json
+except ImportError:
+    # Python < 2.6 and Jython < 2.7
+    stdlib_json = None
+
+
+def _regex_decode_scalar(json_str, truthy_value, falsy_value):
+    """The scalar decoding used before the first-character dispatch (the baseline)."""
+    # https://stackoverflow.com/a/66379646/8965861
+    REGEX_FLOAT   = re.compile(r"(?i)^\s*[+-]?(?:inf(inity)?|nan|(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*$")
+    REGEX_INTEGER = re.compile(r"^([+-]?[1-9]\d*|0)$")
+
+    if REGEX_INTEGER.match(json_str):
+        return int(json_str)
+    elif REGEX_FLOAT.match(json_str):
+        return float(json_str)
+    elif json_str == "true":
+        if truthy_value is not None:
+            return truthy_value
+        return 1 == 1
+    elif json_str == "false":
+        if falsy_value is not None:
+            return falsy_value
+        return 1 == 0
+    elif json_str == "null":
+        return None
+
+    raise json.JSONDecodeError("Unhandled json value: %s" % json_str)
+
+
+def build_documents(elements):
+    # type: (int) -> list[tuple[str, str]]
+    """Builds the JSON arrays used by the benchmark.
+
+    Args:
+        elements (int): The number of elements of each array.
+
+    Returns:
+        list[tuple[str, str]]: Pairs of `(name, document)`.
+    """
+    integers = []
+    floats = []
+    mixed = []
+    for index in range(elements):
+        integers.append(str(index * 7919 - elements))
+        floats.append(str(index * 0.37 - 1.5) + "e" + str(index % 5))
+        mixed.append(["-42", "3.14", "true", "false", "null", "0"][index % 6])
+
+    return [
+        ("integers", "[" + ", ".join(integers) + "]"),
+        ("floats", "[" + ", ".join(floats) + "]"),
+        ("mixed", "[" + ", ".join(mixed) + "]"),
+    ]
+
+
+def best_time(function, document, repeat):
+    # type: (Callable, str, int) -> float
+    """Returns the best time (in seconds) out of `repeat` calls to `function(document)`."""
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        function(document)
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def regex_loads(document):
+    """Calls `loads()` with the baseline scalar decoding."""
+    current = json._decode_scalar
+    json._decode_scalar = _regex_decode_scalar
+    try:
+        return json.loads(document)
+    finally:
+        json._decode_scalar = current
+
+
+def main(elements=100000, repeat=5):
+    engines = [("current", json.loads), ("regex", regex_loads)]
+    if stdlib_json is not None:
+        engines.append(("stdlib", stdlib_json.loads))
+
+    for name, document in build_documents(elements):
+        times = {}
+        for engine, function in engines:
+            elapsed = best_time(function, document, repeat)
+            times[engine] = elapsed
+
+            print("%-10s %-8s %8d elements  %8.3f s  %8.3f us/element" % (
+                name,
+                engine,
+                elements,
+                elapsed,
+                elapsed * 1000000.0 / elements,
+            ))
+
+        if times["current"] > 0:
+            print("%-10s speed-up over the regex path: %.2fx" % (name, times["regex"] / times["current"]))
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:3]]
+    main(*arguments)
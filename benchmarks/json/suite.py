@@ -0,0 +1,349 @@
+""" Throughput benchmark of `polyfills.json` on synthetic documents of several shapes and sizes.
+
+Usage:
+    ```shell
+    python benchmarks/json/suite.py [--sizes 1KB,1MB,50MB] [--shapes flat-numeric,deep-strings]
+                                    [--operations loads,dumps,dump,load] [--repeat 3] [--output results.jsonl]
+    ```
+
+The documents are arrays of records generated along two axes:
+
+| Axis      | Values              | Meaning                                                      |
+| --------- | ------------------- | ------------------------------------------------------------ |
+| structure | `flat`, `deep`      | Records with a single level of members or nested 16 levels   |
+| content   | `numeric`, `strings`| Values are integers and floats or strings with escapes       |
+
+For every combination of shape, size and operation the best time out of
+`REPEAT` runs is reported as a JSON object on its own line (JSON Lines),
+so that results from different interpreters can be collected and compared:
+
+```json
+{"interpreter": "cpython", "mb_per_second": 12.5, "memory_method": "tracemalloc", "operation": "loads", ...}
+```
+
+Throughput is expressed in MB (1,000,000 bytes) of JSON text per second.
+Peak memory is measured on a separate (untimed) run with the best method
+available on the interpreter (`memory_method`):
+
+- `tracemalloc`: memory allocated by the operation (CPython 3.4+);
+- `jvm-heap`: peak usage of the JVM heap pools during the operation (Jython);
+- `maxrss`: peak resident size of the whole process so far (other Unix interpreters);
+- `null` when none of them is available.
+"""
+import getopt
+import os
+import sys
+import tempfile
+import time
+
+# Allow running the script from a clone of the repository
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "..", "..", "src"))
+
+import polyfills.json as json
+
+IS_JYTHON = sys.platform[:4] == "java"
+
+DEFAULT_SIZES = "1KB,100KB,1MB,10MB,50MB"
+DEFAULT_SHAPES = "flat-numeric,flat-strings,deep-numeric,deep-strings"
+DEFAULT_OPERATIONS = "loads,dumps,dump,load"
+
+# Nesting level of the records of `deep` documents
+DEEP_LEVELS = 16
+
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 * 1024}
+
+
+def parse_size(size):
+    # type: (str) -> int
+    """Converts a size like `1KB` or `50MB` to a number of bytes."""
+    size = size.strip().upper()
+    for unit in ["KB", "MB", "B"]:
+        if size[-len(unit):] == unit:
+            return int(size[:-len(unit)]) * _SIZE_UNITS[unit]
+
+    return int(size)
+
+
+def build_values(content, index):
+    # type: (str, int) -> list
+    """Returns the values of a record (numbers or strings, depending on `content`)."""
+    if content == "numeric":
+        return [
+            index,
+            index * 7919 - 1000000,
+            index * 0.37 - 1.5,
+            (index % 97) * 1.25e10,
+            [index % 10, index % 100, index % 1000, -index],
+        ]
+
+    return [
+        "server%d" % index,
+        "C:\\Program Files\\IBM\\WebSphere\\profiles\\node%d" % index,
+        'Message "%d" with\ttabs and\nnewlines' % index,
+        "cell/node/server/%d/applications" % index,
+        ["alpha", "beta", "gamma", "delta%d" % index],
+    ]
+
+
+def build_record(shape, index):
+    # type: (str, int) -> dict
+    """Builds the `index`-th record of a document of the given shape (e.g. `deep-strings`)."""
+    structure, content = shape.split("-")
+
+    record = {"id": index}
+    names = ["a", "b", "c", "d", "e"]
+    values = build_values(content, index)
+    for position in range(len(names)):
+        record[names[position]] = values[position]
+
+    if structure == "flat":
+        return record
+
+    # Alternate objects and arrays, so that both kinds of containers are nested
+    for level in range(DEEP_LEVELS):
+        if level % 2:
+            record = [level, record]
+        else:
+            record = {"level": level, "child": record}
+
+    return record
+
+
+def build_document(shape, size):
+    # type: (str, int) -> list
+    """Builds a document of roughly `size` bytes (when encoded) made of records of the given shape."""
+    record_size = len(json.dumps(build_record(shape, 0))) + 2
+    count = max(1, divmod(size, record_size)[0])
+
+    document = []
+    for index in range(count):
+        document.append(build_record(shape, index))
+
+    return document
+
+
+def best_time(function, repeat):
+    # type: (Callable, int) -> float
+    """Returns the best time (in seconds) out of `repeat` calls to `function`."""
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        function()
+        elapsed = time.time() - start
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def _peak_with_tracemalloc(function):
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _peak_with_jvm(function):
+    from java.lang import System
+    from java.lang.management import ManagementFactory, MemoryType
+
+    System.gc()
+    pools = []
+    for pool in ManagementFactory.getMemoryPoolMXBeans():
+        if pool.getType() == MemoryType.HEAP:
+            pool.resetPeakUsage()
+            pools.append(pool)
+
+    function()
+
+    peak = 0
+    for pool in pools:
+        peak = peak + pool.getPeakUsage().getUsed()
+
+    return peak
+
+
+def _peak_with_maxrss(function):
+    import resource
+
+    function()
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        # Linux reports kilobytes, macOS bytes
+        peak = peak * 1024
+
+    return peak
+
+
+def peak_memory(function):
+    # type: (Callable) -> tuple[int|None, str|None]
+    """Runs `function` once measuring its peak memory usage.
+
+    Returns:
+        tuple[int|None, str|None]: The peak usage (in bytes) and the name of the method used.
+    """
+    for method, measure in [
+        ("tracemalloc", _peak_with_tracemalloc),
+        ("jvm-heap", _peak_with_jvm),
+        ("maxrss", _peak_with_maxrss),
+    ]:
+        try:
+            return measure(function), method
+        except ImportError:
+            pass
+
+    function()
+    return None, None
+
+
+def interpreter_info():
+    # type: () -> dict
+    """Describes the running interpreter (included in every result)."""
+    info = {
+        "interpreter": "cpython",
+        "python_version": sys.version.split()[0],
+        "platform": sys.platform,
+    }
+
+    if IS_JYTHON:
+        from java.lang import System
+
+        info["interpreter"] = "jython"
+        info["java_version"] = str(System.getProperty("java.version"))
+    else:
+        try:
+            import platform
+            info["interpreter"] = platform.python_implementation().lower()
+        except (ImportError, AttributeError):
+            pass
+
+    return info
+
+
+class _Operations:
+    """The operations being measured, bound to a document and a temporary file."""
+
+    def __init__(self, document, path):
+        self.document = document
+        self.path = path
+        self.text = json.dumps(document)
+
+        fh = open(path, "w")
+        try:
+            fh.write(self.text)
+        finally:
+            fh.close()
+
+    def loads(self):
+        json.loads(self.text)
+
+    def dumps(self):
+        json.dumps(self.document)
+
+    def dump(self):
+        fh = open(self.path + ".out", "w")
+        try:
+            json.dump(fh, self.document)
+        finally:
+            fh.close()
+
+    def load(self):
+        fh = open(self.path, "r")
+        try:
+            json.load(fh)
+        finally:
+            fh.close()
+
+    def cleanup(self):
+        for path in [self.path, self.path + ".out"]:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def run(shapes, sizes, operations, repeat, output):
+    # type: (list[str], list[str], list[str], int, file) -> None
+    """Runs every combination of shape, size and operation, writing one result per line to `output`."""
+    info = interpreter_info()
+
+    for shape in shapes:
+        for size in sizes:
+            bench = _Operations(build_document(shape, parse_size(size)), tempfile.mktemp(".json"))
+            try:
+                size_bytes = os.path.getsize(bench.path)
+
+                for operation in operations:
+                    function = getattr(bench, operation)
+                    elapsed = best_time(function, repeat)
+                    memory, memory_method = peak_memory(function)
+
+                    result = {
+                        "shape": shape,
+                        "size": size,
+                        "size_bytes": size_bytes,
+                        "operation": operation,
+                        "repeat": repeat,
+                        "best_seconds": round(elapsed, 6),
+                        "mb_per_second": None,
+                        "peak_memory_bytes": memory,
+                        "memory_method": memory_method,
+                    }
+                    if elapsed > 0:
+                        result["mb_per_second"] = round(size_bytes / 1000000.0 / elapsed, 3)
+
+                    for key in info.keys():
+                        result[key] = info[key]
+
+                    output.write(json.dumps(result, sort_keys=1 == 1) + "\n")
+                    output.flush()
+            finally:
+                bench.cleanup()
+
+
+def main(arguments):
+    # type: (list[str]) -> None
+    options, _ = getopt.getopt(arguments, "", ["sizes=", "shapes=", "operations=", "repeat=", "output="])
+
+    settings = {
+        "--sizes": DEFAULT_SIZES,
+        "--shapes": DEFAULT_SHAPES,
+        "--operations": DEFAULT_OPERATIONS,
+        "--repeat": "3",
+        "--output": None,
+    }
+    for name, value in options:
+        settings[name] = value
+
+    for operation in settings["--operations"].split(","):
+        if operation not in DEFAULT_OPERATIONS.split(","):
+            raise SystemExit("Unknown operation '%s'" % operation)
+
+    for shape in settings["--shapes"].split(","):
+        if shape not in DEFAULT_SHAPES.split(","):
+            raise SystemExit("Unknown shape '%s'" % shape)
+
+    if settings["--output"] is None:
+        output = sys.stdout
+    else:
+        output = open(settings["--output"], "w")
+
+    try:
+        run(
+            settings["--shapes"].split(","),
+            settings["--sizes"].split(","),
+            settings["--operations"].split(","),
+            int(settings["--repeat"]),
+            output,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -6,11 +6,15 @@ class OrderedDict:
         self._keys = []
         self._values = [] # type: list
 
-        if(type(d).__name__ not in ["dict", "org.python.core.PyDictionary"]):    # Fix for Jython types
+        if type(d) == type([]) or type(d) == type(()):
+            # Sequence of `(key, value)` pairs, added in the same order
+            for key, value in d:
+                self[key] = value
+        elif(type(d).__name__ not in ["dict", "org.python.core.PyDictionary"]):    # Fix for Jython types
             raise TypeError("the dictionary entered is not valid - either regular dictionary or OrderedDictionary object is expected")
-        
-        for key in d.keys():
-            self[key] = d[key]  # In the ord-dict add an entry at the key 'key' and give the value at 'key' in d 
+        else:
+            for key in d.keys():
+                self[key] = d[key]  # In the ord-dict add an entry at the key 'key' and give the value at 'key' in d 
 
         if data:
             for key in data:
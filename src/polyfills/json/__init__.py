@@ -1,5 +1,6 @@
 """ Basic implementation of a JSON parser written in pure Python for very old Python versions (2.2 and lower). """
 import re as _re
+import sys as _sys
 
 IS_BOOLEAN_DEFINED = str(1==1) == 'True'
 IS_POLYFILL_AVAILABLE = 0 == 1
@@ -13,13 +14,18 @@ if not IS_BOOLEAN_DEFINED:
     except ImportError:
         pass
 
-__all__ = ["dumps", "dump", "loads", "load"]
+try:
+    StopIteration
+except NameError:
+    try:
+        from polyfills.stdlib.exceptions import StopIteration
+    except ImportError:
+        class StopIteration(Exception):
+            """ Signal the end from iterator.next(). """
+
+__all__ = ["dumps", "dump", "iterencode", "loads", "load", "IncrementalDecoder", "iterparse", "lazy_loads", "select", "parallel_load_lines", "compile_encoder", "fingerprint", "diff", "apply_patch", "dumps_binary", "loads_binary", "dump_binary", "load_binary", "load_path"]
 
 # The following list of characters is taken from the builtin `json` module.
-#
-# I used a list instead of a dictionary because on Py<=3.5 dictionaries are
-# unordered by default, which is a problem in this case since the backslash
-# may be escaped multiple times.
 ESCAPED_CHARS = [
     {"from": '\\', "to": '\\\\'},
     {"from": '"', "to": '\\"'},
@@ -30,33 +36,599 @@ ESCAPED_CHARS = [
     {"from": '\t', "to": '\\t'},
 ]
 
+try:
+    _unichr = unichr # pyright: ignore[reportUndefinedVariable]
+except NameError:
+    _unichr = chr
+
+# ---> Escaping tables
+#
+#      Every character that must be escaped is looked up in a table, so that
+#      a string is escaped (or unescaped) in a single pass. Characters not in
+#      the table are converted to (or from) their `\uXXXX` representation.
+_ESCAPE_TABLE = {}
+for _code in range(0x20):
+    _ESCAPE_TABLE[chr(_code)] = "\\u%04x" % _code
+for _special_char in ESCAPED_CHARS:
+    _ESCAPE_TABLE[_special_char["from"]] = _special_char["to"]
+
+_UNESCAPE_TABLE = {}
+for _special_char in ESCAPED_CHARS:
+    _UNESCAPE_TABLE[_special_char["to"][1]] = _special_char["from"]
+_UNESCAPE_TABLE["/"] = "/"
+
+del _code, _special_char
+
+# Backslash, double quote, control characters and non-ASCII characters
+_REGEX_ESCAPE = _re.compile(r'[\\"]|[^\ -~]')
+
+# Backslash, double quote and control characters (used when non-ASCII characters are kept as-is)
+_REGEX_ESCAPE_CONTROL = _re.compile(r'[\\"\x00-\x1f]')
+
+# Escape sequences: surrogate pairs (characters outside of the BMP), `\uXXXX` or a single character
+_REGEX_UNESCAPE = _re.compile(
+    r'\\(?:u([dD][89abAB][0-9a-fA-F]{2})\\u([dD][c-fC-F][0-9a-fA-F]{2})|u([0-9a-fA-F]{4})|(.))',
+    _re.DOTALL,
+)
+
+
+ENCODER_BATCH_SIZE = 1024
+""" Number of tokens joined in each fragment returned by `iterencode()` (and written at once by `dump()`). """
+
 
 class BaseJSONError(Exception):
     """ Base exception for the JSON library. """
 
 class JSONDecodeError(BaseJSONError):
-    """ Thrown when there is an error while decoding a JSON String. """
+    """ Thrown when there is an error while decoding a JSON String.
+
+    Attributes:
+        msg (str): The unformatted error message.
+        doc (str|None): The JSON document being parsed.
+        pos (int|None): The index of `doc` where parsing failed.
+        lineno (int|None): The line corresponding to `pos` (computed only when accessed).
+        colno (int|None): The column corresponding to `pos` (computed only when accessed).
+    """
+    def __init__(self, msg, doc=None, pos=None):
+        BaseJSONError.__init__(self, msg)
+
+        self.msg = msg
+        self.doc = doc
+        self.pos = pos
+
+    def __getattr__(self, name):
+        # Line and column are only needed when reporting the error, so they
+        # are not computed when the exception is raised.
+        if name == "lineno":
+            if self.doc is None or self.pos is None:
+                return None
+            return self.doc.count("\n", 0, self.pos) + 1
+
+        if name == "colno":
+            if self.doc is None or self.pos is None:
+                return None
+            return self.pos - self.doc.rfind("\n", 0, self.pos)
+
+        raise AttributeError(name)
+
+    def __str__(self):
+        if self.pos is None:
+            return self.msg
+
+        if self.doc is None:
+            return "%s: char %d" % (self.msg, self.pos)
+
+        return "%s: line %d column %d (char %d)" % (self.msg, self.lineno, self.colno, self.pos)
+
+
+def _locate_error(error, doc, offset):
+    # type: (JSONDecodeError, str, int) -> None
+    """Makes the position of an error raised while decoding a slice of `doc` (starting at `offset`) absolute."""
+    if error.pos is None:
+        error.pos = offset
+    else:
+        error.pos = error.pos + offset
+
+    error.doc = doc
+
+
+class _Iterator:
+    """Base class for the lazy iterators returned by this package.
+
+    Generators are not available on Python < 2.2, so subclasses implement
+    `next()` and this class exposes it through both iteration protocols:
+    `__iter__`/`__next__` on newer versions and `__getitem__` (which is what
+    `for` loops call on Python 2.1).
+    """
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def __getitem__(self, index):
+        try:
+            return self.next()
+        except StopIteration:
+            raise IndexError(index)
+
+def _escape_char(match):
+    # type: (re.Match) -> str
+    """Returns the escape sequence of the character matched by `_REGEX_ESCAPE`."""
+    char = match.group(0)
+
+    try:
+        return _ESCAPE_TABLE[char]
+    except KeyError:
+        pass
+
+    code = ord(char)
+
+    # Characters outside of the Basic Multilingual Plane are represented with a surrogate pair
+    if code > 0xFFFF:
+        code = code - 0x10000
+        return "\\u%04x\\u%04x" % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+
+    return "\\u%04x" % code
+
 
-def escape_string(string):
-    # type: (str) -> str
+def escape_string(string, ensure_ascii=1 == 1):
+    # type: (str, bool) -> str
     """Escapes a string so that it can be used as a JSON string.
 
+    Backslashes, double quotes and control characters are escaped, and
+    non-ASCII characters are converted to their `\\uXXXX` representation.
+
     Args:
         string (str): The string to escape.
+        ensure_ascii (bool, optional): Whether to escape non-ASCII characters. Defaults to True.
 
     Returns:
         str: The escaped string.
     """
-    for special_char in ESCAPED_CHARS:
-        string = string.replace(special_char["from"], special_char["to"])
-    
-    return string
+    if not ensure_ascii:
+        if not _REGEX_ESCAPE_CONTROL.search(string):
+            return string
+
+        return _REGEX_ESCAPE_CONTROL.sub(_escape_char, string)
+
+    # Fast path: most strings have nothing to escape
+    if not _REGEX_ESCAPE.search(string):
+        return string
+
+    # Byte strings (Python 2) are decoded first, so that every multi-byte
+    #   character is converted to a single escape sequence.
+    if type(string) != _UNICODE_TYPE:
+        try:
+            string = unicode(string, "utf-8") # pyright: ignore[reportUndefinedVariable]
+        except UnicodeError:
+            string = unicode(string, "latin-1") # pyright: ignore[reportUndefinedVariable]
+
+    return str(_REGEX_ESCAPE.sub(_escape_char, string))
+
+
+# ---> Python types handled by the encoder
+_DICT_TYPE = type({})
+_LIST_TYPE = type([])
+_TUPLE_TYPE = type(())
+_STRING_TYPE = type("")
+_UNICODE_TYPE = type(u"")
+_INT_TYPE = type(5)
+_FLOAT_TYPE = type(5.0)
+_NONE_TYPE = type(None)
+_BOOL_TYPE = type(1 == 1)   # Same as `_INT_TYPE` on Python < 2.3
+
+try:
+    _LONG_TYPE = type(long(5)) # pyright: ignore[reportUndefinedVariable]
+except NameError:
+    _LONG_TYPE = _INT_TYPE
+
+# The `OrderedDict` polyfill (e.g. returned by `object_pairs_hook`) is encoded as an object.
+#   It is an old-style class on Python 2, so its type is shared by every other instance
+#   and the class must be checked too.
+try:
+    from polyfills.collections import OrderedDict as _OrderedDict
+    _ORDERED_DICT_TYPE = type(_OrderedDict())
+except ImportError:
+    _OrderedDict = _ORDERED_DICT_TYPE = None
+
+
+def _encode_string(obj):
+    return '"%s"' % escape_string(obj)
+
+def _encode_string_unicode(obj):
+    return '"%s"' % escape_string(obj, 1 == 0)
+
+def _encode_null(obj):
+    return "null"
+
+def _encode_bool(obj):
+    if obj:
+        return "true"
+    return "false"
+
+def _encode_other(obj):
+    # type: (Any) -> str
+    """Encodes a value whose type has no entry in `_SCALAR_ENCODERS`.
+
+    Objects that represent themselves as `True` or `False` are considered
+    booleans, everything else cannot be serialized.
+    """
+    representation = str(obj)
+    if representation == "True":
+        return "true"
+    elif representation == "False":
+        return "false"
+
+    raise TypeError("Object of type '%s' is not JSON serializable" % type(obj).__name__)
+
+def _encode_polyfill_bool(obj):
+    # Instances of old-style classes all share the same type
+    if obj.__class__ is _bool.bool:
+        return _encode_bool(obj)
+
+    return _encode_other(obj)
+
+
+# ---> Encoding function of each scalar type
+#
+#      The type of a value selects directly the function that encodes it, so
+#      every value is checked (and numbers are formatted) only once.
+_SCALAR_ENCODERS = {
+    _STRING_TYPE: _encode_string,
+    _UNICODE_TYPE: _encode_string,
+    _INT_TYPE: str,
+    _LONG_TYPE: str,
+    _FLOAT_TYPE: str,
+    _NONE_TYPE: _encode_null,
+}
+if _BOOL_TYPE != _INT_TYPE:
+    _SCALAR_ENCODERS[_BOOL_TYPE] = _encode_bool
+if IS_POLYFILL_AVAILABLE:
+    _SCALAR_ENCODERS[type(_bool.bool(1))] = _encode_polyfill_bool
+
+# Same as above, but non-ASCII characters are kept as-is (`ensure_ascii=False`)
+_SCALAR_ENCODERS_UNICODE = _SCALAR_ENCODERS.copy()
+_SCALAR_ENCODERS_UNICODE[_STRING_TYPE] = _encode_string_unicode
+_SCALAR_ENCODERS_UNICODE[_UNICODE_TYPE] = _encode_string_unicode
+
+
+def _encode_scalar(obj, obj_type, truthy_value, falsy_value, scalar_encoders=_SCALAR_ENCODERS):
+    # type: (Any, type, Any, Any, dict) -> str
+    """Encodes a value that is neither an object nor an array.
+
+    Examples:
+        >>> json.dumps("True")
+        '"True"'
+
+        >>> json.dumps(True)
+        'true'
+
+        >>> json.dumps(2, indent=4)
+        '2'
+
+        >>> json.dumps(None)
+        'null'
+
+        Extra parameters for Jython v. < 2.3:
+
+        >>> json.dumps("True", truthy_value="True", falsy_value="False")
+        'true'
+
+        >>> json.dumps(0, truthy_value=1, falsy_value=0)
+        'false'
+
+    Args:
+        obj (Any): The value to encode.
+        obj_type (type): The type of the value.
+        truthy_value (Any): The value that should be encoded as `true`.
+        falsy_value (Any): The value that should be encoded as `false`.
+        scalar_encoders (dict, optional): The encoding function of each type. Defaults to `_SCALAR_ENCODERS`.
+
+    Raises:
+        TypeError: The value cannot be represented in JSON.
+
+    Returns:
+        str: The JSON representation of the value.
+    """
+    # ---> Custom boolean values
+    if truthy_value is not None:
+        if obj == truthy_value:
+            return "true"
+        elif obj == falsy_value:
+            return "false"
+
+    return scalar_encoders.get(obj_type, _encode_other)(obj)
+
+
+def _encode_key(key, ensure_ascii=1 == 1):
+    # type: (Any, bool) -> str
+    """Encodes an object key, WITHOUT the surrounding quotes.
+
+    Keys that are not strings are converted like their JSON representation
+    (e.g. `True` becomes `"true"` and `1.5` becomes `"1.5"`).
+
+    Args:
+        key (Any): The key to encode.
+        ensure_ascii (bool, optional): Whether to escape non-ASCII characters. Defaults to True.
+
+    Returns:
+        str: The escaped key.
+    """
+    if type(key) == _STRING_TYPE or type(key) == _UNICODE_TYPE:
+        return escape_string(key, ensure_ascii)
+
+    encoded_key = "".join(_Encoder(key, None, None, None, ensure_ascii=ensure_ascii).encode())
+
+    # Remove quotes from the encoded key, because they are added by the caller.
+    if encoded_key.startswith('"') and encoded_key.endswith('"'):
+        encoded_key = encoded_key[1:-1]
+
+    return encoded_key
+
+
+class _Encoder(_Iterator):
+    """Resumable JSON encoder.
+
+    The object graph is walked with an explicit stack (no recursion) and every
+    token is appended to a single list. When indenting, the line break and the
+    prefix of the current depth are emitted right before each item, so nested
+    values are never re-indented.
+
+    Since the whole state lives in the instance, the encoding can be suspended
+    after a given number of tokens and resumed later: this is what allows
+    `iterencode()` to return the document a fragment at a time.
+    """
+
+    def __init__(self, obj, indent, truthy_value, falsy_value, max_depth=None, separators=None, sort_keys=1 == 0, ensure_ascii=1 == 1, memo=1 == 0):
+        # type: (Any, int|None, Any, Any, int|None, tuple[str, str]|None, bool, bool, bool) -> None
+        """Initializes the encoder.
+
+        Args:
+            obj (Any): The object to encode.
+            indent (int|None): The number of spaces to use as indentation (`None` for compact output).
+            truthy_value (Any): The value that should be encoded as `true`.
+            falsy_value (Any): The value that should be encoded as `false`.
+            max_depth (int|None, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+            separators (tuple[str, str]|None, optional): The `(item_separator, key_separator)` pair. Defaults to None (`(", ", ": ")`).
+            sort_keys (bool, optional): Whether to write the members of objects sorted by key. Defaults to False.
+            ensure_ascii (bool, optional): Whether to escape non-ASCII characters. Defaults to True.
+            memo (bool, optional): Whether to reuse the text of the containers met more than once. Defaults to False.
+        """
+        self._indent = indent
+        self._truthy_value = truthy_value
+        self._falsy_value = falsy_value
+        self._max_depth = max_depth
+        self._sort_keys = sort_keys
+        self._ensure_ascii = ensure_ascii
+        self._memo = memo
+
+        if separators is None:
+            separators = (", ", ": ")
+        self._item_separator, self._key_separator = separators
+
+        if ensure_ascii:
+            self._scalar_encoders = _SCALAR_ENCODERS
+        else:
+            self._scalar_encoders = _SCALAR_ENCODERS_UNICODE
+
+        # The next value that needs to be encoded
+        self._value = obj
+
+        # Every open container is represented by a frame with the following items:
+        #   [container, keys (None for arrays), position of the next item, number of items,
+        #    index of its first token (None when its text is not memoized), memo key]
+        self._stack = []                # type: list[list]
+
+        # The `id()` of every open container, to detect circular references
+        self._open_ids = {}             # type: dict[int, int]
+
+        # The memo keys of the containers already met and the text of those met more than once
+        self._seen = {}                 # type: dict[Any, int]
+        self._fragments = {}            # type: dict[Any, str]
+
+        # Line break followed by the indentation of each depth (built on demand)
+        self._line_prefixes = ["\n"]    # type: list[str]
+
+        self.finished = 1 == 0
+
+    def encode(self, limit=None):
+        # type: (int|None) -> list[str]
+        """Encodes the next part of the object.
+
+        Args:
+            limit (int, optional): Suspend the encoding once (at least) this number of tokens has been produced. Defaults to None (encode everything).
+
+        Returns:
+            list[str]: The tokens produced.
+        """
+        if self.finished:
+            return []
+
+        indent = self._indent
+        truthy_value = self._truthy_value
+        falsy_value = self._falsy_value
+        max_depth = self._max_depth
+        sort_keys = self._sort_keys
+        ensure_ascii = self._ensure_ascii
+        item_separator = self._item_separator
+        key_separator = self._key_separator
+        scalar_encoders = self._scalar_encoders
+        stack = self._stack
+        line_prefixes = self._line_prefixes
+        open_ids = self._open_ids
+        memo = self._memo
+
+        chunks = []     # type: list[str]
+
+        value = self._value
+        while 1:
+            value_type = type(value)
+
+            #  ---> Handle JSON objects and arrays
+            if value_type == _DICT_TYPE or value_type == _LIST_TYPE or value_type == _TUPLE_TYPE or \
+                    (value_type == _ORDERED_DICT_TYPE and value.__class__ is _OrderedDict):
+                if max_depth is not None and len(stack) >= max_depth:
+                    raise ValueError("Maximum nesting depth exceeded (%d)" % max_depth)
+
+                value_id = id(value)
+                if open_ids.get(value_id) is not None:
+                    raise ValueError("Circular reference detected")
+
+                # ---> Memoized containers: the text is recorded the second time they are met
+                #      and reused from the third one (when indenting, it also depends on the depth)
+                start = memo_key = fragment = None
+                if memo:
+                    if indent:
+                        memo_key = (value_id, len(stack))
+                    else:
+                        memo_key = value_id
+
+                    fragment = self._fragments.get(memo_key)
+                    if fragment is None:
+                        if self._seen.get(memo_key) is None:
+                            self._seen[memo_key] = 1
+                        else:
+                            start = len(chunks)
+
+                if fragment is not None:
+                    chunks.append(fragment)
+                else:
+                    if value_type != _LIST_TYPE and value_type != _TUPLE_TYPE:
+                        keys = list(value.keys())
+                        if sort_keys:
+                            keys.sort()
+                        length = len(keys)
+                        opening, closing = "{", "}"
+                    else:
+                        keys = None
+                        length = len(value)
+                        opening, closing = "[", "]"
+
+                    if length:
+                        chunks.append(opening)
+                        stack.append([value, keys, 0, length, start, memo_key])
+                        open_ids[value_id] = 1
+
+                        if indent and len(line_prefixes) <= len(stack):
+                            line_prefixes.append("\n" + " " * (indent * len(stack)))
+                    elif indent:
+                        # Empty containers still span two lines
+                        if len(line_prefixes) <= len(stack):
+                            line_prefixes.append("\n" + " " * (indent * len(stack)))
+                        chunks.append(opening + line_prefixes[len(stack)] + closing)
+                    else:
+                        chunks.append(opening + closing)
+
+            # ---> Handle and encode other JSON types
+            elif truthy_value is None:
+                chunks.append(scalar_encoders.get(value_type, _encode_other)(value))
+            else:
+                chunks.append(_encode_scalar(value, value_type, truthy_value, falsy_value, scalar_encoders))
+
+            # ---> Close all the containers whose items have all been encoded
+            while stack and stack[-1][2] == stack[-1][3]:
+                frame = stack.pop()
+                del open_ids[id(frame[0])]
+
+                if frame[1] is None:
+                    closing = "]"
+                else:
+                    closing = "}"
+
+                if indent:
+                    chunks.append(line_prefixes[len(stack)] + closing)
+                else:
+                    chunks.append(closing)
+
+                start = frame[4]
+                if start is not None:
+                    fragment = "".join(chunks[start:])
+                    del chunks[start:]
+                    chunks.append(fragment)
+                    self._fragments[frame[5]] = fragment
+
+            if not stack:
+                self.finished = 1 == 1
+                self._value = None
+                break
+
+            # ---> Move to the next item of the innermost container
+            frame = stack[-1]
+            container, keys, position = frame[0], frame[1], frame[2]
+            frame[2] = position + 1
+
+            if position > 0:
+                chunks.append(item_separator)
+
+            if indent:
+                chunks.append(line_prefixes[len(stack)])
+
+            if keys is None:
+                value = container[position]
+            else:
+                chunks.append('"%s"%s' % (_encode_key(keys[position], ensure_ascii), key_separator))
+                value = container[keys[position]]
+
+            if limit is not None and len(chunks) >= limit:
+                self._value = value
+
+                # The tokens are returned: the containers still open cannot be memoized
+                if memo:
+                    for frame in stack:
+                        frame[4] = None
+                break
+        # endwhile
+
+        return chunks
+
+    def next(self):
+        if self.finished:
+            raise StopIteration()
+
+        return "".join(self.encode(ENCODER_BATCH_SIZE))
+
+
+def _check_encoder_options(truthy_value, falsy_value):
+    """Validates the boolean options of the encoding functions.
+
+    Args:
+        truthy_value (Any): The value that should be encoded as `true`.
+        falsy_value (Any): The value that should be encoded as `false`.
+
+    Raises:
+        Exception: The options are not valid for the current Python version.
+    """
+    if not IS_BOOLEAN_DEFINED and not IS_POLYFILL_AVAILABLE and (truthy_value is None and falsy_value is None):
+        raise Exception(
+            "No boolean values (True/False) detected and the 'truthy_value' and 'falsy_value' options are not set." +
+            " If you're using this module on Python < 2.3 set them accordingly."
+        )
+
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+
+def _normalize_indent(indent):
+    # type: (int|str|None) -> int|None
+    """Returns the indentation to use, or `None` for compact output."""
+    if indent is not None and indent != "" and indent > 0:
+        return indent
+
+    return None
+
 
 def dumps(
         obj,
         indent=None,          # type: int|None
         truthy_value=None,
         falsy_value=None,
+        max_depth=None,       # type: int|None
+        separators=None,      # type: tuple[str, str]|None
+        sort_keys=1 == 0,     # type: bool
+        ensure_ascii=1 == 1,  # type: bool
+        memo=1 == 0,          # type: bool
     ):
     """Transforms a Python dictionary into a valid json string.
 
@@ -64,528 +636,568 @@ def dumps(
         obj (dict|list): The object (dictionary or list) that needs to be converted to a JSON string.
         indent (int, optional): The number of spaces to use as indentation. Defaults to None.
         numbers_as_boolean (int, optional): Wether to interpret `0` and `1` as boolean values. MUST be set for Python versions < 2.3. Defaults to 0.
+        max_depth (int, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        separators (tuple[str, str], optional): The `(item_separator, key_separator)` pair (e.g. `(",", ":")` for the most compact output). Defaults to None (`(", ", ": ")`).
+        sort_keys (bool, optional): Whether to write the members of objects sorted by key. Defaults to False.
+        ensure_ascii (bool, optional): Whether to escape non-ASCII characters (otherwise they are written as-is). Defaults to True.
+        memo (bool, optional): Whether to encode only once the objects and arrays that appear several times (the same object, not equal ones). Defaults to False.
+
+    Raises:
+        ValueError: The object is nested deeper than `max_depth` or contains a circular reference.
 
     Returns:
         json (str): A string representation of a valid JSON object.
     """
-    if not IS_BOOLEAN_DEFINED and not IS_POLYFILL_AVAILABLE and (truthy_value is None and falsy_value is None):
-        raise Exception(
-            "No boolean values (True/False) detected and the 'truthy_value' and 'falsy_value' options are not set." +
-            " If you're using this module on Python < 2.3 set them accordingly."
-        )
-
-    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
-        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+    _check_encoder_options(truthy_value, falsy_value)
 
-    obj_type = type(obj)
-    obj_string_parts = []             # type: list[str]
+    encoder = _Encoder(obj, _normalize_indent(indent), truthy_value, falsy_value, max_depth, separators, sort_keys, ensure_ascii, memo)
 
-    indent_spaces = 0                 # type: int
-    needs_indentation = indent is not None and indent != "" and indent > 0    # type: bool
-    
-    if needs_indentation:
-        indent_spaces = indent    # type: ignore
-
-
-    #  ---> Handle JSON objects
-    if obj_type == type({}):
-        obj_string_parts.append("{")
-
-        for key in obj.keys(): # pyright: ignore[reportGeneralTypeIssues]
-            if len(obj_string_parts) > 1:
-                obj_string_parts[-1] += ", "
-            value = dumps(obj[key], indent_spaces, truthy_value, falsy_value)
-            parsed_key = dumps(key)
-            
-            # Remove quotes from the parsed key, because we will add them
-            #   manually later.
-            if parsed_key.startswith('"') and parsed_key.endswith('"'):
-                parsed_key = parsed_key[1:-1]
-
-            obj_string_parts.append('"%s": %s' % (
-                parsed_key,
-                str(value),
-            ))
-        
-        obj_string_parts.append("}")
-    #endif
-    
-
-    #  ---> Handle JSON arrays
-    elif obj_type in [type([None,]), type((None,))]:
-        obj_string_parts.append("[")
-        for item in obj:
-            if len(obj_string_parts) > 1:
-                obj_string_parts[-1] += ", "
-            obj_string_parts.append(dumps(item, indent_spaces, truthy_value, falsy_value))
-
-        obj_string_parts.append("]")
-    #endif
-
-
-    # ---> Handle and encode other JSON types:
-    #   >>> json.dumps("True")
-    #   '"True"'
-    #
-    #   >>> json.dumps(True)
-    #   'true'
-    #
-    #   >>> json.dumps(2, indent=4)
-    #   '2'
-    #
-    #   >>> json.dumps(None)
-    #   'null'
-    #
-    # ------------------------------------------------------
-    #
-    # Extra parameters for Jython v. < 2.3:
-    #   >>> json.dumps("True", truthy_value="True", falsy_value="False")
-    #   'true'
-    #
-    #   >>> json.dumps(0, truthy_value=1, falsy_value=0)
-    #   'false'
-    #
-    else:
-        # ---> Boolean types
-        if truthy_value is not None and obj == truthy_value:
-            return "true"
-        elif falsy_value is not None and obj == falsy_value:
-            return "false"
-        elif obj_type != type("") and str(obj) == "True":
-            return "true"
-        elif obj_type != type("") and str(obj) == "False":
-            return "false"
+    return "".join(encoder.encode())
 
-        # ---> Base types
-        elif obj_type == type(""):
-            return '"%s"' % escape_string(str(obj))
-        elif obj_type == type(5):
-            return str(obj)
-        elif obj_type == type(5.0):
-            return str(obj)
-        
-        # ---> Null type
-        elif obj_type == type(None):
-            return "null"
-    #endif
-
-    if needs_indentation:
-        # Indent every line (except the the first and last lines - the
-        #   boundaries of the JSON object) by {indent} spaces if needed (check
-        #   `needs_indentation` for the constraints).
-        for index in range(1, len(obj_string_parts)-1):
-            obj_string_parts[index] = '\n'.join([ 
-                " " * indent_spaces + string 
-                for string in obj_string_parts[index].splitlines()
-            ])
-            
-
-        return '\n'.join(obj_string_parts)
-    #endif
-
-    return ''.join(obj_string_parts)
 
-
-def loads(
-        json_str, # type: str
+def iterencode(
+        obj,
+        indent=None,          # type: int|None
         truthy_value=None,
         falsy_value=None,
+        max_depth=None,       # type: int|None
+        separators=None,      # type: tuple[str, str]|None
+        sort_keys=1 == 0,     # type: bool
+        ensure_ascii=1 == 1,  # type: bool
+        memo=1 == 0,          # type: bool
     ):
+    """Encodes an object to JSON one fragment at a time.
+
+    Joining all the fragments gives the same result of `dumps()`, but the
+    whole string is never built in memory.
+
+    With `memo`, the text of a repeated container is reused as it was when
+    first encoded: the objects must not be modified until the iteration is
+    over, or stale text may be emitted.
+
+    Args:
+        obj (Any): The object that needs to be converted to JSON.
+        indent (int, optional): The number of spaces to use as indentation. Defaults to None.
+        truthy_value (Any, optional): The value that should be encoded as `true`. Defaults to None.
+        falsy_value (Any, optional): The value that should be encoded as `false`. Defaults to None.
+        max_depth (int, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        separators (tuple[str, str], optional): The `(item_separator, key_separator)` pair (e.g. `(",", ":")` for the most compact output). Defaults to None (`(", ", ": ")`).
+        sort_keys (bool, optional): Whether to write the members of objects sorted by key. Defaults to False.
+        ensure_ascii (bool, optional): Whether to escape non-ASCII characters (otherwise they are written as-is). Defaults to True.
+        memo (bool, optional): Whether to encode only once the objects and arrays that appear several times (the same object, not equal ones). Defaults to False.
+
+    Returns:
+        iterator: An iterator over the string fragments (each one made of at most about `ENCODER_BATCH_SIZE` tokens).
+
+    Examples:
+        ```pycon
+        >>> for fragment in iterencode({"key": [1, 2]}):
+        ...     sys.stdout.write(fragment)
+        {"key": [1, 2]}
+        ```
     """
-    Parses a JSON string and returns the corresponding Python object.
+    _check_encoder_options(truthy_value, falsy_value)
+
+    return _Encoder(obj, _normalize_indent(indent), truthy_value, falsy_value, max_depth, separators, sort_keys, ensure_ascii, memo)
+
+
+# ---> Decoder tokens
+#
+#      All the regular expressions are compiled only once (at import time) and
+#      then matched starting from the current index of the decoder, so that
+#      the input string is never sliced or scanned more than once.
+_REGEX_WHITESPACE = _re.compile(r"\s*")
+
+# Raw values (integers, floats, booleans and null) are made of every character
+# up to the next structural character, whitespace or quote.
+_REGEX_SCALAR = _re.compile(r"""[^\s,:\[\]{}"']+""")
+
+# ---> Number grammar
+#
+#      https://stackoverflow.com/a/66379646/8965861
+_REGEX_FLOAT   = _re.compile(r"(?i)^\s*[+-]?(?:inf(inity)?|nan|(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*$")
+_REGEX_INTEGER = _re.compile(r"^([+-]?[1-9]\d*|0)$")
+
+# ---> Boolean values
+#
+#      Created only once, so that every decoded `true`/`false` is the same object.
+if IS_POLYFILL_AVAILABLE:
+    _TRUE = _bool.bool(1)
+    _FALSE = _bool.bool(0)
+else:
+    _TRUE = 1 == 1
+    _FALSE = 1 == 0
+
+# ---> Decoder states
+#
+#      The state tells the decoder which tokens are allowed next. The state of
+#      a parent container is always "expecting a comma or the end" once one of
+#      its children closes, so there is no need to save it on the stack.
+_EXPECT_VALUE = 0           # Top level, after `,` in arrays or after `:` in objects
+_EXPECT_VALUE_OR_END = 1    # Right after `[`
+_EXPECT_KEY = 2             # After `,` in objects
+_EXPECT_KEY_OR_END = 3      # Right after `{`
+_EXPECT_COLON = 4           # After an object key
+_EXPECT_COMMA_OR_END = 5    # After a value inside a container
+_EXPECT_NOTHING = 6         # After the top level value
+
+
+def _find_string_end(json_str, index):
+    # type: (str, int) -> int
+    """Finds the closing double quote of the JSON string starting at `index`.
 
     Args:
-        json_str (str): A JSON string.
-        truthy_value (bool, optional): The value to use for boolean `true`. Defaults to None.
-        falsy_value (bool, optional): The value to use for boolean `false`. Defaults to None.
+        json_str (str): The JSON document.
+        index (int): The index of the first character AFTER the opening quote.
 
     Returns:
-        Any: A Python object corresponding to the JSON string.
+        int: The index of the closing quote, or `-1` if the string is not closed.
     """
-    json_str = json_str.strip()
+    end = json_str.find('"', index)
 
-    if not IS_BOOLEAN_DEFINED and not IS_POLYFILL_AVAILABLE and (truthy_value is None and falsy_value is None):
-        print(
-            "Warning: No boolean values (True/False) detected and the 'truthy_value' and 'falsy_value' options are not set." +
-            " If you're using this module on Python < 2.3 set them accordingly."
-        )
+    while end != -1:
+        # A quote is escaped only if preceded by an odd number of backslashes
+        #   (e.g. `"\\"` is a string containing a single backslash).
+        backslashes = 0
+        while end - backslashes - 1 >= index and json_str[end - backslashes - 1] == "\\":
+            backslashes = backslashes + 1
 
-    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
-        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+        if backslashes % 2 == 0:
+            return end
 
+        end = json_str.find('"', end + 1)
 
-    # Ensure that the input is a string.
-    if type(json_str) != type(""):
-        raise TypeError('Expected a string, got %s' % type(json_str))
+    return end
 
-    # Define temporary boolean values for old Jython versions (<2.3) that do not support True/False
-    __false__ = 1 == 0  # type: bool
-    __true__ = 1 == 1   # type: bool
 
-    is_inside_string = __false__  # type: bool
+def _unescape_char(match):
+    # type: (re.Match) -> str
+    """Returns the character represented by the escape sequence matched by `_REGEX_UNESCAPE`."""
+    high, low, code, char = match.groups()
 
-    last_string = ()    # type: tuple[int, ...]
-    last_key = ()       # type: tuple[int, ...]
-    last_value = ()     # type: tuple[int, ...]
+    # ---> Simple escape sequences (e.g. `\\n`)
+    if char is not None:
+        try:
+            return _UNESCAPE_TABLE[char]
+        except KeyError:
+            raise JSONDecodeError("Invalid \\escape: %s" % repr(match.group(0)), None, match.start())
 
-    nesting_levels = [] # type: list[int]
+    # ---> Surrogate pairs
+    if high is not None:
+        high = int(high, 16)
+        low = int(low, 16)
 
-    result = None # type: None | dict | list
+        try:
+            return _unichr(0x10000 + ((high - 0xD800) << 10) + (low - 0xDC00))
+        except ValueError:
+            # Narrow Python builds can only store the surrogates
+            return _unichr(high) + _unichr(low)
 
-    # ---> Decode JSON object
-    if json_str.startswith("{"):
-        for index in range(len(json_str)):
-            char = json_str[index]
+    # ---> Unicode escape sequences (e.g. `\\u00e8`)
+    code = int(code, 16)
+    if code < 0x80:
+        return chr(code)
 
-            # ----> JSON strings
-            #
-            #       Note that keys MUST be strings enclosed in double quotes.
-            if char == '"' and json_str[index-1] != "\\":
-                # Parse strings only in the main level
-                if len(nesting_levels) > 1:
-                    continue
+    return _unichr(code)
 
-                is_inside_string = not is_inside_string
-                if is_inside_string:
-                    last_string = (index,)
-
-                    # ---> Strings can be both values and keys
-                    if len(last_key) < 2:
-                        last_key = (index+1,)
-                    
-                    # Leave the string quoted `"`, so that the value will be decoded as a string
-                    elif len(last_value) < 2:
-                        last_value = (index,)
-                else:
-                    if not last_string:
-                        raise Exception("Did not expect to find 'last_string' empty")
-                    
-                    # ---> Strings can be both values and keys
-                    if len(last_key) < 2:
-                        last_key += (index,)
-                    
-                    # Leave the string quoted `"`, so that the value will be decoded as a string
-                    elif len(last_value) < 2:
-                        last_value += (index+1,)
-                
-                continue
-            # endif
 
-            # Skip spaces or characters in a string
-            if char.isspace() or is_inside_string:
-                continue
+def _decode_string(string, offset=0):
+    # type: (str, int) -> str
+    """Converts the content of a JSON string (without quotes) to a Python string.
 
-                
-            # Check for characters not allowed by JSON standard (outside of strings)
-            if char == "'":
-                raise JSONDecodeError("Single quote is not permitted by JSON standard")
+    Args:
+        string (str): The raw content of the JSON string.
+        offset (int, optional): The index of `string` in the document (added to the position of errors). Defaults to 0.
 
-            # --------------------------------------------------------------
+    Raises:
+        JSONDecodeError: The string contains an invalid escape sequence.
 
+    Returns:
+        str: The unescaped string.
+    """
+    # Fast path: most strings have nothing to unescape
+    if string.find("\\") == -1:
+        return string
 
-            if char in ["{", "["]:
-                if result is not None and len(nesting_levels) == 0:
-                    raise JSONDecodeError("You are trying to redefine an existing object! Maye you forgot a comma (',')?")
-                    
-                nesting_levels.append(index)
-                continue
+    try:
+        return _REGEX_UNESCAPE.sub(_unescape_char, string)
+    except JSONDecodeError:
+        # Report the position of the escape sequence in the document
+        error = _sys.exc_info()[1]
+        error.pos = offset + error.pos
+        raise
 
-            elif char in ["}", "]"]:
-                last_bracket = nesting_levels.pop()
 
-                # Support for empty objects
-                if len(last_key) == 0 and len(nesting_levels) == 0:
-                    result = {}
-                    continue
+def _decode_scalar(json_str, truthy_value, falsy_value):
+    # type: (str, Any, Any) -> Any
+    """Converts a raw JSON value (number, boolean or null) to a Python object.
 
-                if len(last_key) != 2:
-                    raise JSONDecodeError("Malformed JSON input: Object key was not properly closed")
-                
-                key_name = json_str[last_key[0]:last_key[1]]
-
-                # Nested JSON object (will be processed when either a comma or a
-                # closing curly brace are found)
-                #
-                #  Example closing curly brace: 
-                #       ..., "object": {"nested": "value"}} 
-                #
-                #  Example comma: 
-                #       ..., "object": {"nested": "value"}, "key": true}
-                #
-                if len(nesting_levels) == 1 and len(last_value) == 0:
-                    last_value = (last_bracket, index+1)
-                    continue
+    The value is dispatched on its first character, so literals are resolved
+    with a single comparison and plain integers never go through a regex.
 
-                # If the previous was the last JSON property (not a string) in the object, add its index
-                #
-                #  Example: ..., "key": true}
-                if len(last_value) == 1:
-                    last_value += (index,)
-
-                # Initialize the result if not done already
-                if result is None:
-                    result = {}
-
-
-                # If something is still in the value buffer then add it to the object.
-                # This is the case, for example, when a non-object value is last.
-                if len(nesting_levels) == 0 and len(last_value) == 2:
-                    key_value = json_str[last_value[0]:last_value[1]]
-                    result[key_name] = loads(key_value, truthy_value, falsy_value)
-                    
-                    last_key = ()
-                    last_value = ()
-                    
-                continue
+    Args:
+        json_str (str): The raw value.
+        truthy_value (Any): The value to use for boolean `true`.
+        falsy_value (Any): The value to use for boolean `false`.
 
-            # --------------------------------------------------------------
-            
+    Raises:
+        JSONDecodeError: The value is not a valid JSON value.
 
-            # ----> Skip content of deeper levels
-            #      
-            #       The nested values will be recursively parsed 
-            #       every time their parent object closes.
-            if len(nesting_levels) > 1:
-                continue
-            
-            
-            # ----> End of key
-            elif char == ":":
-                if len(last_key) != 2:
-                    raise JSONDecodeError("Malformed JSON input: Object key cannot be empty")
-                
-                continue
-            
-            # ----> End of value
-            elif char == ",":
-                if len(last_key) != 2:
-                    raise JSONDecodeError("Comma was found but with no preceding value: %s" % str(last_key))
-                if len(last_value) == 0 or len(last_value) > 2:
-                    raise JSONDecodeError("Malformed JSON input: Object value was not properly closed")
-                
-                # Values have only the starting index when are neither strings,
-                # objects or arrays (i.e. bool, int or null).
-                if len(last_value) == 1:
-                    last_value += (index,)
-
-                # Initialize the result if not done already
-                if result is None:
-                    result = {}
-
-                
-                key_name = json_str[last_key[0]:last_key[1]]
-                value = json_str[last_value[0]:last_value[1]]
-
-                # Parse the JSON value
-                result[key_name] = loads(value, truthy_value, falsy_value)
-
-                last_key = ()
-                last_value = ()
-            # endif
+    Returns:
+        Any: The decoded value.
+    """
+    first_char = json_str[0]
 
-            # ----> Raw value (ex. integer, float, boolean, null)
-            #
-            #       Save the found index and process the value after
-            #       the comma or when the closing bracket is found.
-            else:
-                if not last_value:
-                    last_value = last_value + (index,)
-            # endif
-                
-    # ---> Decode JSON array
-    elif json_str.startswith("["):
-        for index in range(len(json_str)):
+    # ---> Boolean
+    if first_char == "t":
+        if json_str == "true":
+            if truthy_value is not None:
+                return truthy_value
+            return _TRUE
+
+    elif first_char == "f":
+        if json_str == "false":
+            if falsy_value is not None:
+                return falsy_value
+            return _FALSE
+
+    # ---> Null
+    elif first_char == "n":
+        if json_str == "null":
+            return None
+
+    # ---> Integers (fast path: digits only, with no sign but `-` and no leading zeros)
+    elif json_str.isdigit():
+        if first_char != "0" or len(json_str) == 1:
+            try:
+                return int(json_str)
+            except ValueError:
+                pass
+
+    elif first_char == "-" and json_str[1:].isdigit() and json_str[1] != "0":
+        try:
+            return int(json_str)
+        except ValueError:
+            pass
+
+    # ---> Numbers (every other form, e.g. `3.14`, `1e5`, `+1`, `.5` or `NaN`)
+    if _REGEX_INTEGER.match(json_str):
+        return int(json_str)
+
+    elif _REGEX_FLOAT.match(json_str):
+        return float(json_str)
+
+    raise JSONDecodeError("Unhandled json value: %s" % json_str)
+
+
+def _unexpected_token_error(state, object_keys, char):
+    # type: (int, list, str) -> JSONDecodeError
+    """Builds the exception for a token that is not allowed in the current state.
+
+    Args:
+        state (int): The current state of the decoder.
+        object_keys (list): The keys of the open containers (`None` for arrays).
+        char (str): The first character of the unexpected token.
+
+    Returns:
+        JSONDecodeError: The exception that should be raised.
+    """
+    if state == _EXPECT_NOTHING:
+        if char in ["{", "["]:
+            return JSONDecodeError("You are trying to redefine an existing object! Maye you forgot a comma (',')?")
+
+        return JSONDecodeError("Malformed JSON input")
+
+    if not object_keys:
+        return JSONDecodeError("Unhandled json value: %s" % char)
+
+    # ---> Arrays
+    if object_keys[-1] is None:
+        if char == ":":
+            return JSONDecodeError("Unexpected character '%s' inside array" % char)
+
+        return JSONDecodeError("Malformed JSON input: Array value was not properly closed")
+
+    # ---> Objects
+    if char == ":":
+        return JSONDecodeError("Malformed JSON input: Object key cannot be empty")
+
+    if state == _EXPECT_KEY or state == _EXPECT_KEY_OR_END:
+        if char == ",":
+            return JSONDecodeError("Comma was found but with no preceding value: %s" % str(()))
+
+        return JSONDecodeError("Malformed JSON input: Object key was not properly closed")
+
+    if state == _EXPECT_COLON:
+        return JSONDecodeError("Malformed JSON input: Object key was not properly closed")
+
+    return JSONDecodeError("Malformed JSON input: Object value was not properly closed")
+
+
+def _decode(json_str, truthy_value, falsy_value, max_depth=None, object_hook=None, object_pairs_hook=None, memo=None):
+    # type: (str, Any, Any, int|None, Callable|None, Callable|None, dict|None) -> Any
+    """Decodes a JSON document in a single pass.
+
+    The document is walked once with an index cursor. Every open object or
+    array is kept on a stack and attached to its parent only when it closes,
+    so the result is built bottom-up without ever slicing (and re-scanning)
+    nested values. The object hooks are called right when each object closes.
+
+    Args:
+        json_str (str): A JSON string.
+        truthy_value (Any): The value to use for boolean `true`.
+        falsy_value (Any): The value to use for boolean `false`.
+        max_depth (int|None, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        object_hook (Callable|None, optional): Called with every decoded object (`dict`), its result is used instead. Defaults to None.
+        object_pairs_hook (Callable|None, optional): Called with the list of `(key, value)` pairs of every object, its result is used instead. Takes precedence over `object_hook`. Defaults to None.
+        memo (dict|None, optional): Cache of the decoded keys, indexed by their raw (escaped) text. Defaults to None (a new cache for every call).
+
+    Raises:
+        JSONDecodeError: The input is not a valid JSON document (or it is nested deeper than `max_depth`).
+
+    Returns:
+        Any: A Python object corresponding to the JSON string.
+    """
+    length = len(json_str)
+
+    # With `object_pairs_hook` the members of objects are collected in a list of pairs
+    use_pairs = object_pairs_hook is not None
+
+    # Repeated keys are decoded only once and then shared by all the objects
+    if memo is None:
+        memo = {}
+
+    nesting_levels = []     # type: list[dict|list]
+    object_keys = []        # type: list[str|None]    (`None` for arrays)
+
+    state = _EXPECT_VALUE   # type: int
+    result = None           # type: Any
+
+    index = _REGEX_WHITESPACE.match(json_str, 0).end()
+
+    try:
+        while index < length:
             char = json_str[index]
 
             # ----> JSON strings
             #
             #       Note that keys MUST be strings enclosed in double quotes.
-            if char == '"' and json_str[index-1] != "\\":
-                # Parse strings only in the main level
-                if len(nesting_levels) > 1:
+            if char == '"':
+                if nesting_levels:
+                    end = _find_string_end(json_str, index + 1)
+                else:
+                    # A top level string always spans up to the last quote of the
+                    # document, so that unescaped quotes inside it are kept as-is.
+                    end = len(json_str.rstrip()) - 1
+                    if end <= index or json_str[end] != '"':
+                        end = -1
+
+                if end == -1:
+                    raise JSONDecodeError("Malformed JSON input")
+
+                if state == _EXPECT_KEY or state == _EXPECT_KEY_OR_END:
+                    raw_key = json_str[index+1:end]
+                    key = memo.get(raw_key)
+                    if key is None:
+                        key = _decode_string(raw_key, index + 1)
+                        memo[raw_key] = key
+
+                    object_keys[-1] = key
+                    state = _EXPECT_COLON
+
+                    index = end + 1
+                    if index < length and json_str[index].isspace():
+                        index = _REGEX_WHITESPACE.match(json_str, index).end()
                     continue
 
-                is_inside_string = not is_inside_string
-                if is_inside_string:
-                    # Leave the string quoted `"`, so that the value will be decoded as a string
-                    if len(last_value) < 2:
-                        last_value = (index,)
-                else:
-                    # Leave the string quoted `"`, so that the value will be decoded as a string
-                    if len(last_value) < 2:
-                        last_value += (index+1,)
-                
-                continue
-            # endif
+                if state != _EXPECT_VALUE and state != _EXPECT_VALUE_OR_END:
+                    raise _unexpected_token_error(state, object_keys, char)
 
-            # Skip spaces or characters in a string
-            if char.isspace() or is_inside_string:
-                continue
+                value = _decode_string(json_str[index+1:end], index + 1)
+                index = end + 1
 
-                
-            # Check for characters not allowed by JSON standard (outside of strings)
-            if char == "'":
-                raise JSONDecodeError("Single quote is not permitted by JSON standard")
+            # ----> Start of a JSON object or array
+            elif char == "{" or char == "[":
+                if state != _EXPECT_VALUE and state != _EXPECT_VALUE_OR_END:
+                    raise _unexpected_token_error(state, object_keys, char)
 
-            # --------------------------------------------------------------
+                if max_depth is not None and len(nesting_levels) >= max_depth:
+                    raise JSONDecodeError("Maximum nesting depth exceeded (%d)" % max_depth)
 
+                if char == "{":
+                    if use_pairs:
+                        nesting_levels.append([])
+                    else:
+                        nesting_levels.append({})
+                    object_keys.append("")
+                    state = _EXPECT_KEY_OR_END
+                else:
+                    nesting_levels.append([])
+                    object_keys.append(None)
+                    state = _EXPECT_VALUE_OR_END
 
-            # ----> JSON Object/Array
-            if char in ["{", "["]:
-                if result is not None and len(nesting_levels) == 0:
-                    raise JSONDecodeError("You are trying to redefine an existing object! Maye you forgot a comma (',')?")
-                    
-                nesting_levels.append(index)
+                index = index + 1
+                if index < length and json_str[index].isspace():
+                    index = _REGEX_WHITESPACE.match(json_str, index).end()
                 continue
 
-            elif char in ["}", "]"]:
-                last_bracket = nesting_levels.pop()
-                
-                # Nested JSON object (will be processed when either a comma or a
-                # closing curly brace are found)
-                #
-                #  Example closing curly brace: 
-                #       ..., "value", [true, null]]
-                #
-                #  Example comma: 
-                #       ..., "object": {"nested": "value"}, "key": true}
-                #
-                if len(nesting_levels) == 1 and len(last_value) == 0:
-                    last_value = (last_bracket, index+1)
-                    continue
-
-
-                # If the previous was the last JSON property (not a string) in the object, add its index
-                #
-                #  Example: ..., "key": true}
-                if len(last_value) == 1:
-                    last_value += (index,)
+            # ----> End of a JSON object or array
+            #
+            #       The container is complete, so it becomes the value that will
+            #       be added to its parent (if any).
+            elif char == "}" or char == "]":
+                if not nesting_levels:
+                    raise JSONDecodeError("Unhandled json value: %s" % char)
+
+                if object_keys[-1] is None:
+                    if char != "]":
+                        raise JSONDecodeError("Malformed JSON input")
+                    if state != _EXPECT_COMMA_OR_END and state != _EXPECT_VALUE_OR_END:
+                        raise JSONDecodeError("Malformed JSON input: Array value was not properly closed")
+                else:
+                    if char != "}":
+                        raise JSONDecodeError("Malformed JSON input")
+                    if state == _EXPECT_KEY or state == _EXPECT_COLON:
+                        raise JSONDecodeError("Malformed JSON input: Object key was not properly closed")
+                    if state == _EXPECT_VALUE:
+                        raise JSONDecodeError("Malformed JSON input: Object value was not properly closed")
+
+                value = nesting_levels.pop()
+                if object_keys.pop() is not None:
+                    if use_pairs:
+                        value = object_pairs_hook(value)
+                    elif object_hook is not None:
+                        value = object_hook(value)
+                index = index + 1
 
-                # Initialize the result if not done already
-                if result is None:
-                    result = []
+            # ----> End of key
+            elif char == ":":
+                if state != _EXPECT_COLON:
+                    raise _unexpected_token_error(state, object_keys, char)
 
-                # If something is still in the value buffer then add it to the object.
-                # This is the case, for example, when a non-object value is last.
-                if len(nesting_levels) == 0 and len(last_value) == 2:
-                    key_value = json_str[last_value[0]:last_value[1]]
-                    result.append(loads(key_value, truthy_value, falsy_value))
-                    
-                    last_value = ()
+                state = _EXPECT_VALUE
+                index = index + 1
+                if index < length and json_str[index].isspace():
+                    index = _REGEX_WHITESPACE.match(json_str, index).end()
                 continue
-            
-            
-            # --------------------------------------------------------------
-            
-
-            # ----> Skip content of deeper levels
-            #      
-            #       The nested values will be recursively parsed 
-            #       every time their parent object closes.
-            if len(nesting_levels) > 1:
-                continue
-            
-            
-            # ----> Wrong syntax
-            elif char == ":":
-                raise JSONDecodeError("Unexpected character '%s' inside array" % char)
-            
+
             # ----> End of value
             elif char == ",":
-                if len(last_value) == 0 or len(last_value) > 2:
-                    raise JSONDecodeError("Malformed JSON input: Array value was not properly closed")
-                
-                # Values have only the starting index when are neither strings,
-                # objects or arrays (i.e. bool, int or null).
-                if len(last_value) == 1:
-                    last_value += (index,)
-
-                # Initialize the result if not done already
-                if result is None:
-                    result = []
+                if state != _EXPECT_COMMA_OR_END:
+                    raise _unexpected_token_error(state, object_keys, char)
 
-                
-                value = json_str[last_value[0]:last_value[1]]
+                if object_keys[-1] is None:
+                    state = _EXPECT_VALUE
+                else:
+                    state = _EXPECT_KEY
 
-                # Parse the JSON value
-                result.append(loads(value, truthy_value, falsy_value))
+                index = index + 1
+                if index < length and json_str[index].isspace():
+                    index = _REGEX_WHITESPACE.match(json_str, index).end()
+                continue
 
-                last_value = ()
-            # endif
+            # Check for characters not allowed by JSON standard (outside of strings)
+            elif char == "'":
+                raise JSONDecodeError("Single quote is not permitted by JSON standard")
 
             # ----> Raw value (ex. integer, float, boolean, null)
-            #
-            #       Save the found index and process the value after
-            #       the comma or when the closing bracket is found.
             else:
-                if not last_value:
-                    last_value = last_value + (index,)
+                if state != _EXPECT_VALUE and state != _EXPECT_VALUE_OR_END:
+                    raise _unexpected_token_error(state, object_keys, char)
+
+                end = _REGEX_SCALAR.match(json_str, index).end()
+                value = _decode_scalar(json_str[index:end], truthy_value, falsy_value)
+                index = end
             # endif
-                
 
+            # ----> Add the value to the innermost open container
+            if nesting_levels:
+                if object_keys[-1] is None:
+                    nesting_levels[-1].append(value)
+                elif use_pairs:
+                    nesting_levels[-1].append((object_keys[-1], value))
+                else:
+                    nesting_levels[-1][object_keys[-1]] = value
 
-    # ---> Decode JSON value
-    else:
-        # https://stackoverflow.com/a/66379646/8965861
-        REGEX_FLOAT   = _re.compile(r"(?i)^\s*[+-]?(?:inf(inity)?|nan|(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)\s*$")
-        REGEX_INTEGER = _re.compile(r"^([+-]?[1-9]\d*|0)$")
-
-        # ---> String
-        #
-        #      TODO: Convert unicode strings to character and viceversa
-        if json_str.startswith('"') and json_str.endswith('"'):
-            result = str(json_str[1:-1]) \
-                .replace('\\"', '"') \
-                .replace('\\\\', '\\') \
-                .replace('\\/', '/') \
-                .replace('\\b', '\b') \
-                .replace('\\f', '\f') \
-                .replace('\\n', '\n') \
-                .replace('\\r', '\r') \
-                .replace('\\t', '\t') \
-                .replace('\\\\u', '\\u')
-        
-        # ---> Numbers
-        elif REGEX_INTEGER.match(json_str):
-            result = int(json_str)
-        
-        elif REGEX_FLOAT.match(json_str):
-            result = float(json_str)
-        
-        # ---> Boolean
-        elif json_str == "true":
-            if truthy_value is not None:
-                result = truthy_value
-            elif IS_POLYFILL_AVAILABLE:
-                return _bool.bool(1)
+                state = _EXPECT_COMMA_OR_END
             else:
-                result = __true__
-            
-        elif json_str == "false":
-            if falsy_value is not None:
-                result = falsy_value
-            elif IS_POLYFILL_AVAILABLE:
-                result = _bool.bool(0)
-            else:
-                result = __false__
-        
-        # ---> Null
-        elif json_str == "null":
-            result = None
-        
-        else:
-            raise JSONDecodeError("Unhandled json value: %s" % json_str)
-        
-    if is_inside_string or nesting_levels:
-        raise JSONDecodeError("Malformed JSON input")
+                result = value
+                state = _EXPECT_NOTHING
+
+            if index < length and json_str[index].isspace():
+                index = _REGEX_WHITESPACE.match(json_str, index).end()
+        # endwhile
+    except JSONDecodeError:
+        # The position is attached only when an error actually occurs,
+        # so decoding valid documents does not pay for it.
+        error = _sys.exc_info()[1]
+        if error.pos is None:
+            error.pos = index
+        if error.doc is None:
+            error.doc = json_str
+        raise
+
+    if state == _EXPECT_VALUE and not nesting_levels:
+        raise JSONDecodeError("Unhandled json value: %s" % json_str.strip(), json_str, index)
+
+    if state != _EXPECT_NOTHING:
+        raise JSONDecodeError("Malformed JSON input", json_str, index)
 
     return result
 
 
+def loads(
+        json_str, # type: str
+        truthy_value=None,
+        falsy_value=None,
+        max_depth=None, # type: int|None
+        object_hook=None,
+        object_pairs_hook=None,
+        memo=None,      # type: dict|None
+    ):
+    """
+    Parses a JSON string and returns the corresponding Python object.
+
+    Args:
+        json_str (str): A JSON string.
+        truthy_value (bool, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (bool, optional): The value to use for boolean `false`. Defaults to None.
+        max_depth (int, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        object_hook (Callable, optional): Called with every decoded object (`dict`), its result is used instead. Defaults to None.
+        object_pairs_hook (Callable, optional): Called with the list of `(key, value)` pairs of every object (in document order), its result is used instead. Takes precedence over `object_hook`. Defaults to None.
+        memo (dict, optional): Cache of the decoded object keys. Pass the same dictionary to several calls so that repeated keys are decoded once and shared by all the results. Defaults to None.
+
+    Raises:
+        JSONDecodeError: The input is not a valid JSON document (or it is nested deeper than `max_depth`).
+
+    Returns:
+        Any: A Python object corresponding to the JSON string.
+    """
+    if not IS_BOOLEAN_DEFINED and not IS_POLYFILL_AVAILABLE and (truthy_value is None and falsy_value is None):
+        print(
+            "Warning: No boolean values (True/False) detected and the 'truthy_value' and 'falsy_value' options are not set." +
+            " If you're using this module on Python < 2.3 set them accordingly."
+        )
+
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+
+    # Ensure that the input is a string.
+    if type(json_str) != _STRING_TYPE and type(json_str) != _UNICODE_TYPE:
+        raise TypeError('Expected a string, got %s' % type(json_str))
+
+    return _decode(json_str, truthy_value, falsy_value, max_depth, object_hook, object_pairs_hook, memo)
+
+
 def load(
         fh,
         truthy_value=None, 
-        falsy_value=None
+        falsy_value=None,
+        max_depth=None, # type: int|None
+        object_hook=None,
+        object_pairs_hook=None,
+        memo=None,      # type: dict|None
     ):
     """ Deserialize fp (a `.read()`-supporting text file or binary file containing a JSON document) to a Python object.
     
@@ -593,11 +1205,15 @@ def load(
         fh (file): A File-like object.
         truthy_value (bool, optional): The value to use for boolean `true`. Defaults to None.
         falsy_value (bool, optional): The value to use for boolean `false`. Defaults to None.
+        max_depth (int, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        object_hook (Callable, optional): Called with every decoded object (`dict`), its result is used instead. Defaults to None.
+        object_pairs_hook (Callable, optional): Called with the list of `(key, value)` pairs of every object (in document order), its result is used instead. Defaults to None.
+        memo (dict, optional): Cache of the decoded object keys, shared across calls. Defaults to None.
 
     Returns:
         Any: The deserialized Python object.
     """
-    return loads(fh.read(), truthy_value, falsy_value)
+    return loads(fh.read(), truthy_value, falsy_value, max_depth, object_hook, object_pairs_hook, memo)
     
 
 def dump(
@@ -605,12 +1221,41 @@ def dump(
         obj,
         indent=None,          # type: int|None
         truthy_value=None,
-        falsy_value=None
+        falsy_value=None,
+        max_depth=None,       # type: int|None
+        separators=None,      # type: tuple[str, str]|None
+        sort_keys=1 == 0,     # type: bool
+        ensure_ascii=1 == 1,  # type: bool
+        memo=1 == 0,          # type: bool
     ):
-    fh.write(dumps(
-        obj,
-        indent,
-        truthy_value,
-        falsy_value,
-    ))
-    
\ No newline at end of file
+    """Serializes `obj` as a JSON formatted stream to `fh`.
+
+    The document is written in fragments (see `iterencode()`), so the whole
+    string is never built in memory.
+
+    Args:
+        fh (file): A `.write()`-supporting file-like object.
+        obj (Any): The object that needs to be converted to JSON.
+        indent (int, optional): The number of spaces to use as indentation. Defaults to None.
+        truthy_value (Any, optional): The value that should be encoded as `true`. Defaults to None.
+        falsy_value (Any, optional): The value that should be encoded as `false`. Defaults to None.
+        max_depth (int, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        separators (tuple[str, str], optional): The `(item_separator, key_separator)` pair (e.g. `(",", ":")` for the most compact output). Defaults to None (`(", ", ": ")`).
+        sort_keys (bool, optional): Whether to write the members of objects sorted by key. Defaults to False.
+        ensure_ascii (bool, optional): Whether to escape non-ASCII characters (otherwise they are written as-is). Defaults to True.
+        memo (bool, optional): Whether to encode only once the objects and arrays that appear several times (the same object, not equal ones). Defaults to False.
+    """
+    for fragment in iterencode(obj, indent, truthy_value, falsy_value, max_depth, separators, sort_keys, ensure_ascii, memo):
+        fh.write(fragment)
+
+
+# Imported last, since they are built on top of the functions defined above.
+from polyfills.json.stream import IncrementalDecoder, iterparse
+from polyfills.json.lazy import lazy_loads
+from polyfills.json.jsonpath import select
+from polyfills.json.parallel import parallel_load_lines
+from polyfills.json.compiled import compile_encoder
+from polyfills.json.hashing import fingerprint
+from polyfills.json.patch import diff, apply_patch, JSONPatchError
+from polyfills.json.binary import dumps_binary, loads_binary, dump_binary, load_binary, BinaryDecodeError
+from polyfills.json.mapped import load_path
@@ -0,0 +1,652 @@
+""" Compact binary serialization of the values supported by `dumps()`.
+
+The format is a subset of [MessagePack](https://msgpack.org/): every value is
+a type code followed by its (length-prefixed) content, so it is smaller than
+JSON text and much faster to decode, since nothing has to be tokenized or
+unescaped.
+
+| Value                   | Encoding                                                       |
+| ----------------------- | -------------------------------------------------------------- |
+| `None`, booleans        | `nil`, `false`, `true`                                         |
+| Integers                | `fixint`, `int 8/16/32/64`, `uint 8/16/32/64`                  |
+| Bigger integers         | `ext 8` of type `1`, containing the decimal digits             |
+| Floats                  | `float 64`                                                     |
+| Strings                 | `fixstr`, `str 8/16/32` (UTF-8)                                |
+| Lists and tuples        | `fixarray`, `array 16/32`                                      |
+| Dictionaries            | `fixmap`, `map 16/32` (keys are converted to strings)          |
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import dumps_binary, loads_binary
+    >>> data = dumps_binary({"servers": ["server1", "server2"], "port": 9080})
+    >>> len(data)
+    34
+    >>> loads_binary(data) == {"servers": ["server1", "server2"], "port": 9080}
+    True
+    ```
+"""
+import re as _re
+import struct as _struct
+
+from polyfills.json import BaseJSONError, ENCODER_BATCH_SIZE, _check_encoder_options, _encode_key, _encode_other
+from polyfills.json import _DICT_TYPE, _LIST_TYPE, _TUPLE_TYPE, _STRING_TYPE, _UNICODE_TYPE, \
+    _INT_TYPE, _LONG_TYPE, _FLOAT_TYPE, _NONE_TYPE, _BOOL_TYPE, _TRUE, _FALSE
+
+__all__ = ["dumps_binary", "loads_binary", "dump_binary", "load_binary", "BinaryDecodeError"]
+
+READ_CHUNK_SIZE = 64 * 1024
+""" Number of bytes read at once by `load_binary()`. """
+
+_BYTES_TYPE = type("".encode("ascii"))
+_EMPTY = "".encode("ascii")
+
+# Single byte strings, indexed by their value
+if _BYTES_TYPE == _STRING_TYPE:
+    _BYTES = map(chr, range(256))
+else:
+    _BYTES = [bytes((code,)) for code in range(256)]
+
+# ---> Type codes
+_NIL = 0xc0
+_FALSE_CODE = 0xc2
+_TRUE_CODE = 0xc3
+_EXT_8 = 0xc7
+_FLOAT_64 = 0xcb
+_UINT_8, _UINT_16, _UINT_32, _UINT_64 = 0xcc, 0xcd, 0xce, 0xcf
+_INT_8, _INT_16, _INT_32, _INT_64 = 0xd0, 0xd1, 0xd2, 0xd3
+_STR_8, _STR_16, _STR_32 = 0xd9, 0xda, 0xdb
+_ARRAY_16, _ARRAY_32 = 0xdc, 0xdd
+_MAP_16, _MAP_32 = 0xde, 0xdf
+
+# Extension type of the integers that do not fit in 64 bits
+_EXT_BIG_INTEGER = 1
+
+_UINT_32_LIMIT = _LONG_TYPE(1) << 32
+_UINT_64_LIMIT = _LONG_TYPE(1) << 64
+_INT_32_MIN = -(_LONG_TYPE(1) << 31)
+_INT_64_MIN = -(_LONG_TYPE(1) << 63)
+_MASK_32 = _UINT_32_LIMIT - 1
+
+# Strings (Python 2) containing characters that are not ASCII
+_REGEX_NON_ASCII = _re.compile(r"[\x80-\xff]")
+
+# Marks the maps whose next item is a key
+_NO_KEY = []
+
+
+class BinaryDecodeError(BaseJSONError):
+    """ Thrown when the binary data is truncated or not valid. """
+
+
+# ---> Encoding
+
+def _pack_length(length, append, fix_code, fix_limit, code_8, code_16, code_32):
+    # type: (int, Callable, int, int, int|None, int, int) -> None
+    """Appends the header of a string, array or map of `length` items."""
+    if length < fix_limit:
+        append(_BYTES[fix_code | length])
+    elif code_8 is not None and length < 0x100:
+        append(_BYTES[code_8] + _BYTES[length])
+    elif length < 0x10000:
+        append(_BYTES[code_16] + _struct.pack(">H", length))
+    else:
+        append(_BYTES[code_32] + _struct.pack(">I", length))
+
+
+def _pack_bytes(data, append):
+    _pack_length(len(data), append, 0xa0, 32, _STR_8, _STR_16, _STR_32)
+    append(data)
+
+def _pack_text(obj, append):
+    _pack_bytes(obj.encode("utf-8"), append)
+
+def _pack_null(obj, append):
+    append(_BYTES[_NIL])
+
+def _pack_bool(obj, append):
+    if obj:
+        append(_BYTES[_TRUE_CODE])
+    else:
+        append(_BYTES[_FALSE_CODE])
+
+def _pack_float(obj, append):
+    append(_BYTES[_FLOAT_64] + _struct.pack(">d", obj))
+
+def _pack_other(obj, append):
+    # Objects that represent themselves as `True` or `False` (raises `TypeError` otherwise)
+    _pack_bool(_encode_other(obj) == "true", append)
+
+
+def _pack_integer(obj, append):
+    # type: (int, Callable) -> None
+    """Appends an integer using the smallest representation available."""
+    if obj >= 0:
+        if obj < 0x80:
+            append(_BYTES[obj])
+        elif obj < 0x100:
+            append(_BYTES[_UINT_8] + _BYTES[obj])
+        elif obj < 0x10000:
+            append(_BYTES[_UINT_16] + _struct.pack(">H", obj))
+        elif obj < _UINT_32_LIMIT:
+            append(_BYTES[_UINT_32] + _struct.pack(">I", obj))
+        elif obj < _UINT_64_LIMIT:
+            append(_BYTES[_UINT_64] + _struct.pack(">II", obj >> 32, obj & _MASK_32))
+        else:
+            _pack_big_integer(obj, append)
+    else:
+        if obj >= -32:
+            append(_BYTES[obj + 0x100])
+        elif obj >= -0x80:
+            append(_BYTES[_INT_8] + _struct.pack(">b", obj))
+        elif obj >= -0x8000:
+            append(_BYTES[_INT_16] + _struct.pack(">h", obj))
+        elif obj >= _INT_32_MIN:
+            append(_BYTES[_INT_32] + _struct.pack(">i", obj))
+        elif obj >= _INT_64_MIN:
+            append(_BYTES[_INT_64] + _struct.pack(">iI", obj >> 32, obj & _MASK_32))
+        else:
+            _pack_big_integer(obj, append)
+
+
+def _pack_big_integer(obj, append):
+    digits = str(obj).encode("ascii")
+    if len(digits) > 0xff:
+        raise ValueError("Integer too big to be serialized (%d digits)" % len(digits))
+
+    append(_BYTES[_EXT_8] + _BYTES[len(digits)] + _BYTES[_EXT_BIG_INTEGER] + digits)
+
+
+# ---> Encoding function of each scalar type (see `_SCALAR_ENCODERS`)
+_SCALAR_PACKERS = {
+    _UNICODE_TYPE: _pack_text,
+    _INT_TYPE: _pack_integer,
+    _LONG_TYPE: _pack_integer,
+    _FLOAT_TYPE: _pack_float,
+    _NONE_TYPE: _pack_null,
+}
+if _STRING_TYPE == _BYTES_TYPE:
+    # Python 2: byte strings are written as they are
+    _SCALAR_PACKERS[_STRING_TYPE] = _pack_bytes
+else:
+    _SCALAR_PACKERS[_STRING_TYPE] = _pack_text
+if _BOOL_TYPE != _INT_TYPE:
+    _SCALAR_PACKERS[_BOOL_TYPE] = _pack_bool
+
+
+def _pack_scalar(value, append, truthy_value, falsy_value):
+    # type: (Any, Callable, Any, Any) -> None
+    """Appends the binary representation of a value that is neither an object nor an array."""
+    # ---> Custom boolean values
+    if truthy_value is not None:
+        if value == truthy_value:
+            append(_BYTES[_TRUE_CODE])
+            return
+        elif value == falsy_value:
+            append(_BYTES[_FALSE_CODE])
+            return
+
+    _SCALAR_PACKERS.get(type(value), _pack_other)(value, append)
+
+
+def _pack(obj, append, truthy_value, falsy_value):
+    # type: (Any, Callable, Any, Any) -> None
+    """Appends the binary representation of `obj`, one fragment at a time.
+
+    Nesting is handled with an explicit stack (no recursion): the items of
+    the innermost container are written in a single loop, which is left only
+    to descend into a nested container.
+
+    Raises:
+        TypeError: The object (or one of its members) cannot be serialized.
+        ValueError: The object contains a circular reference.
+    """
+    obj_type = type(obj)
+    if obj_type != _DICT_TYPE and obj_type != _LIST_TYPE and obj_type != _TUPLE_TYPE:
+        _pack_scalar(obj, append, truthy_value, falsy_value)
+        return
+
+    # Encoded object keys (most documents repeat the same few keys)
+    keys_cache = {}
+
+    # The ids of the open containers (a container met again inside itself would be a circular reference)
+    open_ids = {id(obj): 1}
+
+    # Every open container is represented by: [values, keys (None for arrays), position, id]
+    stack = [_open_container(obj, obj_type, append)]
+
+    while stack:
+        frame = stack[-1]
+        values, keys, position, obj_id = frame
+
+        while position < len(values):
+            if keys is not None:
+                key = keys[position]
+                encoded_key = keys_cache.get(key)
+                if encoded_key is None:
+                    encoded_key = _pack_key(key)
+                    if type(key) == _STRING_TYPE or type(key) == _UNICODE_TYPE:
+                        # Other keys could be equal to each other (e.g. `1` and `True`)
+                        keys_cache[key] = encoded_key
+                append(encoded_key)
+
+            value = values[position]
+            position = position + 1
+
+            value_type = type(value)
+            if value_type == _DICT_TYPE or value_type == _LIST_TYPE or value_type == _TUPLE_TYPE:
+                value_id = id(value)
+                if open_ids.get(value_id) is not None:
+                    raise ValueError("Circular reference detected")
+
+                open_ids[value_id] = 1
+                frame[2] = position
+                stack.append(_open_container(value, value_type, append))
+                break
+
+            # ---> Small integers (the most common scalars)
+            if value_type == _INT_TYPE and value >= 0 and value < 0x80 and truthy_value is None:
+                append(_BYTES[value])
+            else:
+                _pack_scalar(value, append, truthy_value, falsy_value)
+        else:
+            stack.pop()
+            del open_ids[obj_id]
+
+
+def _open_container(obj, obj_type, append):
+    # type: (dict|list|tuple, type, Callable) -> list
+    """Appends the header of an object or array and returns its stack frame (see `_pack()`)."""
+    if obj_type == _DICT_TYPE:
+        _pack_length(len(obj), append, 0x80, 16, None, _MAP_16, _MAP_32)
+        return [list(obj.values()), list(obj.keys()), 0, id(obj)]
+
+    _pack_length(len(obj), append, 0x90, 16, None, _ARRAY_16, _ARRAY_32)
+    return [obj, None, 0, id(obj)]
+
+
+def _pack_key(key):
+    # type: (Any) -> bytes
+    """Returns the binary representation of an object key (always a string)."""
+    if type(key) != _STRING_TYPE and type(key) != _UNICODE_TYPE:
+        key = _encode_key(key)
+
+    chunks = []
+    _SCALAR_PACKERS[type(key)](key, chunks.append)
+
+    return _EMPTY.join(chunks)
+
+
+def dumps_binary(
+        obj,
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Serializes `obj` to its compact binary representation.
+
+    Args:
+        obj (Any): The object to serialize (any value supported by `dumps()`).
+        truthy_value (Any, optional): The value that should be encoded as `true`. Defaults to None.
+        falsy_value (Any, optional): The value that should be encoded as `false`. Defaults to None.
+
+    Raises:
+        TypeError: The object cannot be serialized.
+        ValueError: The object contains a circular reference.
+
+    Returns:
+        bytes: The binary data (a `str` on Python 2).
+    """
+    _check_encoder_options(truthy_value, falsy_value)
+
+    chunks = []
+    _pack(obj, chunks.append, truthy_value, falsy_value)
+
+    return _EMPTY.join(chunks)
+
+
+class _BatchWriter:
+    """Collects the fragments and writes them to a file `ENCODER_BATCH_SIZE` at a time."""
+
+    def __init__(self, fh):
+        self._fh = fh
+        self._chunks = []
+
+    def append(self, chunk):
+        self._chunks.append(chunk)
+        if len(self._chunks) >= ENCODER_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            self._fh.write(_EMPTY.join(self._chunks))
+            self._chunks = []
+
+
+def dump_binary(
+        fh,
+        obj,
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Serializes `obj` to its compact binary representation, writing it to `fh`.
+
+    The data is written in batches, so the whole representation is never
+    built in memory. Several objects can be written one after the other to
+    the same file and read back with `load_binary()`.
+
+    Args:
+        fh (file): A `.write()`-supporting file-like object, opened in binary mode.
+        obj (Any): The object to serialize (any value supported by `dumps()`).
+        truthy_value (Any, optional): The value that should be encoded as `true`. Defaults to None.
+        falsy_value (Any, optional): The value that should be encoded as `false`. Defaults to None.
+
+    Raises:
+        TypeError: The object cannot be serialized.
+        ValueError: The object contains a circular reference.
+    """
+    _check_encoder_options(truthy_value, falsy_value)
+
+    writer = _BatchWriter(fh)
+    _pack(obj, writer.append, truthy_value, falsy_value)
+    writer.flush()
+
+
+# ---> Decoding
+
+def _byte_codes(data):
+    # type: (bytes) -> Sequence[int]
+    """Returns a sequence with the value of every byte of `data`."""
+    if type(data) != _STRING_TYPE:
+        # Python 3: indexing bytes already returns integers
+        return data
+
+    try:
+        import array
+        return array.array("B", data)
+    except (ImportError, AttributeError, ValueError):
+        return map(ord, data)
+
+
+def _decode_text(data):
+    # type: (bytes) -> str
+    """Converts the UTF-8 content of a string to a Python string."""
+    if type(data) != _STRING_TYPE:
+        return data.decode("utf-8")
+
+    # Python 2: ASCII strings are returned as they are, like `loads()` does
+    if _REGEX_NON_ASCII.search(data) is None:
+        return data
+
+    return unicode(data, "utf-8") # pyright: ignore[reportUndefinedVariable]
+
+
+class _Unpacker:
+    """Decodes values from a buffer, refilling it from a file (if any) when it runs out of data."""
+
+    def __init__(self, data, fh, truthy_value, falsy_value):
+        self._data = data
+        self._codes = _byte_codes(data)
+        self._position = 0
+        self._consumed = 0      # Bytes discarded from the beginning of the buffer
+        self._fh = fh
+
+        self._true = _TRUE
+        self._false = _FALSE
+        if truthy_value is not None:
+            self._true = truthy_value
+            self._false = falsy_value
+
+    def _fill(self, size):
+        # type: (int) -> None
+        """Makes sure that the `size` bytes after the current position are in the buffer.
+
+        Raises:
+            BinaryDecodeError: The data ends before.
+        """
+        missing = self._position + size - len(self._data)
+
+        if self._fh is not None:
+            self._consumed = self._consumed + self._position
+            chunks = [self._data[self._position:]]
+            while missing > 0:
+                chunk = self._fh.read(max(missing, READ_CHUNK_SIZE))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                missing = missing - len(chunk)
+
+            self._data = _EMPTY.join(chunks)
+            self._codes = _byte_codes(self._data)
+            self._position = 0
+
+        if missing > 0:
+            raise BinaryDecodeError("Truncated data at byte %d" % (self._consumed + self._position))
+
+    def _read(self, size):
+        # type: (int) -> bytes
+        """Returns the next `size` bytes, moving past them."""
+        if self._position + size > len(self._data):
+            self._fill(size)
+
+        start = self._position
+        self._position = start + size
+
+        return self._data[start:self._position]
+
+    def _read_code(self):
+        # type: () -> int
+        """Returns the value of the next byte, moving past it."""
+        if self._position >= len(self._data):
+            self._fill(1)
+
+        code = self._codes[self._position]
+        self._position = self._position + 1
+
+        return code
+
+    def unread(self):
+        # type: () -> bytes
+        """Returns the data buffered but not decoded yet."""
+        return self._data[self._position:]
+
+    def position(self):
+        # type: () -> int
+        """Returns the number of bytes decoded so far."""
+        return self._consumed + self._position
+
+    def _read_scalar(self, code):
+        # type: (int) -> Any
+        """Decodes the value of a scalar type code (its content follows the code)."""
+        if code == _NIL:
+            return None
+        if code == _TRUE_CODE:
+            return self._true
+        if code == _FALSE_CODE:
+            return self._false
+        if code == _FLOAT_64:
+            return _struct.unpack(">d", self._read(8))[0]
+
+        if code >= 0xa0 and code <= 0xbf:
+            return _decode_text(self._read(code & 0x1f))
+        if code == _STR_8:
+            return _decode_text(self._read(self._read_code()))
+        if code == _STR_16:
+            return _decode_text(self._read(_struct.unpack(">H", self._read(2))[0]))
+        if code == _STR_32:
+            return _decode_text(self._read(_struct.unpack(">I", self._read(4))[0]))
+
+        if code >= 0xe0:
+            return code - 0x100
+        if code == _UINT_8:
+            return self._read_code()
+        if code == _UINT_16:
+            return _struct.unpack(">H", self._read(2))[0]
+        if code == _UINT_32:
+            return _struct.unpack(">I", self._read(4))[0]
+        if code == _UINT_64:
+            high, low = _struct.unpack(">II", self._read(8))
+            return (_LONG_TYPE(high) << 32) | low
+        if code == _INT_8:
+            return _struct.unpack(">b", self._read(1))[0]
+        if code == _INT_16:
+            return _struct.unpack(">h", self._read(2))[0]
+        if code == _INT_32:
+            return _struct.unpack(">i", self._read(4))[0]
+        if code == _INT_64:
+            high, low = _struct.unpack(">iI", self._read(8))
+            return (_LONG_TYPE(high) << 32) | low
+
+        if code == _EXT_8:
+            size = self._read_code()
+            if self._read_code() == _EXT_BIG_INTEGER:
+                digits = self._read(size)
+                if type(digits) != _STRING_TYPE:
+                    digits = digits.decode("ascii")
+                return _LONG_TYPE(digits)
+
+        raise BinaryDecodeError("Unsupported type code 0x%02x at byte %d" % (code, self.position() - 1))
+
+    def unpack(self):
+        # type: () -> Any
+        """Decodes the next value.
+
+        Nesting is handled with an explicit stack (no recursion).
+
+        Raises:
+            BinaryDecodeError: The data is truncated or not valid.
+
+        Returns:
+            Any: The decoded value.
+        """
+        # Every open container is represented by: [container, items left, pending key]
+        stack = []
+
+        while 1:
+            code = self._read_code()
+
+            # ---> Positive integers are the most common values
+            if code < 0x80:
+                value, size = code, 0
+
+            # ---> Containers
+            elif code <= 0x8f:
+                value, size = {}, code & 0x0f
+            elif code <= 0x9f:
+                value, size = [], code & 0x0f
+            elif code == _MAP_16:
+                value, size = {}, _struct.unpack(">H", self._read(2))[0]
+            elif code == _ARRAY_16:
+                value, size = [], _struct.unpack(">H", self._read(2))[0]
+            elif code == _MAP_32:
+                value, size = {}, _struct.unpack(">I", self._read(4))[0]
+            elif code == _ARRAY_32:
+                value, size = [], _struct.unpack(">I", self._read(4))[0]
+
+            # ---> Scalars
+            else:
+                value, size = self._read_scalar(code), 0
+
+            if size > 0:
+                stack.append([value, size, _NO_KEY])
+                continue
+
+            # ---> Add the value to the innermost container (closing the full ones)
+            while stack:
+                frame = stack[-1]
+                container = frame[0]
+
+                if type(container) == _DICT_TYPE:
+                    if frame[2] is _NO_KEY:
+                        if type(value) != _STRING_TYPE and type(value) != _UNICODE_TYPE:
+                            raise BinaryDecodeError("Object key is not a string at byte %d" % (self.position() - 1))
+                        frame[2] = value
+                        break
+
+                    container[frame[2]] = value
+                    frame[2] = _NO_KEY
+                else:
+                    container.append(value)
+
+                frame[1] = frame[1] - 1
+                if frame[1] > 0:
+                    break
+
+                stack.pop()
+                value = container
+
+            # Every container has been closed: the value is complete
+            if not stack:
+                return value
+
+
+def loads_binary(
+        data,
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Deserializes binary data produced by `dumps_binary()`.
+
+    Args:
+        data (bytes): The binary data (a `str` on Python 2).
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+
+    Raises:
+        BinaryDecodeError: The data is truncated, not valid or followed by extra data.
+
+    Returns:
+        Any: The deserialized Python object.
+    """
+    if type(data) != _BYTES_TYPE:
+        raise TypeError("Expected bytes, got %s" % type(data))
+
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+    unpacker = _Unpacker(data, None, truthy_value, falsy_value)
+    obj = unpacker.unpack()
+
+    if unpacker.position() != len(data):
+        raise BinaryDecodeError("Extra data at byte %d" % unpacker.position())
+
+    return obj
+
+
+def load_binary(
+        fh,
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Deserializes the next object written by `dump_binary()` to `fh`.
+
+    The file is read in chunks of `READ_CHUNK_SIZE` bytes and the data read
+    past the end of the object is given back by seeking backwards, so that
+    objects written one after the other can be read by calling this function
+    again. If data was read past the end of the object, the file must support
+    `.seek()`, otherwise the data would be lost.
+
+    Args:
+        fh (file): A `.read()`-supporting file-like object, opened in binary mode.
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+
+    Raises:
+        BinaryDecodeError: The data is truncated or not valid.
+        IOError: Data was read past the end of the object and the file does not support seeking back.
+
+    Returns:
+        Any: The deserialized Python object.
+    """
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+    unpacker = _Unpacker(_EMPTY, fh, truthy_value, falsy_value)
+    obj = unpacker.unpack()
+
+    unread = len(unpacker.unread())
+    if unread:
+        try:
+            fh.seek(-unread, 1)
+        except (AttributeError, IOError):
+            raise IOError("Cannot seek back the %d bytes read past the object at byte %d: the file does not support seeking" % (unread, unpacker.position()))
+
+    return obj
@@ -0,0 +1,160 @@
+""" Encoders specialized for records that always have the same keys and value types.
+
+`dumps()` has to detect the type of every value it encodes and to escape
+every key. When encoding many records with the same shape, `compile_encoder()`
+does that work only once: the key fragments are rendered in advance and each
+field is bound to the function that encodes its type.
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import compile_encoder
+    >>> encode = compile_encoder({"id": 0, "name": ""})
+    >>> encode({"id": 1, "name": "server1"})
+    '{"id": 1, "name": "server1"}'
+    >>> encode({"id": 2})   # Does not match the schema: encoded by `dumps()`
+    '{"id": 2}'
+    ```
+"""
+from polyfills.json import dumps, _check_encoder_options, _encode_key, _encode_scalar, _Encoder
+from polyfills.json import _DICT_TYPE, _LIST_TYPE, _TUPLE_TYPE, _STRING_TYPE, _UNICODE_TYPE, \
+    _INT_TYPE, _FLOAT_TYPE, _NONE_TYPE, _BOOL_TYPE
+from polyfills.json import _encode_string, _encode_null, _encode_bool
+
+__all__ = ["compile_encoder"]
+
+_TYPE_TYPE = type(_INT_TYPE)
+
+
+class _CompiledEncoder:
+    """Encodes the records matching a schema, falling back to `dumps()` for the others."""
+
+    def __init__(self, schema, truthy_value, falsy_value):
+        # type: (dict, Any, Any) -> None
+        """Renders the key fragments and chooses the encoding function of each field.
+
+        Args:
+            schema (dict): The type of each field.
+            truthy_value (Any): The value that should be encoded as `true`.
+            falsy_value (Any): The value that should be encoded as `false`.
+        """
+        self._truthy_value = truthy_value
+        self._falsy_value = falsy_value
+
+        # Every field is represented by: (key, rendered key, type, encoding function)
+        self._fields = []   # type: list[tuple[Any, str, type, Callable]]
+
+        separator = "{"
+        for key in schema.keys():
+            field_type = schema[key]
+            self._fields.append((
+                key,
+                '%s"%s": ' % (separator, _encode_key(key)),
+                field_type,
+                self._field_encoder(field_type),
+            ))
+            separator = ", "
+
+    def _field_encoder(self, field_type):
+        # type: (type) -> Callable
+        """Returns the function used to encode the values of `field_type`."""
+        if field_type == _DICT_TYPE or field_type == _LIST_TYPE or field_type == _TUPLE_TYPE:
+            return self._encode_container
+
+        # Custom booleans could be equal to any value: use the generic function
+        if self._truthy_value is not None:
+            return self._encode_scalar
+
+        if field_type == _STRING_TYPE or field_type == _UNICODE_TYPE:
+            return _encode_string
+        if field_type == _INT_TYPE or field_type == _FLOAT_TYPE:
+            return str
+        if field_type == _NONE_TYPE:
+            return _encode_null
+        if field_type == _BOOL_TYPE and _BOOL_TYPE != _INT_TYPE:
+            return _encode_bool
+
+        return self._encode_scalar
+
+    def _encode_container(self, value):
+        return "".join(_Encoder(value, None, self._truthy_value, self._falsy_value).encode())
+
+    def _encode_scalar(self, value):
+        return _encode_scalar(value, type(value), self._truthy_value, self._falsy_value)
+
+    def __call__(self, record):
+        # type: (Any) -> str
+        """Encodes a record to a compact JSON string.
+
+        Args:
+            record (Any): The record to encode.
+
+        Returns:
+            str: The JSON representation of the record.
+        """
+        if type(record) != _DICT_TYPE or len(record) != len(self._fields):
+            return dumps(record, None, self._truthy_value, self._falsy_value)
+
+        chunks = []
+        for key, rendered_key, field_type, encode in self._fields:
+            try:
+                value = record[key]
+            except KeyError:
+                return dumps(record, None, self._truthy_value, self._falsy_value)
+
+            if type(value) != field_type:
+                return dumps(record, None, self._truthy_value, self._falsy_value)
+
+            chunks.append(rendered_key)
+            chunks.append(encode(value))
+
+        if chunks:
+            chunks.append("}")
+        else:
+            chunks.append("{}")
+
+        return "".join(chunks)
+
+
+def compile_encoder(
+        sample_or_schema, # type: dict
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Builds an encoder specialized for records with the same keys and value types.
+
+    The schema can be given either as a sample record (the type of each value
+    is used) or as a dictionary mapping every key to a type:
+
+    ```pycon
+    >>> encode = compile_encoder({"id": type(0), "name": type(""), "tags": type([])})
+    ```
+
+    Records that do not match the schema (missing or extra keys, values of a
+    different type) are encoded with `dumps()`. Note that the members are
+    always written in the order of the schema.
+
+    Args:
+        sample_or_schema (dict): A sample record or the type of each key.
+        truthy_value (Any, optional): The value that should be encoded as `true`. Defaults to None.
+        falsy_value (Any, optional): The value that should be encoded as `false`. Defaults to None.
+
+    Raises:
+        TypeError: The schema is not a dictionary.
+
+    Returns:
+        Callable: A function that takes a record and returns its compact JSON representation.
+    """
+    _check_encoder_options(truthy_value, falsy_value)
+
+    if type(sample_or_schema) != _DICT_TYPE:
+        raise TypeError("Expected a dictionary, got %s" % type(sample_or_schema))
+
+    schema = {}
+    for key in sample_or_schema.keys():
+        value = sample_or_schema[key]
+        if type(value) == _TYPE_TYPE:
+            schema[key] = value
+        else:
+            schema[key] = type(value)
+
+    return _CompiledEncoder(schema, truthy_value, falsy_value)
@@ -0,0 +1,125 @@
+""" Fingerprints of JSON-serializable objects, for change detection and cache keys.
+
+The object is encoded in its canonical form (members sorted by key, no
+whitespace) and every fragment produced by the encoder is fed to the hash
+right away, so the whole string is never built in memory.
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import fingerprint
+    >>> fingerprint({"b": 1, "a": [1, 2]}) == fingerprint({"a": [1, 2], "b": 1})
+    True
+    ```
+"""
+from polyfills.json import iterencode
+
+__all__ = ["fingerprint"]
+
+DEFAULT_ALGORITHM = "sha1"
+""" Hash algorithm used by `fingerprint()` when none is specified. """
+
+_BYTES_TYPE = type("".encode("ascii"))
+
+# Name of the algorithms in `java.security.MessageDigest`
+_JAVA_ALGORITHMS = {
+    "md5": "MD5",
+    "sha1": "SHA-1",
+    "sha256": "SHA-256",
+    "sha512": "SHA-512",
+}
+
+
+class _MessageDigest:
+    """Minimal `hashlib`-like wrapper around `java.security.MessageDigest` (for Jython)."""
+
+    def __init__(self, algorithm):
+        from java.security import MessageDigest
+
+        self._digest = MessageDigest.getInstance(_JAVA_ALGORITHMS[algorithm])
+
+    def update(self, data):
+        from java.lang import String
+
+        self._digest.update(String(data).getBytes("UTF-8"))
+
+    def hexdigest(self):
+        result = []
+        for byte in self._digest.digest():
+            # Java bytes are signed
+            result.append("%02x" % (byte & 0xFF))
+
+        return "".join(result)
+
+
+def _new_hash(algorithm):
+    # type: (str) -> Any
+    """Creates a hash object using the best implementation available.
+
+    Args:
+        algorithm (str): The name of the algorithm (e.g. `md5`, `sha1`, `sha256`).
+
+    Raises:
+        ValueError: The algorithm is not available.
+
+    Returns:
+        Any: An object with the `update()` and `hexdigest()` methods.
+    """
+    # ---> Python 2.5+
+    try:
+        import hashlib
+        return hashlib.new(algorithm)
+    except ImportError:
+        pass
+
+    # ---> Older versions only have modules for MD5 and SHA-1
+    try:
+        if algorithm == "md5":
+            import md5
+            return md5.new()
+        if algorithm == "sha1":
+            import sha
+            return sha.new()
+    except ImportError:
+        pass
+
+    # ---> Jython
+    try:
+        return _MessageDigest(algorithm)
+    except (ImportError, KeyError):
+        raise ValueError("Unsupported hash algorithm '%s'" % algorithm)
+
+
+def fingerprint(
+        obj,
+        algorithm=DEFAULT_ALGORITHM,    # type: str
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Computes the hash of the canonical JSON representation of an object.
+
+    Equal objects always have the same fingerprint, regardless of the order
+    of their keys.
+
+    Args:
+        obj (Any): The object to hash.
+        algorithm (str, optional): The hash algorithm (e.g. `md5`, `sha1`, `sha256`). Defaults to `DEFAULT_ALGORITHM`.
+        truthy_value (Any, optional): The value that should be encoded as `true`. Defaults to None.
+        falsy_value (Any, optional): The value that should be encoded as `false`. Defaults to None.
+
+    Raises:
+        ValueError: The algorithm is not available.
+        TypeError: The object cannot be represented in JSON.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    digest = _new_hash(algorithm)
+
+    for fragment in iterencode(obj, None, truthy_value, falsy_value, None, (",", ":"), 1 == 1):
+        if type(fragment) != _BYTES_TYPE:
+            # Python 3: hashes work on bytes (the canonical form is always ASCII)
+            fragment = fragment.encode("ascii")
+
+        digest.update(fragment)
+
+    return digest.hexdigest()
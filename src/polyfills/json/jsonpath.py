@@ -0,0 +1,376 @@
+""" Extraction of values from a raw JSON document using a small subset of JSONPath.
+
+The document is walked once: only the members matching the path are
+descended into, every other subtree is skipped by matching brackets
+(without building any Python object), and the matched values are the only
+ones decoded.
+
+Files are instead read in chunks and tokenized by the incremental decoder
+(see `polyfills.json.stream`), so that documents that do not fit in memory
+can be searched too: only the matched values are built, but the whole
+document is validated.
+
+Supported syntax:
+
+| Syntax                 | Meaning                                        |
+| ---------------------- | ---------------------------------------------- |
+| `$`                    | The root of the document                       |
+| `.name`, `['name']`    | The `name` member of an object                 |
+| `[2]`                  | The third item of an array                     |
+| `.*`, `[*]`            | Every member of an object or item of an array  |
+| `/servers/0/name`      | A JSON Pointer (RFC 6901)                      |
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import select
+    >>> select('{"servers": [{"name": "server1"}, {"name": "server2"}]}', "$.servers[*].name")
+    ['server1', 'server2']
+    >>> select('{"servers": [{"name": "server1"}, {"name": "server2"}]}', "/servers/1/name")
+    ['server2']
+    ```
+"""
+import re as _re
+import sys as _sys
+
+from polyfills.json import JSONDecodeError, loads, _locate_error
+from polyfills.json import _STRING_TYPE, _UNICODE_TYPE
+from polyfills.json import _find_string_end, _decode_string
+from polyfills.json.lazy import _skip_value, _skip_whitespace
+from polyfills.json.stream import IncrementalDecoder, DEFAULT_CHUNK_SIZE
+
+__all__ = ["select"]
+
+# A single step of a JSONPath expression: `.name`, `.*`, `[2]`, `[*]`, `['name']` or `["name"]`
+_REGEX_PATH_STEP = _re.compile(r"""\.([^.\[\]]+)|\[(\*|\d+|'[^']*'|"[^"]*")\]""")
+
+# Matches every member of an object or item of an array
+_WILDCARD = ("*", None)
+
+
+def _parse_path(path):
+    # type: (str) -> list[tuple[str|None, int|None]]
+    """Converts a path into a list of `(key, index)` steps.
+
+    The `key` is matched against the members of objects, the `index` against
+    the items of arrays (a JSON Pointer token like `0` can match both).
+
+    Args:
+        path (str): A JSONPath expression (starting with `$`) or a JSON Pointer (starting with `/`).
+
+    Raises:
+        ValueError: The path is not valid (or uses an unsupported syntax).
+
+    Returns:
+        list: The steps of the path.
+    """
+    steps = []
+
+    # ---> JSON Pointer
+    if path == "" or path[0] == "/":
+        for token in path.split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            if token.isdigit():
+                steps.append((token, int(token)))
+            else:
+                steps.append((token, None))
+
+        return steps
+
+    # ---> JSONPath
+    if path[0] != "$":
+        raise ValueError("Invalid path '%s': it must start with '$' or '/'" % path)
+
+    position = 1
+    while position < len(path):
+        match = _REGEX_PATH_STEP.match(path, position)
+        if match is None:
+            raise ValueError("Invalid path '%s': unsupported syntax at position %d" % (path, position))
+
+        name, selector = match.group(1), match.group(2)
+        if name is None:
+            name = selector
+
+        if name == "*":
+            steps.append(_WILDCARD)
+        elif selector is None:
+            steps.append((name, None))
+        elif selector[0] == "'" or selector[0] == '"':
+            steps.append((selector[1:-1], None))
+        else:
+            steps.append((None, int(selector)))
+
+        position = match.end()
+
+    return steps
+
+
+class _Selector:
+    """Walks a JSON document collecting the values that match a list of steps."""
+
+    def __init__(self, json_str, steps, truthy_value, falsy_value):
+        self._json_str = json_str
+        self._steps = steps
+        self._truthy_value = truthy_value
+        self._falsy_value = falsy_value
+
+        self.matches = []   # type: list[Any]
+
+    def visit(self, index, depth):
+        # type: (int, int) -> int
+        """Visits the value starting at `index`, matching it against the steps from `depth`.
+
+        Args:
+            index (int): The index of the first character of the value.
+            depth (int): The number of steps already matched.
+
+        Raises:
+            JSONDecodeError: The document is not valid.
+
+        Returns:
+            int: The index of the first character AFTER the value.
+        """
+        json_str = self._json_str
+
+        # ---> The whole path matched: decode the value
+        if depth == len(self._steps):
+            end = _skip_value(json_str, index)
+            try:
+                self.matches.append(loads(json_str[index:end], self._truthy_value, self._falsy_value))
+            except JSONDecodeError:
+                # Report the position in the whole document, not in the value
+                _locate_error(_sys.exc_info()[1], json_str, index)
+                raise
+
+            return end
+
+        char = json_str[index:index+1]
+        if char == "{":
+            return self._visit_members(index + 1, depth, "}")
+        if char == "[":
+            return self._visit_members(index + 1, depth, "]")
+
+        # ---> Scalars have no members: nothing can match
+        return _skip_value(json_str, index)
+
+    def _visit_members(self, index, depth, closing):
+        # type: (int, int, str) -> int
+        """Visits the members of an object (or the items of an array), descending only in the matching ones.
+
+        Args:
+            index (int): The index of the first character after the opening bracket.
+            depth (int): The number of steps already matched.
+            closing (str): The closing bracket (`}` for objects and `]` for arrays).
+
+        Raises:
+            JSONDecodeError: The document is not valid.
+
+        Returns:
+            int: The index of the first character AFTER the closing bracket.
+        """
+        json_str = self._json_str
+        is_object = closing == "}"
+
+        step = self._steps[depth]
+        position = 0
+
+        index = _skip_whitespace(json_str, index)
+        if json_str[index:index+1] == closing:
+            return index + 1
+
+        while 1:
+            # ---> Object key
+            if is_object:
+                if json_str[index:index+1] != '"':
+                    raise JSONDecodeError("Malformed JSON input: Object key was not properly closed", json_str, index)
+
+                end = _find_string_end(json_str, index + 1)
+                if end == -1:
+                    raise JSONDecodeError("Malformed JSON input", json_str, index)
+
+                is_match = step is _WILDCARD or step[0] == _decode_string(json_str[index+1:end], index + 1)
+
+                index = _skip_whitespace(json_str, end + 1)
+                if json_str[index:index+1] != ":":
+                    raise JSONDecodeError("Malformed JSON input: Object key was not properly closed", json_str, index)
+
+                index = _skip_whitespace(json_str, index + 1)
+            else:
+                is_match = step is _WILDCARD or step[1] == position
+
+            # ---> Value
+            if is_match:
+                end = self.visit(index, depth + 1)
+            else:
+                end = _skip_value(json_str, index)
+
+            position = position + 1
+
+            index = _skip_whitespace(json_str, end)
+            char = json_str[index:index+1]
+
+            if char == ",":
+                index = _skip_whitespace(json_str, index + 1)
+            elif char == closing:
+                return index + 1
+            elif is_object:
+                raise JSONDecodeError("Malformed JSON input: Object value was not properly closed", json_str, index)
+            else:
+                raise JSONDecodeError("Malformed JSON input: Array value was not properly closed", json_str, index)
+
+
+class _EventSelector:
+    """Collects the values that match a list of steps from the `(event, value)` pairs of a document."""
+
+    def __init__(self, steps):
+        self._steps = steps
+
+        # The open containers: `[is_object, depth, position, key]` (`depth` is `None` if they cannot match)
+        self._frames = []   # type: list[list]
+
+        # The containers of the matched value being built: `[container, key]`
+        self._building = [] # type: list[list]
+
+        self.matches = []   # type: list[Any]
+
+    def feed(self, events):
+        # type: (list[tuple[str, Any]]) -> None
+        """Processes the next `(event, value)` pairs of the document."""
+        for event, value in events:
+            if self._building:
+                self._build(event, value)
+            elif event == "map_key":
+                self._frames[-1][3] = value
+            elif event == "end_map" or event == "end_array":
+                del self._frames[-1]
+                self._next_position()
+            else:
+                depth = self._match()
+                if depth == len(self._steps):
+                    self._build(event, value)
+                elif event == "start_map" or event == "start_array":
+                    self._frames.append([event == "start_map", depth, 0, None])
+                else:
+                    self._next_position()
+
+    def _match(self):
+        # type: () -> int|None
+        """Returns the number of steps matched by the value that is starting (`None` if it cannot match)."""
+        if not self._frames:
+            return 0
+
+        is_object, depth, position, key = self._frames[-1]
+        if depth is None:
+            return None
+
+        step = self._steps[depth]
+        if step is _WILDCARD or (is_object and step[0] == key) or (not is_object and step[1] == position):
+            return depth + 1
+
+        return None
+
+    def _next_position(self):
+        # type: () -> None
+        """Moves to the next item of the innermost open container."""
+        if self._frames:
+            self._frames[-1][2] = self._frames[-1][2] + 1
+
+    def _build(self, event, value):
+        # type: (str, Any) -> None
+        """Adds an event to the matched value being built."""
+        building = self._building
+
+        if event == "map_key":
+            building[-1][1] = value
+            return
+
+        if event == "start_map" or event == "start_array":
+            if event == "start_map":
+                container = {}
+            else:
+                container = []
+
+            self._attach(container)
+            building.append([container, None])
+            return
+
+        if event == "end_map" or event == "end_array":
+            del building[-1]
+        else:
+            self._attach(value)
+
+        # ---> The matched value is complete
+        if not building:
+            self._next_position()
+
+    def _attach(self, value):
+        # type: (Any) -> None
+        """Stores a value in the innermost container being built (or in the matches, if it is the matched value)."""
+        building = self._building
+
+        if not building:
+            self.matches.append(value)
+            return
+
+        container, key = building[-1]
+        if key is None:
+            container.append(value)
+        else:
+            container[key] = value
+            building[-1][1] = None
+
+
+def select(
+        text_or_fh, # type: str|file
+        path,       # type: str
+        truthy_value=None,
+        falsy_value=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+    ):
+    """Extracts the values matching `path` from a JSON document, without decoding the rest of it.
+
+    Files are read `chunk_size` characters at a time, so only a small part of
+    them is kept in memory.
+
+    Args:
+        text_or_fh (str|file): A JSON string or a `.read()`-supporting file-like object.
+        path (str): A JSONPath expression (e.g. `$.servers[*].name`) or a JSON Pointer (e.g. `/servers/0/name`).
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+        chunk_size (int, optional): The number of characters read at once from files. Defaults to `DEFAULT_CHUNK_SIZE`.
+
+    Raises:
+        ValueError: The path is not valid.
+        JSONDecodeError: The document (or one of the matched values) is not valid JSON.
+
+    Returns:
+        list: The matched values, in document order.
+    """
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+    steps = _parse_path(path)
+
+    if type(text_or_fh) != _STRING_TYPE and type(text_or_fh) != _UNICODE_TYPE:
+        selector = _EventSelector(steps)
+        decoder = IncrementalDecoder(truthy_value, falsy_value)
+
+        while 1:
+            chunk = text_or_fh.read(chunk_size)
+            if not chunk:
+                break
+
+            selector.feed(decoder.feed(chunk))
+
+        selector.feed(decoder.close())
+
+        return selector.matches
+
+    json_str = text_or_fh
+    selector = _Selector(json_str, steps, truthy_value, falsy_value)
+
+    index = _skip_whitespace(json_str, 0)
+    end = _skip_whitespace(json_str, selector.visit(index, 0))
+    if end != len(json_str):
+        raise JSONDecodeError("Malformed JSON input", json_str, end)
+
+    return selector.matches
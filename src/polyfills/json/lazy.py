@@ -0,0 +1,366 @@
+""" Lazy decoding of JSON documents: members are decoded only when accessed.
+
+`lazy_loads()` performs a single, cheap structural scan of the document that
+records where each top level member starts and ends, without building any
+Python object. The members are then decoded (and cached) the first time
+they are accessed.
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import lazy_loads
+    >>> inventory = lazy_loads('{"cell": "MyCell", "servers": [{"name": "server1"}]}')
+    >>> inventory["cell"]
+    'MyCell'
+    >>> inventory.keys()
+    ['cell', 'servers']
+    ```
+
+Note that the scan only validates the top level structure (and that the
+brackets inside the members match): any other error inside a member is
+raised when that member is accessed.
+"""
+import re as _re
+import sys as _sys
+
+from polyfills.json import JSONDecodeError, loads, _locate_error, _Iterator
+from polyfills.json import _REGEX_WHITESPACE, _REGEX_SCALAR
+from polyfills.json import _find_string_end, _decode_string
+
+try:
+    StopIteration
+except NameError:
+    # Python < 2.2: defined by `polyfills.json`
+    from polyfills.json import StopIteration
+
+__all__ = ["lazy_loads", "LazyObject", "LazyArray"]
+
+# Characters that change the nesting level (or start a string, which could contain them)
+_REGEX_STRUCTURE = _re.compile(r'["\[\]{}]')
+
+# Marks the members that have not been decoded yet
+_NOT_DECODED = []
+
+
+def _skip_whitespace(json_str, index):
+    # type: (str, int) -> int
+    """Returns the index of the first non-whitespace character from `index`."""
+    return _REGEX_WHITESPACE.match(json_str, index).end()
+
+
+def _skip_value(json_str, index):
+    # type: (str, int) -> int
+    """Finds the end of the JSON value starting at `index`, without decoding it.
+
+    Nested objects and arrays are skipped by only keeping track of the open
+    brackets, jumping directly from one bracket (or string) to the next one:
+    the brackets must match and the strings must be terminated, but the rest
+    of the content is not validated.
+
+    Args:
+        json_str (str): The JSON document.
+        index (int): The index of the first character of the value.
+
+    Raises:
+        JSONDecodeError: The end of the value could not be found.
+
+    Returns:
+        int: The index of the first character AFTER the value.
+    """
+    if index >= len(json_str):
+        raise JSONDecodeError("Malformed JSON input", json_str, index)
+
+    char = json_str[index]
+
+    # ---> Strings
+    if char == '"':
+        end = _find_string_end(json_str, index + 1)
+        if end == -1:
+            raise JSONDecodeError("Malformed JSON input", json_str, index)
+
+        return end + 1
+
+    # ---> Objects and arrays
+    if char == "{" or char == "[":
+        closing = []    # type: list[str]    (the brackets that close the open containers)
+        position = index
+
+        while 1:
+            match = _REGEX_STRUCTURE.search(json_str, position)
+            if match is None:
+                raise JSONDecodeError("Malformed JSON input", json_str, len(json_str))
+
+            char = match.group(0)
+            position = match.end()
+
+            if char == '"':
+                end = _find_string_end(json_str, position)
+                if end == -1:
+                    raise JSONDecodeError("Malformed JSON input", json_str, position - 1)
+
+                position = end + 1
+            elif char == "{":
+                closing.append("}")
+            elif char == "[":
+                closing.append("]")
+            else:
+                if char != closing[-1]:
+                    raise JSONDecodeError("Unexpected character '%s'" % char, json_str, position - 1)
+
+                del closing[-1]
+                if not closing:
+                    return position
+
+    if char == "'":
+        raise JSONDecodeError("Single quote is not permitted by JSON standard", json_str, index)
+
+    # ---> Raw values (ex. integer, float, boolean, null)
+    match = _REGEX_SCALAR.match(json_str, index)
+    if match is None:
+        raise JSONDecodeError("Unhandled json value: %s" % char, json_str, index)
+
+    return match.end()
+
+
+def _scan_members(json_str, index, closing):
+    # type: (str, int, str) -> tuple[list, list, int]
+    """Records the offsets of the members of the top level object or array.
+
+    Args:
+        json_str (str): The JSON document.
+        index (int): The index of the first character after the opening bracket.
+        closing (str): The closing bracket (`}` for objects and `]` for arrays).
+
+    Raises:
+        JSONDecodeError: The top level structure is not valid.
+
+    Returns:
+        tuple[list, list, int]: The keys (empty for arrays), the `(start, end)` offsets of each member and the index after the closing bracket.
+    """
+    is_object = closing == "}"
+
+    keys = []       # type: list[str]
+    offsets = []    # type: list[tuple[int, int]]
+
+    index = _skip_whitespace(json_str, index)
+    if json_str[index:index+1] == closing:
+        return keys, offsets, index + 1
+
+    while 1:
+        # ---> Object key
+        if is_object:
+            if json_str[index:index+1] != '"':
+                raise JSONDecodeError("Malformed JSON input: Object key was not properly closed", json_str, index)
+
+            end = _find_string_end(json_str, index + 1)
+            if end == -1:
+                raise JSONDecodeError("Malformed JSON input", json_str, index)
+
+            keys.append(_decode_string(json_str[index+1:end], index + 1))
+
+            index = _skip_whitespace(json_str, end + 1)
+            if json_str[index:index+1] != ":":
+                raise JSONDecodeError("Malformed JSON input: Object key was not properly closed", json_str, index)
+
+            index = _skip_whitespace(json_str, index + 1)
+
+        # ---> Value
+        end = _skip_value(json_str, index)
+        offsets.append((index, end))
+
+        index = _skip_whitespace(json_str, end)
+        char = json_str[index:index+1]
+
+        if char == ",":
+            index = _skip_whitespace(json_str, index + 1)
+        elif char == closing:
+            return keys, offsets, index + 1
+        elif is_object:
+            raise JSONDecodeError("Malformed JSON input: Object value was not properly closed", json_str, index)
+        else:
+            raise JSONDecodeError("Malformed JSON input: Array value was not properly closed", json_str, index)
+
+
+class _LazyContainer:
+    """Common logic of `LazyObject` and `LazyArray`."""
+
+    def __init__(self, json_str, offsets, truthy_value, falsy_value):
+        self._json_str = json_str
+        self._offsets = offsets
+        self._values = [_NOT_DECODED] * len(offsets)
+        self._truthy_value = truthy_value
+        self._falsy_value = falsy_value
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def _member(self, position):
+        # type: (int) -> Any
+        """Returns the member at `position`, decoding it on first access."""
+        value = self._values[position]
+
+        if value is _NOT_DECODED:
+            start, end = self._offsets[position]
+            try:
+                value = loads(self._json_str[start:end], self._truthy_value, self._falsy_value)
+            except JSONDecodeError:
+                # Report the position in the whole document, not in the member
+                _locate_error(_sys.exc_info()[1], self._json_str, start)
+                raise
+
+            self._values[position] = value
+
+        return value
+
+    def is_decoded(self, position):
+        # type: (int) -> bool
+        """Whether the member at `position` has already been decoded."""
+        return self._values[position] is not _NOT_DECODED
+
+
+class _KeyIterator(_Iterator):
+    """Iterator over the keys of a `LazyObject` (`iter()` is not available on Python < 2.2)."""
+
+    def __init__(self, keys):
+        self._keys = keys       # type: list[str]
+        self._position = 0      # type: int
+
+    def next(self):
+        if self._position >= len(self._keys):
+            raise StopIteration()
+
+        key = self._keys[self._position]
+        self._position = self._position + 1
+
+        return key
+
+
+class LazyObject(_LazyContainer):
+    """Read-only, dict-like view over a JSON object that decodes its members on access."""
+
+    def __init__(self, json_str, keys, offsets, truthy_value, falsy_value):
+        _LazyContainer.__init__(self, json_str, offsets, truthy_value, falsy_value)
+
+        self._keys = keys
+
+        # Position of each key (the last occurrence wins, like in `loads`)
+        self._positions = {}
+        for position in range(len(keys)):
+            self._positions[keys[position]] = position
+
+    def __repr__(self):
+        return "LazyObject(%s)" % repr(self.keys())
+
+    def __getitem__(self, key):
+        return self._member(self._positions[key])
+
+    def __contains__(self, key):
+        return self._positions.get(key) is not None
+
+    def __iter__(self):
+        return _KeyIterator(self.keys())
+
+    def has_key(self, key):
+        return self._positions.get(key) is not None
+
+    def get(self, key, default=None):
+        position = self._positions.get(key)
+        if position is None:
+            return default
+
+        return self._member(position)
+
+    def keys(self):
+        # Preserve the order of the document (skipping duplicated keys)
+        return [
+            self._keys[position]
+            for position in range(len(self._keys))
+            if self._positions[self._keys[position]] == position
+        ]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __len__(self):
+        return len(self._positions)
+
+    def to_dict(self):
+        # type: () -> dict
+        """Decodes every member and returns them as a regular dictionary."""
+        result = {}
+        for key in self.keys():
+            result[key] = self[key]
+
+        return result
+
+
+class LazyArray(_LazyContainer):
+    """Read-only, list-like view over a JSON array that decodes its items on access."""
+
+    def __repr__(self):
+        return "LazyArray(%d items)" % len(self)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index = index + len(self._offsets)
+
+        if index < 0 or index >= len(self._offsets):
+            raise IndexError("list index out of range")
+
+        return self._member(index)
+
+    def to_list(self):
+        # type: () -> list
+        """Decodes every item and returns them as a regular list."""
+        return [self._member(position) for position in range(len(self._offsets))]
+
+
+def lazy_loads(
+        json_str, # type: str
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Parses the top level structure of a JSON string, deferring the decoding of its members.
+
+    Args:
+        json_str (str): A JSON string.
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+
+    Raises:
+        JSONDecodeError: The top level structure of the document is not valid.
+
+    Returns:
+        LazyObject|LazyArray|Any: A lazy proxy for objects and arrays, the decoded value otherwise.
+    """
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+    index = _skip_whitespace(json_str, 0)
+    char = json_str[index:index+1]
+
+    # ---> Scalars are decoded right away
+    if char != "{" and char != "[":
+        return loads(json_str, truthy_value, falsy_value)
+
+    if char == "{":
+        closing = "}"
+    else:
+        closing = "]"
+
+    keys, offsets, end = _scan_members(json_str, index + 1, closing)
+
+    # Nothing but whitespace is allowed after the top level value
+    end = _skip_whitespace(json_str, end)
+    if end != len(json_str):
+        if json_str[end] == "{" or json_str[end] == "[":
+            raise JSONDecodeError("You are trying to redefine an existing object! Maye you forgot a comma (',')?", json_str, end)
+
+        raise JSONDecodeError("Malformed JSON input", json_str, end)
+
+    if char == "{":
+        return LazyObject(json_str, keys, offsets, truthy_value, falsy_value)
+
+    return LazyArray(json_str, offsets, truthy_value, falsy_value)
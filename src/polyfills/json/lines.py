@@ -0,0 +1,150 @@
+""" Reader and writer for newline-delimited JSON (also known as NDJSON or JSON Lines).
+
+Every line of the file contains a complete JSON document:
+
+```
+{"level": "INFO", "message": "Server started"}
+{"level": "WARNING", "message": "Low memory"}
+```
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import lines
+    >>> lines.dump_lines(open("log.jsonl", "w"), [{"id": 1}, {"id": 2}])
+    2
+    >>> for record in lines.iter_load(open("log.jsonl")):
+    ...     print(record["id"])
+    1
+    2
+    ```
+"""
+from polyfills.json import dumps, loads, _Iterator
+
+try:
+    StopIteration
+except NameError:
+    # Python < 2.2: defined by `polyfills.json`
+    from polyfills.json import StopIteration
+
+__all__ = ["iter_load", "dump_lines"]
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+""" Number of characters read from the file at once by `iter_load()`. """
+
+DEFAULT_BATCH_SIZE = 1000
+""" Number of records written with a single `write()` call by `dump_lines()`. """
+
+
+class _LinesIterator(_Iterator):
+    """Iterator over the records of a newline-delimited JSON file."""
+
+    def __init__(self, fh, chunk_size, truthy_value, falsy_value, memo):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._truthy_value = truthy_value
+        self._falsy_value = falsy_value
+        self._memo = memo       # type: dict[str, str]|None
+
+        self._lines = []        # type: list[str]
+        self._position = 0      # type: int
+        self._remainder = ""    # type: str    (incomplete last line of the previous chunk)
+        self._finished = 1 == 0
+
+    def next(self):
+        while 1:
+            # Skip empty lines (e.g. the one after the final newline)
+            while self._position < len(self._lines):
+                line = self._lines[self._position]
+                self._position = self._position + 1
+
+                if line.strip():
+                    return loads(line, self._truthy_value, self._falsy_value, memo=self._memo)
+
+            if self._finished:
+                raise StopIteration()
+
+            chunk = self._fh.read(self._chunk_size)
+            if chunk:
+                self._lines = (self._remainder + chunk).split("\n")
+                self._remainder = self._lines.pop()
+            else:
+                self._lines = [self._remainder]
+                self._remainder = ""
+                self._finished = 1 == 1
+
+            self._position = 0
+
+
+def iter_load(
+        fh,
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+        truthy_value=None,
+        falsy_value=None,
+        memo=None,                      # type: dict|None
+    ):
+    """Lazily iterates over the records of a newline-delimited JSON file.
+
+    The file is read in big chunks (instead of line by line) and every line
+    is decoded with `loads()`. Blank lines are ignored.
+
+    When the records repeat the same keys, pass a `memo` dictionary (e.g.
+    `memo={}`) so that every key is decoded once and the same string is
+    shared by all the records. The cache is never trimmed: avoid it when
+    the keys are unbounded (e.g. objects keyed by id).
+
+    Args:
+        fh (file): A `.read()`-supporting file-like object.
+        chunk_size (int, optional): The number of characters read at once. Defaults to `DEFAULT_CHUNK_SIZE`.
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+        memo (dict, optional): Cache of the decoded object keys, shared by all the records. Defaults to None (no sharing).
+
+    Returns:
+        iterator: An iterator over the decoded records.
+    """
+    return _LinesIterator(fh, chunk_size, truthy_value, falsy_value, memo)
+
+
+def dump_lines(
+        fh,
+        iterable,
+        batch_size=DEFAULT_BATCH_SIZE,  # type: int
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Writes every item of `iterable` as a line of JSON.
+
+    The records are encoded with `dumps()` and written `batch_size` at a time,
+    so that the number of `write()` calls stays low.
+
+    Args:
+        fh (file): A `.write()`-supporting file-like object.
+        iterable (Iterable): The records to write.
+        batch_size (int, optional): The number of records written at once. Defaults to `DEFAULT_BATCH_SIZE`.
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+
+    Returns:
+        int: The number of records written.
+    """
+    if batch_size < 1:
+        raise ValueError("The 'batch_size' option must be a positive number")
+
+    batch = []      # type: list[str]
+    count = 0       # type: int
+
+    for record in iterable:
+        batch.append(dumps(record, None, truthy_value, falsy_value))
+
+        if len(batch) == batch_size:
+            batch.append("")
+            fh.write("\n".join(batch))
+            count = count + batch_size
+            batch = []
+
+    if batch:
+        count = count + len(batch)
+        batch.append("")
+        fh.write("\n".join(batch))
+
+    return count
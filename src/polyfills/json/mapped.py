@@ -0,0 +1,150 @@
+""" Decoding of JSON files through memory-mapped buffers.
+
+`load()` reads the whole file with `fh.read()`, which copies the data from
+the OS page cache into the file buffers and again into the resulting string
+(and, on Python 3, decodes it while translating newlines). `load_path()`
+maps the file instead, and builds the document text directly from the
+mapped pages:
+
+- on **Jython** with `java.nio.channels.FileChannel.map()`, decoding the UTF-8 bytes with a `Charset`;
+- on **CPython** with the `mmap` module;
+- everywhere else (or if the file cannot be mapped, e.g. when empty) with a single buffered read.
+
+Since the pages are served by the OS page cache, running the same script
+repeatedly on the same file does not read it from disk again.
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import load_path
+    >>> config = load_path("/tmp/config.json")
+    ```
+"""
+import os as _os
+import sys as _sys
+
+from polyfills.json import loads, _STRING_TYPE, _UNICODE_TYPE
+
+__all__ = ["load_path"]
+
+IS_JYTHON = _sys.platform[:4] == "java"
+
+_BYTES_TYPE = type("".encode("ascii"))
+
+
+def _map_with_nio(path):
+    # type: (str) -> str|None
+    """Decodes the file from a buffer mapped with `FileChannel.map()` (`None` if not on Jython)."""
+    if not IS_JYTHON:
+        return None
+
+    from java.io import IOException, RandomAccessFile
+    from java.lang import IllegalArgumentException
+    from java.nio.channels import FileChannel
+    from java.nio.charset import Charset
+
+    try:
+        fh = RandomAccessFile(path, "r")
+    except IOException:
+        # Let the buffered read raise the usual `IOError`
+        return None
+
+    try:
+        try:
+            channel = fh.getChannel()
+            buffer = channel.map(FileChannel.MapMode.READ_ONLY, 0, channel.size())
+        except (IOException, IllegalArgumentException):
+            # e.g. files bigger than 2 GB (read with the buffered read instead)
+            return None
+
+        return Charset.forName("UTF-8").decode(buffer).toString()
+    finally:
+        fh.close()
+
+
+def _map_with_mmap(path):
+    # type: (str) -> str|None
+    """Decodes the file from a buffer mapped with the `mmap` module (`None` if not available)."""
+    try:
+        import mmap
+    except ImportError:
+        return None
+
+    # Opened first, so that a missing file raises the usual `IOError`
+    fh = open(path, "rb")
+    try:
+        size = _os.path.getsize(path)
+        if size == 0:
+            # Empty files cannot be mapped
+            return None
+
+        try:
+            buffer = mmap.mmap(fh.fileno(), size, access=mmap.ACCESS_READ)
+        except (TypeError, ValueError, EnvironmentError):
+            # Python < 2.2 has no `access` argument, and some files cannot be mapped
+            return None
+
+        try:
+            if _STRING_TYPE == _BYTES_TYPE:
+                # Python 2: the mapped pages must be copied to a string before decoding
+                return _UNICODE_TYPE(buffer[:], "utf-8")
+
+            # Decoded straight from the mapped pages (no intermediate `bytes` object)
+            return _UNICODE_TYPE(buffer, "utf-8")
+        finally:
+            buffer.close()
+    finally:
+        fh.close()
+
+
+def _read_buffered(path):
+    # type: (str) -> str
+    """Reads the whole file with a single buffered read."""
+    fh = open(path, "rb")
+    try:
+        data = fh.read()
+    finally:
+        fh.close()
+
+    return _UNICODE_TYPE(data, "utf-8")
+
+
+def _read_text(path):
+    # type: (str) -> str
+    """Returns the content of the file, using the best method available."""
+    for read in [_map_with_nio, _map_with_mmap]:
+        text = read(path)
+        if text is not None:
+            return text
+
+    return _read_buffered(path)
+
+
+def load_path(
+        path,               # type: str
+        truthy_value=None,
+        falsy_value=None,
+        max_depth=None,     # type: int|None
+        object_hook=None,
+        object_pairs_hook=None,
+        memo=None,          # type: dict|None
+    ):
+    """Deserializes the JSON document stored in the file at `path`, reading it through a memory-mapped buffer.
+
+    The file must be encoded in UTF-8 (or ASCII).
+
+    Args:
+        path (str): The path of the file.
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+        max_depth (int, optional): The maximum number of nested objects/arrays. Defaults to None (unlimited).
+        object_hook (Callable, optional): Called with every decoded object (`dict`), its result is used instead. Defaults to None.
+        object_pairs_hook (Callable, optional): Called with the list of `(key, value)` pairs of every object (in document order), its result is used instead. Defaults to None.
+        memo (dict, optional): Cache of the decoded object keys, shared across calls. Defaults to None.
+
+    Raises:
+        JSONDecodeError: The file does not contain a valid JSON document.
+
+    Returns:
+        Any: The deserialized Python object.
+    """
+    return loads(_read_text(path), truthy_value, falsy_value, max_depth, object_hook, object_pairs_hook, memo)
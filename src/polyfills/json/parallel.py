@@ -0,0 +1,220 @@
+""" Parallel decoding of newline-delimited JSON files.
+
+The file is split in byte ranges aligned on line boundaries and each range
+is decoded by a different worker:
+
+- on **Jython** the workers are Java threads (there is no GIL, so they run in parallel);
+- on **CPython** they are processes of a `multiprocessing` pool (when the module is available);
+- everywhere else the ranges are simply decoded one after the other.
+
+Usage:
+    ```pycon
+    >>> from polyfills.json import parallel_load_lines
+    >>> records = parallel_load_lines("export.jsonl", workers=4)
+    ```
+"""
+import os as _os
+import sys as _sys
+
+from polyfills.json import loads, _STRING_TYPE
+
+__all__ = ["parallel_load_lines"]
+
+IS_JYTHON = _sys.platform[:4] == "java"
+
+# Raises again an exception saved with `sys.exc_info()`, keeping its traceback
+#   (the two syntaxes are not compatible with each other)
+if _sys.version_info[0] >= 3:
+    def _reraise(exc_info):
+        raise exc_info[1].with_traceback(exc_info[2])
+else:
+    exec("def _reraise(exc_info):\n    raise exc_info[0], exc_info[1], exc_info[2]\n")
+
+
+def _cpu_count():
+    # type: () -> int
+    """Returns the number of available processors (1 if it cannot be determined)."""
+    if IS_JYTHON:
+        try:
+            from java.lang import Runtime
+            return Runtime.getRuntime().availableProcessors()
+        except ImportError:
+            return 1
+
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+
+def _split_ranges(path, parts):
+    # type: (str, int) -> list[tuple[int, int]]
+    """Splits a file in (at most) `parts` byte ranges, each one ending right after a newline.
+
+    Args:
+        path (str): The path of the file.
+        parts (int): The number of ranges wanted.
+
+    Returns:
+        list[tuple[int, int]]: The `(start, end)` offsets of the (non-empty) ranges.
+    """
+    size = _os.path.getsize(path)
+
+    boundaries = [0]
+    fh = open(path, "rb")
+    try:
+        for part in range(1, parts):
+            offset = divmod(size * part, parts)[0]
+            if offset <= boundaries[-1]:
+                continue
+
+            # Move to the start of the next line
+            fh.seek(offset - 1)
+            fh.readline()
+            boundaries.append(fh.tell())
+    finally:
+        fh.close()
+
+    boundaries.append(size)
+
+    ranges = []
+    for position in range(len(boundaries) - 1):
+        if boundaries[position] < boundaries[position + 1]:
+            ranges.append((boundaries[position], boundaries[position + 1]))
+
+    return ranges
+
+
+def _decode_range(arguments):
+    # type: (tuple) -> list
+    """Decodes the records of a byte range of a newline-delimited JSON file.
+
+    Args:
+        arguments (tuple): The path, the start and end offsets and the boolean values
+            (a single tuple, so that it can be used with `multiprocessing.Pool.map()`).
+
+    Returns:
+        list: The decoded records, in file order.
+    """
+    path, start, end, truthy_value, falsy_value = arguments
+
+    fh = open(path, "rb")
+    try:
+        fh.seek(start)
+        data = fh.read(end - start)
+    finally:
+        fh.close()
+
+    if type(data) != _STRING_TYPE:
+        data = data.decode("utf-8")
+
+    memo = {}
+    records = []
+    for line in data.split("\n"):
+        if line.strip():
+            records.append(loads(line, truthy_value, falsy_value, memo=memo))
+
+    return records
+
+
+def _map_with_threads(tasks):
+    # type: (list[tuple]) -> list[list]
+    """Decodes every task in a separate thread."""
+    import threading
+
+    results = [None] * len(tasks)
+    errors = []
+
+    def worker(position, results=results, errors=errors, tasks=tasks):
+        try:
+            results[position] = _decode_range(tasks[position])
+        except:
+            errors.append(_sys.exc_info())
+
+    threads = []
+    for position in range(len(tasks)):
+        thread = threading.Thread(target=worker, args=(position,))
+        thread.start()
+        threads.append(thread)
+
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        _reraise(errors[0])
+
+    return results
+
+
+def _map_with_processes(tasks):
+    # type: (list[tuple]) -> list[list]|None
+    """Decodes every task in a pool of processes (`None` if `multiprocessing` is not available)."""
+    try:
+        import multiprocessing
+    except ImportError:
+        return None
+
+    try:
+        pool = multiprocessing.Pool(len(tasks))
+    except (ImportError, OSError, NotImplementedError):
+        # e.g. hosts without working semaphores (no `/dev/shm`)
+        return None
+    try:
+        return pool.map(_decode_range, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def parallel_load_lines(
+        path,               # type: str
+        workers=None,       # type: int|None
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Decodes a newline-delimited JSON file using several workers.
+
+    Args:
+        path (str): The path of the file.
+        workers (int, optional): The number of workers. Defaults to None (the number of processors).
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+
+    Raises:
+        JSONDecodeError: One of the lines is not valid JSON.
+
+    Returns:
+        list: The decoded records, in file order.
+    """
+    if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+        raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+    if workers is None:
+        workers = _cpu_count()
+
+    if workers < 1:
+        raise ValueError("The 'workers' option must be a positive number")
+
+    tasks = []
+    for start, end in _split_ranges(path, workers):
+        tasks.append((path, start, end, truthy_value, falsy_value))
+
+    results = None
+    if len(tasks) > 1:
+        if IS_JYTHON:
+            results = _map_with_threads(tasks)
+        else:
+            results = _map_with_processes(tasks)
+
+    # ---> Fallback: decode the ranges sequentially
+    if results is None:
+        results = []
+        for task in tasks:
+            results.append(_decode_range(task))
+
+    records = []
+    for chunk in results:
+        records.extend(chunk)
+
+    return records
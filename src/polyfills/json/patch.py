@@ -0,0 +1,311 @@
+""" Structural diff of JSON documents and JSON Patch (RFC 6902) support.
+
+`diff()` compares two documents and returns the list of operations that
+transform the first one into the second, `apply_patch()` applies such a list
+of operations to a document:
+
+```pycon
+>>> from polyfills.json import diff, apply_patch
+>>> old = {"servers": [{"name": "server1", "port": 80}], "cell": "MyCell"}
+>>> new = {"servers": [{"name": "server1", "port": 443}], "cell": "MyCell"}
+>>> ops = diff(old, new)
+>>> ops
+[{'op': 'replace', 'path': '/servers/0/port', 'value': 443}]
+>>> apply_patch(old, ops) == new
+True
+```
+
+Paths are JSON Pointers (RFC 6901): `/servers/0/port` refers to the `port`
+member of the first item of the `servers` array.
+"""
+import copy as _copy
+import sys as _sys
+
+from polyfills.json import BaseJSONError
+from polyfills.json import _DICT_TYPE, _LIST_TYPE, _TUPLE_TYPE, _STRING_TYPE, _UNICODE_TYPE
+
+__all__ = ["diff", "apply_patch", "JSONPatchError"]
+
+# Marks the keys missing from an object
+_MISSING = []
+
+
+class JSONPatchError(BaseJSONError):
+    """ Thrown when a patch cannot be applied to a document. """
+
+
+def _escape_token(token):
+    # type: (Any) -> str
+    """Escapes an object key (or array index) so that it can be used in a JSON Pointer."""
+    if type(token) != _STRING_TYPE and type(token) != _UNICODE_TYPE:
+        # Array indexes (string keys are used as they are: `str()` fails on non-ASCII text on Python 2)
+        token = str(token)
+
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _parse_pointer(pointer):
+    # type: (str) -> list[str]
+    """Splits a JSON Pointer in its (unescaped) tokens.
+
+    Args:
+        pointer (str): The JSON Pointer (an empty string refers to the whole document).
+
+    Raises:
+        JSONPatchError: The pointer is not valid.
+
+    Returns:
+        list[str]: The tokens of the pointer.
+    """
+    if pointer == "":
+        return []
+
+    if pointer[0] != "/":
+        raise JSONPatchError("Invalid JSON Pointer '%s': it must start with '/'" % pointer)
+
+    tokens = []
+    for token in pointer.split("/")[1:]:
+        tokens.append(token.replace("~1", "/").replace("~0", "~"))
+
+    return tokens
+
+
+def _array_index(array, token, allow_end):
+    # type: (list, str, bool) -> int
+    """Converts a token to an index of `array`.
+
+    Args:
+        array (list): The array.
+        token (str): The token (`-` refers to the end of the array).
+        allow_end (bool): Whether the index right after the last item is valid (e.g. when adding items).
+
+    Raises:
+        JSONPatchError: The token is not a valid index.
+
+    Returns:
+        int: The index.
+    """
+    if token == "-" and allow_end:
+        return len(array)
+
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise JSONPatchError("Invalid array index '%s'" % token)
+
+    index = int(token)
+    if index > len(array) or (index == len(array) and not allow_end):
+        raise JSONPatchError("Array index '%s' out of range" % token)
+
+    return index
+
+
+def _child(container, token):
+    # type: (dict|list, str) -> Any
+    """Returns the member of `container` referenced by `token`."""
+    if type(container) == _DICT_TYPE:
+        value = container.get(token, _MISSING)
+        if value is _MISSING:
+            raise JSONPatchError("Member '%s' not found" % token)
+
+        return value
+
+    if type(container) == _LIST_TYPE:
+        return container[_array_index(container, token, 1 == 0)]
+
+    raise JSONPatchError("Cannot reference '%s' inside a value that is not an object or an array" % token)
+
+
+def _resolve(doc, pointer):
+    # type: (Any, str) -> tuple[Any, str|None]
+    """Finds the container of the value referenced by `pointer`.
+
+    Returns:
+        tuple: The container and the last token of the pointer (`(None, None)` for the whole document).
+    """
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return None, None
+
+    container = doc
+    for token in tokens[:-1]:
+        container = _child(container, token)
+
+    if type(container) != _DICT_TYPE and type(container) != _LIST_TYPE:
+        raise JSONPatchError("Path '%s' does not refer to a member of an object or an array" % pointer)
+
+    return container, tokens[-1]
+
+
+def _get(doc, pointer):
+    # type: (Any, str) -> Any
+    """Returns the value referenced by `pointer`."""
+    container, token = _resolve(doc, pointer)
+    if container is None:
+        return doc
+
+    return _child(container, token)
+
+
+def _add(doc, pointer, value):
+    # type: (Any, str, Any) -> Any
+    """Adds (or replaces, for object members) the value at `pointer` and returns the document."""
+    container, token = _resolve(doc, pointer)
+    if container is None:
+        return value
+
+    if type(container) == _DICT_TYPE:
+        container[token] = value
+    else:
+        container.insert(_array_index(container, token, 1 == 1), value)
+
+    return doc
+
+
+def _remove(doc, pointer):
+    # type: (Any, str) -> Any
+    """Removes the value at `pointer` and returns the document."""
+    container, token = _resolve(doc, pointer)
+    if container is None:
+        raise JSONPatchError("Cannot remove the whole document")
+
+    if type(container) == _DICT_TYPE:
+        _child(container, token)
+        del container[token]
+    else:
+        del container[_array_index(container, token, 1 == 0)]
+
+    return doc
+
+
+def _replace(doc, pointer, value):
+    # type: (Any, str, Any) -> Any
+    """Replaces the (existing) value at `pointer` and returns the document."""
+    container, token = _resolve(doc, pointer)
+    if container is None:
+        return value
+
+    if type(container) == _DICT_TYPE:
+        _child(container, token)
+        container[token] = value
+    else:
+        container[_array_index(container, token, 1 == 0)] = value
+
+    return doc
+
+
+def diff(a, b):
+    # type: (Any, Any) -> list[dict]
+    """Computes the operations that transform the document `a` into `b`.
+
+    The documents are compared with an explicit stack (no recursion).
+    Subtrees that are the same object are skipped without being compared,
+    and arrays whose length differs are replaced as a whole without comparing
+    their items. Tuples cannot be patched in place, so they are replaced as
+    a whole too when they are not equal.
+
+    Args:
+        a (Any): The original document.
+        b (Any): The target document.
+
+    Returns:
+        list[dict]: The JSON Patch (RFC 6902) operations (`add`, `remove` and `replace`).
+    """
+    ops = []
+
+    # Every item is made of: (original value, target value, path)
+    stack = [(a, b, "")]
+
+    while stack:
+        a, b, path = stack.pop()
+
+        if a is b:
+            continue
+
+        a_type = type(a)
+        if a_type != type(b):
+            ops.append({"op": "replace", "path": path, "value": b})
+
+        # ---> Objects
+        elif a_type == _DICT_TYPE:
+            children = []
+            for key in a.keys():
+                value = b.get(key, _MISSING)
+                if value is _MISSING:
+                    ops.append({"op": "remove", "path": path + "/" + _escape_token(key)})
+                elif value is not a[key]:
+                    children.append((a[key], value, path + "/" + _escape_token(key)))
+
+            for key in b.keys():
+                if a.get(key, _MISSING) is _MISSING:
+                    ops.append({"op": "add", "path": path + "/" + _escape_token(key), "value": b[key]})
+
+            children.reverse()
+            stack.extend(children)
+
+        # ---> Arrays (with a different length they are replaced as a whole)
+        elif a_type == _LIST_TYPE:
+            if len(a) != len(b):
+                ops.append({"op": "replace", "path": path, "value": b})
+            else:
+                index = len(a) - 1
+                while index >= 0:
+                    if a[index] is not b[index]:
+                        stack.append((a[index], b[index], "%s/%d" % (path, index)))
+                    index = index - 1
+
+        # ---> Scalars and tuples
+        elif a != b:
+            ops.append({"op": "replace", "path": path, "value": b})
+
+    return ops
+
+
+def apply_patch(doc, ops):
+    # type: (Any, list[dict]) -> Any
+    """Applies a list of JSON Patch (RFC 6902) operations to a document.
+
+    Supported operations are `add`, `remove`, `replace`, `move`, `copy` and
+    `test`. Note that the document is modified in place: make a copy first
+    if the original is still needed.
+
+    Args:
+        doc (Any): The document to patch.
+        ops (list[dict]): The operations to apply, in order.
+
+    Raises:
+        JSONPatchError: An operation is not valid or cannot be applied (e.g. a `test` fails).
+
+    Returns:
+        Any: The patched document (a different object only if the whole document was replaced).
+    """
+    for op in ops:
+        try:
+            name = op["op"]
+            path = op["path"]
+
+            if name == "add":
+                doc = _add(doc, path, op["value"])
+            elif name == "remove":
+                doc = _remove(doc, path)
+            elif name == "replace":
+                doc = _replace(doc, path, op["value"])
+            elif name == "move":
+                source = op["from"]
+                if source == path:
+                    continue
+
+                if path[:len(source) + 1] == source + "/":
+                    raise JSONPatchError("Cannot move '%s' inside itself" % source)
+
+                value = _get(doc, source)
+                doc = _add(_remove(doc, source), path, value)
+            elif name == "copy":
+                doc = _add(doc, path, _copy.deepcopy(_get(doc, op["from"])))
+            elif name == "test":
+                if _get(doc, path) != op["value"]:
+                    raise JSONPatchError("Test failed: the value at '%s' is not %s" % (path, repr(op["value"])))
+            else:
+                raise JSONPatchError("Unknown operation '%s'" % name)
+        except KeyError:
+            raise JSONPatchError("Invalid operation %s: missing '%s'" % (repr(op), _sys.exc_info()[1].args[0]))
+
+    return doc
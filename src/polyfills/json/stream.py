@@ -0,0 +1,349 @@
+""" Incremental (push) JSON decoder, used to process documents that do not fit in memory.
+
+Instead of building the whole Python object, the decoder emits a flat list of
+`(event, value)` pairs as soon as the corresponding tokens are complete:
+
+| Event         | Value                                              |
+| ------------- | -------------------------------------------------- |
+| `start_map`   | `None`                                             |
+| `map_key`     | The key (`str`)                                    |
+| `end_map`     | `None`                                             |
+| `start_array` | `None`                                             |
+| `end_array`   | `None`                                             |
+| `string`      | The string                                         |
+| `number`      | The number (`int` or `float`)                      |
+| `boolean`     | `true`/`false` (or `truthy_value`/`falsy_value`)   |
+| `null`        | `None`                                             |
+
+Usage:
+    ```pycon
+    >>> from polyfills.json.stream import IncrementalDecoder
+    >>> decoder = IncrementalDecoder()
+    >>> decoder.feed('{"key": [1, tr')
+    [('start_map', None), ('map_key', 'key'), ('start_array', None), ('number', 1)]
+    >>> decoder.feed('ue]}')
+    [('boolean', True), ('end_array', None), ('end_map', None)]
+    >>> decoder.close()
+    []
+    ```
+
+Only the characters of the token that is still incomplete are kept between
+two calls to `feed()`, so memory usage is bounded by the chunk size (and by
+the longest string in the document) instead of the size of the document.
+"""
+import sys as _sys
+
+from polyfills.json import JSONDecodeError, _Iterator, _STRING_TYPE, _UNICODE_TYPE
+from polyfills.json import _REGEX_WHITESPACE, _REGEX_SCALAR
+from polyfills.json import _EXPECT_VALUE, _EXPECT_VALUE_OR_END, _EXPECT_KEY, \
+    _EXPECT_KEY_OR_END, _EXPECT_COLON, _EXPECT_COMMA_OR_END, _EXPECT_NOTHING
+from polyfills.json import _find_string_end, _decode_string, _decode_scalar, \
+    _unexpected_token_error
+
+try:
+    StopIteration
+except NameError:
+    # Python < 2.2: defined by `polyfills.json`
+    from polyfills.json import StopIteration
+
+__all__ = ["IncrementalDecoder", "iterparse"]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+""" Number of characters read from the file at every iteration of `iterparse()`. """
+
+
+class IncrementalDecoder:
+    """Decodes a JSON document fed in chunks of arbitrary size.
+
+    The tokenizing rules (and error messages) are the same used by `loads()`.
+    Since the document is never kept as a whole, the errors report only the
+    absolute offset (`pos`) and not the line and column.
+    """
+
+    def __init__(self, truthy_value=None, falsy_value=None):
+        """Initializes the decoder.
+
+        Args:
+            truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+            falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+        """
+        if (truthy_value is None and falsy_value is not None) or (truthy_value is not None and falsy_value is None):
+            raise Exception("The 'truthy_value' and 'falsy_value' options MUST be BOTH either set or unset.")
+
+        self.truthy_value = truthy_value
+        self.falsy_value = falsy_value
+
+        self._buffer = ""           # type: str
+        self._offset = 0            # type: int    (position of the buffer in the document)
+        self._object_keys = []      # type: list[str|None]    (`None` for arrays)
+        self._state = _EXPECT_VALUE # type: int
+        self._closed = 1 == 0       # type: bool
+
+    def feed(self, chunk):
+        # type: (str) -> list[tuple[str, Any]]
+        """Decodes the next chunk of the document.
+
+        Args:
+            chunk (str): The next part of the document.
+
+        Raises:
+            JSONDecodeError: The document is not valid JSON.
+
+        Returns:
+            events (list): The `(event, value)` pairs completed by this chunk.
+        """
+        if self._closed:
+            raise ValueError("Cannot feed data to a closed decoder")
+
+        if type(chunk) != _STRING_TYPE and type(chunk) != _UNICODE_TYPE:
+            raise TypeError('Expected a string, got %s' % type(chunk))
+
+        self._buffer = self._buffer + chunk
+
+        return self._parse(1 == 0)
+
+    def close(self):
+        # type: () -> list[tuple[str, Any]]
+        """Signals the end of the document.
+
+        Raises:
+            JSONDecodeError: The document is incomplete or not valid JSON.
+
+        Returns:
+            events (list): The `(event, value)` pairs still pending (e.g. a number at the end of the document).
+        """
+        if self._closed:
+            return []
+
+        events = self._parse(1 == 1)
+        self._closed = 1 == 1
+
+        if self._state == _EXPECT_VALUE and not self._object_keys:
+            raise JSONDecodeError("Unhandled json value: ", None, self._offset)
+
+        if self._state != _EXPECT_NOTHING:
+            raise JSONDecodeError("Malformed JSON input", None, self._offset)
+
+        return events
+
+    def _parse(self, final):
+        # type: (bool) -> list[tuple[str, Any]]
+        """Consumes all the complete tokens in the buffer.
+
+        Args:
+            final (bool): Whether no more data will be fed (so tokens at the end of the buffer are complete).
+
+        Returns:
+            events (list): The `(event, value)` pairs found.
+        """
+        buffer = self._buffer
+        length = len(buffer)
+        object_keys = self._object_keys
+        state = self._state
+
+        events = []     # type: list[tuple[str, Any]]
+        index = 0
+
+        try:
+            while 1:
+                if index < length and buffer[index].isspace():
+                    index = _REGEX_WHITESPACE.match(buffer, index).end()
+
+                if index >= length:
+                    break
+
+                char = buffer[index]
+
+                # ----> JSON strings
+                if char == '"':
+                    end = _find_string_end(buffer, index + 1)
+                    if end == -1:
+                        if final:
+                            raise JSONDecodeError("Malformed JSON input")
+
+                        # Wait for the rest of the string
+                        break
+
+                    if state == _EXPECT_KEY or state == _EXPECT_KEY_OR_END:
+                        events.append(("map_key", _decode_string(buffer[index+1:end], self._offset + index + 1)))
+                        state = _EXPECT_COLON
+                        index = end + 1
+                        continue
+
+                    if state != _EXPECT_VALUE and state != _EXPECT_VALUE_OR_END:
+                        raise _unexpected_token_error(state, object_keys, char)
+
+                    events.append(("string", _decode_string(buffer[index+1:end], self._offset + index + 1)))
+                    index = end + 1
+
+                # ----> Start of a JSON object or array
+                elif char == "{" or char == "[":
+                    if state != _EXPECT_VALUE and state != _EXPECT_VALUE_OR_END:
+                        raise _unexpected_token_error(state, object_keys, char)
+
+                    if char == "{":
+                        events.append(("start_map", None))
+                        object_keys.append("")
+                        state = _EXPECT_KEY_OR_END
+                    else:
+                        events.append(("start_array", None))
+                        object_keys.append(None)
+                        state = _EXPECT_VALUE_OR_END
+
+                    index = index + 1
+                    continue
+
+                # ----> End of a JSON object or array
+                elif char == "}" or char == "]":
+                    if not object_keys:
+                        raise JSONDecodeError("Unhandled json value: %s" % char)
+
+                    if object_keys[-1] is None:
+                        if char != "]":
+                            raise JSONDecodeError("Malformed JSON input")
+                        if state != _EXPECT_COMMA_OR_END and state != _EXPECT_VALUE_OR_END:
+                            raise JSONDecodeError("Malformed JSON input: Array value was not properly closed")
+
+                        events.append(("end_array", None))
+                    else:
+                        if char != "}":
+                            raise JSONDecodeError("Malformed JSON input")
+                        if state == _EXPECT_KEY or state == _EXPECT_COLON:
+                            raise JSONDecodeError("Malformed JSON input: Object key was not properly closed")
+                        if state == _EXPECT_VALUE:
+                            raise JSONDecodeError("Malformed JSON input: Object value was not properly closed")
+
+                        events.append(("end_map", None))
+
+                    object_keys.pop()
+                    index = index + 1
+
+                # ----> End of key
+                elif char == ":":
+                    if state != _EXPECT_COLON:
+                        raise _unexpected_token_error(state, object_keys, char)
+
+                    state = _EXPECT_VALUE
+                    index = index + 1
+                    continue
+
+                # ----> End of value
+                elif char == ",":
+                    if state != _EXPECT_COMMA_OR_END:
+                        raise _unexpected_token_error(state, object_keys, char)
+
+                    if object_keys[-1] is None:
+                        state = _EXPECT_VALUE
+                    else:
+                        state = _EXPECT_KEY
+
+                    index = index + 1
+                    continue
+
+                # Check for characters not allowed by JSON standard (outside of strings)
+                elif char == "'":
+                    raise JSONDecodeError("Single quote is not permitted by JSON standard")
+
+                # ----> Raw value (ex. integer, float, boolean, null)
+                else:
+                    if state != _EXPECT_VALUE and state != _EXPECT_VALUE_OR_END:
+                        raise _unexpected_token_error(state, object_keys, char)
+
+                    end = _REGEX_SCALAR.match(buffer, index).end()
+                    if end == length and not final:
+                        # The value may continue in the next chunk (e.g. `12` + `34`)
+                        break
+
+                    token = buffer[index:end]
+                    value = _decode_scalar(token, self.truthy_value, self.falsy_value)
+
+                    if token == "null":
+                        events.append(("null", value))
+                    elif token == "true" or token == "false":
+                        events.append(("boolean", value))
+                    else:
+                        events.append(("number", value))
+
+                    index = end
+                # endif
+
+                # A value has been completed
+                if object_keys:
+                    state = _EXPECT_COMMA_OR_END
+                else:
+                    state = _EXPECT_NOTHING
+            # endwhile
+        except JSONDecodeError:
+            error = _sys.exc_info()[1]
+            if error.pos is None:
+                error.pos = self._offset + index
+            raise
+
+        # Keep only the (incomplete) token that still needs to be decoded
+        self._buffer = buffer[index:]
+        self._offset = self._offset + index
+        self._state = state
+
+        return events
+
+
+class _EventIterator(_Iterator):
+    """Iterator over the `(event, value)` pairs of a file-like object."""
+
+    def __init__(self, fh, chunk_size, truthy_value, falsy_value):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._decoder = IncrementalDecoder(truthy_value, falsy_value)
+        self._events = []     # type: list[tuple[str, Any]]
+        self._position = 0    # type: int
+        self._finished = 1 == 0
+
+    def next(self):
+        # Refill the queue of pending events, reading as many chunks as needed
+        while self._position >= len(self._events):
+            if self._finished:
+                raise StopIteration()
+
+            chunk = self._fh.read(self._chunk_size)
+            if chunk:
+                self._events = self._decoder.feed(chunk)
+            else:
+                self._events = self._decoder.close()
+                self._finished = 1 == 1
+
+            self._position = 0
+
+        event = self._events[self._position]
+        self._position = self._position + 1
+
+        return event
+
+
+def iterparse(
+        fh,
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+        truthy_value=None,
+        falsy_value=None,
+    ):
+    """Lazily iterates over the `(event, value)` pairs of a JSON document.
+
+    The file is read `chunk_size` characters at a time, so only a small part
+    of it is kept in memory.
+
+    Args:
+        fh (file): A `.read()`-supporting file-like object.
+        chunk_size (int, optional): The number of characters read at once. Defaults to `DEFAULT_CHUNK_SIZE`.
+        truthy_value (Any, optional): The value to use for boolean `true`. Defaults to None.
+        falsy_value (Any, optional): The value to use for boolean `false`. Defaults to None.
+
+    Returns:
+        iterator: An iterator over the `(event, value)` pairs.
+
+    Examples:
+        ```pycon
+        >>> for event, value in iterparse(open("inventory.json")):
+        ...     if event == "map_key" and value == "hostname":
+        ...         print("found")
+        ```
+    """
+    return _EventIterator(fh, chunk_size, truthy_value, falsy_value)
@@ -0,0 +1,191 @@
+import unittest
+
+try:
+    from StringIO import StringIO as BytesIO
+except ImportError:
+    from io import BytesIO
+
+import polyfills.json as json
+from polyfills.json.binary import dumps_binary, loads_binary, dump_binary, load_binary, BinaryDecodeError
+
+
+def _bytes(codes):
+    """ Returns the byte string made of `codes` (a `str` on Python 2) """
+    if type("".encode("ascii")) == type(""):
+        return "".join(map(chr, codes))
+
+    return bytes(codes)
+
+
+class EncodingTestCase(unittest.TestCase):
+    def test_scalars(self):
+        self.assertEqual(dumps_binary(None), _bytes([0xc0]))
+        self.assertEqual(dumps_binary(True), _bytes([0xc3]))
+        self.assertEqual(dumps_binary(False), _bytes([0xc2]))
+        self.assertEqual(dumps_binary(1.5), _bytes([0xcb, 0x3f, 0xf8, 0, 0, 0, 0, 0, 0]))
+        self.assertEqual(dumps_binary("abc"), _bytes([0xa3, 0x61, 0x62, 0x63]))
+
+    def test_integers(self):
+        self.assertEqual(dumps_binary(5), _bytes([0x05]))
+        self.assertEqual(dumps_binary(-1), _bytes([0xff]))
+        self.assertEqual(dumps_binary(200), _bytes([0xcc, 0xc8]))
+        self.assertEqual(dumps_binary(-200), _bytes([0xd1, 0xff, 0x38]))
+        self.assertEqual(dumps_binary(70000), _bytes([0xce, 0, 0x01, 0x11, 0x70]))
+        self.assertEqual(dumps_binary(2 ** 40), _bytes([0xcf, 0, 0, 0x01, 0, 0, 0, 0, 0]))
+        self.assertEqual(dumps_binary(-2 ** 40), _bytes([0xd3, 0xff, 0xff, 0xff, 0, 0, 0, 0, 0]))
+
+    def test_containers(self):
+        self.assertEqual(dumps_binary([1, [2]]), _bytes([0x92, 0x01, 0x91, 0x02]))
+        self.assertEqual(dumps_binary((1, 2)), _bytes([0x92, 0x01, 0x02]))
+        self.assertEqual(dumps_binary({"a": []}), _bytes([0x81, 0xa1, 0x61, 0x90]))
+
+    def test_non_string_keys(self):
+        self.assertEqual(loads_binary(dumps_binary({1: "a"})), {"1": "a"})
+        self.assertEqual(loads_binary(dumps_binary({None: "a"})), {"null": "a"})
+        self.assertEqual(loads_binary(dumps_binary([{1: "a"}, {1.5: "b"}, {"1": "c"}])), [{"1": "a"}, {"1.5": "b"}, {"1": "c"}])
+
+    def test_custom_booleans(self):
+        data = dumps_binary(["True", "False", "other"], truthy_value="True", falsy_value="False")
+
+        self.assertEqual(loads_binary(data), [True, False, "other"])
+        self.assertEqual(loads_binary(data, truthy_value=1, falsy_value=0), [1, 0, "other"])
+
+    def test_custom_booleans_keys(self):
+        # Keys are always strings, even when equal to the custom booleans
+        data = dumps_binary({"True": "True"}, truthy_value="True", falsy_value="False")
+
+        self.assertEqual(loads_binary(data), {"True": True})
+
+    def test_unsupported_type(self):
+        self.assertRaises(TypeError, dumps_binary, {"a": object()})
+
+    def test_circular_reference(self):
+        document = {"servers": []}
+        document["servers"].append(document)
+        self.assertRaises(ValueError, dumps_binary, document)
+
+        items = [1]
+        items.append(items)
+        self.assertRaises(ValueError, dumps_binary, items)
+        self.assertRaises(ValueError, dump_binary, BytesIO(), items)
+
+    def test_repeated_reference(self):
+        # The same object met twice (but not inside itself) is not circular
+        server = {"name": "server1"}
+        self.assertEqual(loads_binary(dumps_binary([server, [server]])), [server, [server]])
+
+
+class RoundTripTestCase(unittest.TestCase):
+    def assertRoundTrip(self, obj):
+        self.assertEqual(loads_binary(dumps_binary(obj)), obj)
+
+    def test_numbers(self):
+        for number in [0, 127, 128, 255, 256, 65535, 65536, 2 ** 32 - 1, 2 ** 32, 2 ** 64 - 1,
+                       -32, -33, -128, -129, -32768, -32769, -2 ** 31, -2 ** 31 - 1, -2 ** 63,
+                       3.14, -0.5, 1e300]:
+            self.assertRoundTrip(number)
+
+    def test_big_integers(self):
+        self.assertRoundTrip(2 ** 64)
+        self.assertRoundTrip(-2 ** 63 - 1)
+        self.assertRoundTrip(10 ** 100)
+
+    def test_strings(self):
+        self.assertRoundTrip("")
+        self.assertRoundTrip("a" * 31)
+        self.assertRoundTrip("a" * 32)
+        self.assertRoundTrip("a" * 300)
+        self.assertRoundTrip("a" * 70000)
+        self.assertRoundTrip(u"caf\u00e8 \u20ac")
+
+    def test_big_containers(self):
+        self.assertRoundTrip(list(range(16)))
+        self.assertRoundTrip(list(range(70000)))
+
+        document = {}
+        for index in range(70000):
+            document["key%d" % index] = index
+        self.assertRoundTrip(document)
+
+    def test_nested(self):
+        self.assertRoundTrip({
+            "servers": [{"name": "server1", "ports": [9080, 9443], "enabled": True}],
+            "cell": None,
+            "empty": [{}, []],
+        })
+
+    def test_deep_nesting(self):
+        # Encoded and decoded without recursion
+        document = []
+        for _ in range(10000):
+            document = [document]
+
+        self.assertEqual(json.dumps(loads_binary(dumps_binary(document))), json.dumps(document))
+
+
+class DecodingErrorsTestCase(unittest.TestCase):
+    def test_truncated(self):
+        data = dumps_binary({"servers": ["server1", "server2"]})
+
+        for end in range(len(data)):
+            self.assertRaises(BinaryDecodeError, loads_binary, data[:end])
+
+    def test_extra_data(self):
+        self.assertRaises(BinaryDecodeError, loads_binary, dumps_binary(1) + dumps_binary(2))
+
+    def test_unsupported_code(self):
+        self.assertRaises(BinaryDecodeError, loads_binary, _bytes([0xc1]))
+
+    def test_key_not_string(self):
+        self.assertRaises(BinaryDecodeError, loads_binary, _bytes([0x81, 0x01, 0x02]))
+
+    def test_not_bytes(self):
+        self.assertRaises(TypeError, loads_binary, 5)
+
+
+class FileTestCase(unittest.TestCase):
+    def test_dump_load(self):
+        document = []
+        for index in range(5000):
+            document.append({"id": index, "name": "server%d" % index})
+
+        fh = BytesIO()
+        dump_binary(fh, document)
+        self.assertEqual(fh.getvalue(), dumps_binary(document))
+
+        fh.seek(0)
+        self.assertEqual(load_binary(fh), document)
+
+    def test_consecutive_objects(self):
+        fh = BytesIO()
+        dump_binary(fh, {"run": 1})
+        dump_binary(fh, ["a" * 100000])
+        dump_binary(fh, None)
+
+        fh.seek(0)
+        self.assertEqual(load_binary(fh), {"run": 1})
+        self.assertEqual(load_binary(fh), ["a" * 100000])
+        self.assertEqual(load_binary(fh), None)
+        self.assertRaises(BinaryDecodeError, load_binary, fh)
+
+    def test_not_seekable(self):
+        class Stream:
+            def __init__(self, data):
+                self.fh = BytesIO(data)
+
+            def read(self, size=-1):
+                return self.fh.read(size)
+
+        # Nothing is read past a single object
+        self.assertEqual(load_binary(Stream(dumps_binary({"run": 1}))), {"run": 1})
+
+        # The data of the next object cannot be given back
+        self.assertRaises(IOError, load_binary, Stream(dumps_binary({"run": 1}) + dumps_binary(2)))
+
+    def test_exported(self):
+        self.assertEqual(json.dumps_binary, dumps_binary)
+        self.assertEqual(json.load_binary, load_binary)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,61 @@
+import unittest
+
+import polyfills.json as json
+from polyfills.json.compiled import compile_encoder
+
+IS_BOOLEAN_DEFINED = str(1==1) == 'True'
+
+
+class CompileEncoderTestCase(unittest.TestCase):
+    def test_sample(self):
+        encode = compile_encoder({"name": "", "tags": [], "parent": None, "weight": 1.5})
+        record = {"name": 'server "1"', "tags": ["a", {"b": None}], "parent": None, "weight": 2.0}
+
+        self.assertEqual(json.loads(encode(record)), record)
+
+    def test_same_output_as_dumps(self):
+        encode = compile_encoder({"id": 0})
+
+        for record in [{"id": 1}, {"id": -25}, {"id": "1"}, {"other": 1}, {}, [1], "id"]:
+            self.assertEqual(encode(record), json.dumps(record))
+
+    def test_schema(self):
+        encode = compile_encoder({"name": type(""), "ports": type([])})
+
+        self.assertEqual(json.loads(encode({"name": "a", "ports": [80]})), {"name": "a", "ports": [80]})
+        self.assertEqual(encode({"name": "a"}), '{"name": "a"}')
+
+    def test_mismatching_records(self):
+        encode = compile_encoder({"id": 0, "name": ""})
+
+        for record in [{"id": 1}, {"id": 1, "name": 2}, {"id": 1, "name": "a", "extra": None}, {"id": 1, "other": "a"}]:
+            self.assertEqual(json.loads(encode(record)), record)
+
+    def test_booleans(self):
+        if IS_BOOLEAN_DEFINED:
+            encode = compile_encoder({"enabled": 1 == 1})
+            self.assertEqual(encode({"enabled": 1 == 0}), '{"enabled": false}')
+
+            # Integers are not booleans
+            self.assertEqual(encode({"enabled": 1}), '{"enabled": 1}')
+
+        encode = compile_encoder({"enabled": 0}, truthy_value=1, falsy_value=0)
+        self.assertEqual(encode({"enabled": 1}), '{"enabled": true}')
+        self.assertEqual(encode({"enabled": 2}), '{"enabled": 2}')
+
+    def test_escaped_keys(self):
+        encode = compile_encoder({'a"b': 0})
+        self.assertEqual(encode({'a"b': 1}), '{"a\\"b": 1}')
+
+    def test_empty(self):
+        self.assertEqual(compile_encoder({})({}), "{}")
+
+    def test_invalid_schema(self):
+        self.assertRaises(TypeError, compile_encoder, [1, 2])
+
+    def test_exported(self):
+        self.assertEqual(json.compile_encoder, compile_encoder)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
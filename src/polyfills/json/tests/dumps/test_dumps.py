@@ -1,6 +1,12 @@
 import unittest
 
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 import polyfills.json as json
+from polyfills.collections import OrderedDict
 
 IS_BOOLEAN_DEFINED = str(1==1) == 'True'
 IS_POLYFILL_AVAILABLE = 0 == 1
@@ -182,6 +188,25 @@ class ObjectTestCase(unittest.TestCase):
             "Newlines should be escaped"
         )
 
+    def test_escape_control_characters(self):
+        self.assertEqual(
+            json.dumps("\x00\x1f\b\f\r\t"),
+            '"\\u0000\\u001f\\b\\f\\r\\t"',
+            "Control characters should be escaped"
+        )
+
+    def test_escape_unicode(self):
+        self.assertEqual(
+            json.dumps(u"\u1eb7 \u00a3"),
+            '"\\u1eb7 \\u00a3"',
+            "Non-ASCII characters should be converted to their \\uXXXX representation"
+        )
+        self.assertEqual(
+            json.dumps({u"\u00e8": u"\u00e8"}),
+            '{"\\u00e8": "\\u00e8"}',
+            "Non-ASCII characters should be escaped in keys too"
+        )
+
     def test_complex(self):
         if str(1==1) == 'True':
             __true__ = 1==1
@@ -209,5 +234,168 @@ class ObjectTestCase(unittest.TestCase):
         assert '"null": null' in dump
 
 
+class OrderedDictTestCase(unittest.TestCase):
+    def test_order(self):
+        document = OrderedDict([("b", 1), ("a", OrderedDict([("d", [1]), ("c", {})]))])
+
+        self.assertEqual(json.dumps(document), '{"b": 1, "a": {"d": [1], "c": {}}}')
+        self.assertEqual(json.dumps(document, sort_keys=1 == 1), '{"a": {"c": {}, "d": [1]}, "b": 1}')
+        self.assertEqual(json.dumps(OrderedDict()), '{}')
+
+    def test_round_trip(self):
+        text = '{"z": [{"y": null, "x": 2}], "a": "last"}'
+
+        self.assertEqual(json.dumps(json.loads(text, object_pairs_hook=OrderedDict)), text)
+
+
+class NestingTestCase(unittest.TestCase):
+    def test_deeply_nested(self):
+        value = 1
+        for _ in range(100):
+            value = [value]
+
+        self.assertEqual(json.dumps(value), "[" * 100 + "1" + "]" * 100)
+
+    def test_beyond_recursion_limit(self):
+        value = []
+        for _ in range(100000):
+            value = [value]
+
+        self.assertEqual(json.dumps(value), "[" * 100001 + "]" * 100001)
+
+    def test_max_depth(self):
+        self.assertEqual(json.dumps({"a": [1]}, max_depth=2), '{"a": [1]}')
+        self.assertEqual(json.dumps(1, max_depth=0), '1')
+        self.assertRaises(ValueError, json.dumps, {"a": [[1]]}, max_depth=2)
+        self.assertRaises(ValueError, json.dumps, {"a": [[]]}, max_depth=2)
+
+    def test_siblings_after_nested(self):
+        self.assertEqual(
+            json.dumps([{"a": [1, [2, []]]}, {}, ("b", {"c": None})]),
+            '[{"a": [1, [2, []]]}, {}, ["b", {"c": null}]]',
+        )
+
+
+class ScalarTypesTestCase(unittest.TestCase):
+    def test_polyfill_bool(self):
+        from polyfills.stdlib.future_types.bool import bool as polyfill_bool
+
+        self.assertEqual(json.dumps([polyfill_bool(1), polyfill_bool(0)]), "[true, false]")
+
+    def test_numbers_are_not_booleans(self):
+        self.assertEqual(json.dumps([1, 0, 1.0, 0.0]), "[1, 0, 1.0, 0.0]")
+
+    def test_string_true(self):
+        self.assertEqual(json.dumps(["True", u"False"]), '["True", "False"]')
+
+    def test_large_integer(self):
+        try:
+            value = eval("2 ** 70")
+        except OverflowError:
+            # Python < 2.2 does not promote integers to long automatically
+            value = eval("2L ** 70")
+
+        self.assertEqual(json.dumps(value), "1180591620717411303424")
+
+    def test_custom_booleans(self):
+        self.assertEqual(json.dumps([1, 0, 2], truthy_value=1, falsy_value=0), "[true, false, 2]")
+
+
+class OptionsTestCase(unittest.TestCase):
+    def test_separators(self):
+        self.assertEqual(json.dumps({"a": [1, 2, {"b": None}]}, separators=(",", ":")), '{"a":[1,2,{"b":null}]}')
+        self.assertEqual(json.dumps([1, 2], separators=(" ; ", "=")), "[1 ; 2]")
+
+    def test_separators_with_indent(self):
+        self.assertEqual(json.dumps({"a": [1, 2]}, indent=2, separators=(",", ": ")), '{\n  "a": [\n    1,\n    2\n  ]\n}')
+
+    def test_sort_keys(self):
+        self.assertEqual(
+            json.dumps({"c": 1, "a": {"z": 1, "b": 2}, "b": [{"y": 1, "x": 2}]}, sort_keys=1 == 1),
+            '{"a": {"b": 2, "z": 1}, "b": [{"x": 2, "y": 1}], "c": 1}',
+        )
+
+    def test_ensure_ascii(self):
+        value = u"caf\u00e9 \U0001f600 \"\n"
+
+        self.assertEqual(json.dumps(value), '"caf\\u00e9 \\ud83d\\ude00 \\"\\n"')
+        self.assertEqual(json.dumps(value, ensure_ascii=1 == 0), u'"caf\u00e9 \U0001f600 \\"\\n"')
+        self.assertEqual(json.dumps({value: 1}, ensure_ascii=1 == 0), u'{"caf\u00e9 \U0001f600 \\"\\n": 1}')
+
+    def test_iterencode_and_dump(self):
+        fh = StringIO()
+        json.dump(fh, {"b": 1, "a": 2}, separators=(",", ":"), sort_keys=1 == 1)
+
+        self.assertEqual(fh.getvalue(), '{"a":2,"b":1}')
+        self.assertEqual("".join(json.iterencode({"b": 1, "a": 2}, sort_keys=1 == 1)), '{"a": 2, "b": 1}')
+
+
+class CircularReferenceTestCase(unittest.TestCase):
+    def test_self_reference(self):
+        document = {"name": "cell"}
+        document["self"] = document
+
+        self.assertRaises(ValueError, json.dumps, document)
+
+    def test_indirect_reference(self):
+        servers = []
+        document = {"servers": servers}
+        servers.append({"cell": document})
+
+        self.assertRaises(ValueError, json.dumps, document)
+        self.assertRaises(ValueError, json.dumps, document, memo=1 == 1)
+
+    def test_shared_is_not_circular(self):
+        # The same object in different branches is not a cycle
+        shared = {"port": 9080}
+
+        self.assertEqual(json.dumps([shared, [shared]]), '[{"port": 9080}, [{"port": 9080}]]')
+
+
+class MemoTestCase(unittest.TestCase):
+    def setUp(self):
+        template = {"enabled": 1, "ports": [9080, 9443]}
+
+        self.document = {"servers": []}
+        for index in range(200):
+            self.document["servers"].append({"name": "server%d" % index, "settings": template, "tags": (template, template)})
+
+    def test_same_output(self):
+        for indent in [None, 2]:
+            self.assertEqual(
+                json.dumps(self.document, indent=indent, memo=1 == 1),
+                json.dumps(self.document, indent=indent),
+            )
+
+    def test_different_depths(self):
+        # With indentation the text of the same object depends on its depth
+        shared = [1, 2]
+        document = [shared, [shared], [[shared]], shared]
+
+        self.assertEqual(json.dumps(document, indent=4, memo=1 == 1), json.dumps(document, indent=4))
+
+    def test_iterencode(self):
+        # Containers split across fragments are not memoized, but the output does not change
+        self.assertEqual(
+            "".join(json.iterencode(self.document, memo=1 == 1)),
+            json.dumps(self.document),
+        )
+
+    def test_dump(self):
+        fh = StringIO()
+        json.dump(fh, self.document, memo=1 == 1)
+
+        self.assertEqual(fh.getvalue(), json.dumps(self.document))
+
+
+class UnsupportedTypeTestCase(unittest.TestCase):
+    def test_unsupported_type(self):
+        class Unsupported:
+            pass
+
+        self.assertRaises(TypeError, json.dumps, Unsupported())
+        self.assertRaises(TypeError, json.dumps, {"key": [Unsupported()]})
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
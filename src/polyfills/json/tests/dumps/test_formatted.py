@@ -13,7 +13,22 @@ class ParametersTestCase(unittest.TestCase):
             json.dumps([ 1, 2, 3 ], indent=4),
             '[\n    1, \n    2, \n    3\n]',
         )
-        
+
+
+class NestedTestCase(unittest.TestCase):
+    def test_nested(self):
+        self.assertEqual(
+            json.dumps([{"servers": [{"ports": [80, 443]}]}, [], "end"], indent=2),
+            '[\n  {\n    "servers": [\n      {\n        "ports": [\n          80, \n          443\n        ]\n      }\n    ]\n  }, \n  [\n  ], \n  "end"\n]',
+        )
+
+    def test_line_separators_in_strings(self):
+        """ Characters treated as line boundaries by `splitlines()` must not break the line """
+        self.assertEqual(
+            json.dumps(["a\x0bb\x1cc"], indent=2),
+            '[\n  "a\\u000bb\\u001cc"\n]',
+        )
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
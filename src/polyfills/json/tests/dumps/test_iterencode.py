@@ -0,0 +1,81 @@
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import polyfills.json as json
+
+DOCUMENT = [{"servers": [{"name": "first", "ports": [80, 443]}, {"name": "second", "ports": []}]}, None, 3.5, "end", {}]
+
+
+class _WriteCounter:
+    """ File-like object that keeps track of the `write()` calls. """
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+
+class IterencodeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.batch_size = json.ENCODER_BATCH_SIZE
+
+    def tearDown(self):
+        json.ENCODER_BATCH_SIZE = self.batch_size
+
+    def test_same_as_dumps(self):
+        for batch_size in [1, 2, 3, 5, 1024]:
+            json.ENCODER_BATCH_SIZE = batch_size
+
+            for indent in [None, 2]:
+                fragments = []
+                for fragment in json.iterencode(DOCUMENT, indent=indent):
+                    fragments.append(fragment)
+
+                self.assertEqual("".join(fragments), json.dumps(DOCUMENT, indent=indent))
+
+    def test_fragments(self):
+        json.ENCODER_BATCH_SIZE = 4
+
+        fragments = []
+        for fragment in json.iterencode(["a", "b", "c", "d", "e"]):
+            fragments.append(fragment)
+
+        self.assertEqual(fragments, ['["a", "b", ', '"c", "d", ', '"e"]'])
+
+    def test_scalar(self):
+        fragments = []
+        for fragment in json.iterencode("value"):
+            fragments.append(fragment)
+
+        self.assertEqual(fragments, ['"value"'])
+
+
+class DumpTestCase(unittest.TestCase):
+    def setUp(self):
+        self.batch_size = json.ENCODER_BATCH_SIZE
+
+    def tearDown(self):
+        json.ENCODER_BATCH_SIZE = self.batch_size
+
+    def test_dump(self):
+        fh = StringIO()
+        json.dump(fh, DOCUMENT, indent=4)
+
+        self.assertEqual(fh.getvalue(), json.dumps(DOCUMENT, indent=4))
+
+    def test_bounded_writes(self):
+        json.ENCODER_BATCH_SIZE = 8
+
+        fh = _WriteCounter()
+        json.dump(fh, list(range(100)))
+
+        self.assertEqual("".join(fh.writes), json.dumps(list(range(100))))
+        self.assertTrue(len(fh.writes) > 1, "The document should be written in more than one batch")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
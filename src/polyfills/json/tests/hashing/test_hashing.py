@@ -0,0 +1,40 @@
+import unittest
+
+import polyfills.json as json
+from polyfills.json.hashing import fingerprint
+
+
+class FingerprintTestCase(unittest.TestCase):
+    def test_known_digest(self):
+        # sha1('{"a":[1,2],"b":null}')
+        self.assertEqual(fingerprint({"b": None, "a": [1, 2]}), "3eac5d79856738525574eb4ffcadd0d08e44f470")
+
+    def test_key_order(self):
+        first = {"name": "server1", "ports": [80, 443], "nested": {"x": 1, "y": 2}}
+        second = {"nested": {"y": 2, "x": 1}, "ports": [80, 443], "name": "server1"}
+
+        self.assertEqual(fingerprint(first), fingerprint(second))
+
+    def test_changes(self):
+        self.assertNotEqual(fingerprint({"ports": [80, 443]}), fingerprint({"ports": [443, 80]}))
+        self.assertNotEqual(fingerprint({"a": 1}), fingerprint({"a": "1"}))
+
+    def test_algorithms(self):
+        self.assertEqual(fingerprint([], "md5"), "d751713988987e9331980363e24189ce")
+        self.assertEqual(len(fingerprint([], "sha1")), 40)
+        self.assertRaises(ValueError, fingerprint, [], "unknown")
+
+    def test_large_document(self):
+        # Encoded (and hashed) in several fragments
+        document = []
+        for index in range(5000):
+            document.append({"id": index})
+
+        self.assertEqual(fingerprint(document), fingerprint(json.loads(json.dumps(document))))
+
+    def test_exported(self):
+        self.assertEqual(json.fingerprint, fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
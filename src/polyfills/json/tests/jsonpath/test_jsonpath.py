@@ -0,0 +1,86 @@
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import polyfills.json as json
+from polyfills.json.jsonpath import select
+
+DOCUMENT = '{"cell": "MyCell", "servers": [{"name": "server1", "ports": [80, 443]}, {"name": "server2", "ports": []}], "a/b": {"c~d": null}}'
+
+
+class SelectTestCase(unittest.TestCase):
+    def test_members(self):
+        self.assertEqual(select(DOCUMENT, "$.cell"), ["MyCell"])
+        self.assertEqual(select(DOCUMENT, "$['cell']"), ["MyCell"])
+        self.assertEqual(select(DOCUMENT, '$["servers"][1].name'), ["server2"])
+        self.assertEqual(select(DOCUMENT, "$.servers[0].ports[1]"), [443])
+
+    def test_wildcards(self):
+        self.assertEqual(select(DOCUMENT, "$.servers[*].name"), ["server1", "server2"])
+        self.assertEqual(select(DOCUMENT, "$.servers[*].ports[*]"), [80, 443])
+        self.assertEqual(select('{"a": 1, "b": [2]}', "$.*"), [1, [2]])
+
+    def test_root(self):
+        self.assertEqual(select("[1, 2]", "$"), [[1, 2]])
+        self.assertEqual(select("[1, 2]", ""), [[1, 2]])
+
+    def test_no_match(self):
+        self.assertEqual(select(DOCUMENT, "$.missing"), [])
+        self.assertEqual(select(DOCUMENT, "$.servers[5]"), [])
+        self.assertEqual(select(DOCUMENT, "$.cell.name"), [])
+
+    def test_pointer(self):
+        self.assertEqual(select(DOCUMENT, "/servers/1/name"), ["server2"])
+        self.assertEqual(select(DOCUMENT, "/a~1b/c~0d"), [None])
+        self.assertEqual(select('{"0": "key"}', "/0"), ["key"])
+
+    def test_file(self):
+        self.assertEqual(select(StringIO(DOCUMENT), "$.servers[*].name"), ["server1", "server2"])
+
+    def test_file_chunks(self):
+        for path in ["$", "$.cell", "$.*", "$.servers[1]", "$.servers[*].ports[*]", "/a~1b/c~0d", "$.missing"]:
+            self.assertEqual(select(StringIO(DOCUMENT), path, chunk_size=3), select(DOCUMENT, path))
+
+    def test_file_is_not_read_whole(self):
+        sizes = []
+
+        class File:
+            def __init__(self, text):
+                self.fh = StringIO(text)
+
+            def read(self, size=-1):
+                sizes.append(size)
+                return self.fh.read(size)
+
+        self.assertEqual(select(File(DOCUMENT), "$.cell", chunk_size=16), ["MyCell"])
+        self.assertEqual([size for size in sizes if size != 16], [])
+
+    def test_skipped_subtrees_are_not_decoded(self):
+        # The invalid member is skipped without being decoded
+        self.assertEqual(select('{"bad": [1 2], "good": true}', "$.good"), [1 == 1])
+        self.assertRaises(json.JSONDecodeError, select, '{"bad": [1 2], "good": true}', "$.bad")
+
+    def test_invalid_document(self):
+        self.assertRaises(json.JSONDecodeError, select, '{"a": 1', "$.a")
+        self.assertRaises(json.JSONDecodeError, select, '{"a": 1 "b": 2}', "$.b")
+        self.assertRaises(json.JSONDecodeError, select, '{"a": 1} {}', "$.a")
+
+    def test_invalid_skipped_subtree(self):
+        for document in ['{"a": [1}, "b": 2}', '{"a": {"c": [}]}, "b": 2}', '{"a": ["x], "b": 2}']:
+            self.assertRaises(json.JSONDecodeError, select, document, "$.b")
+            self.assertRaises(json.JSONDecodeError, select, StringIO(document), "$.b")
+
+    def test_invalid_path(self):
+        self.assertRaises(ValueError, select, DOCUMENT, "servers")
+        self.assertRaises(ValueError, select, DOCUMENT, "$.servers[-1]")
+        self.assertRaises(ValueError, select, DOCUMENT, "$..name")
+
+    def test_exported(self):
+        self.assertEqual(json.select, select)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
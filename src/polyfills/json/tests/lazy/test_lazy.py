@@ -0,0 +1,107 @@
+import sys
+import unittest
+
+import polyfills.json as json
+from polyfills.json.lazy import lazy_loads, LazyObject, LazyArray
+
+DOCUMENT = '{"cell": "MyCell", "servers": [{"name": "server1", "ports": [80, 443]}, {"name": "server\\"2\\""}], "nodes": {"node1": {}}, "count": 2}'
+
+
+class LazyObjectTestCase(unittest.TestCase):
+    def test_members(self):
+        document = lazy_loads(DOCUMENT)
+
+        self.assertTrue(isinstance(document, LazyObject))
+        self.assertEqual(len(document), 4)
+        self.assertEqual(document.keys(), ["cell", "servers", "nodes", "count"])
+        self.assertEqual(document["cell"], "MyCell")
+        self.assertEqual(document["servers"][1]["name"], 'server"2"')
+        self.assertEqual(document["nodes"], {"node1": {}})
+        self.assertEqual(document.get("missing", "default"), "default")
+        self.assertEqual(document.to_dict(), json.loads(DOCUMENT))
+
+    def test_iteration(self):
+        document = lazy_loads(DOCUMENT)
+
+        keys = []
+        for key in document:
+            keys.append(key)
+
+        self.assertEqual(keys, ["cell", "servers", "nodes", "count"])
+        self.assertEqual(document.is_decoded(1), 1 == 0)
+
+    def test_decoded_on_access(self):
+        document = lazy_loads(DOCUMENT)
+
+        self.assertEqual(document.is_decoded(1), 1 == 0)
+        servers = document["servers"]
+        self.assertEqual(document.is_decoded(1), 1 == 1)
+
+        # The decoded value is cached
+        self.assertTrue(document["servers"] is servers)
+
+    def test_invalid_member_raises_on_access(self):
+        document = lazy_loads('{"good": [1, 2], "bad": [1 2]}')
+
+        self.assertEqual(document["good"], [1, 2])
+        self.assertRaises(json.JSONDecodeError, lambda: document["bad"])
+
+    def test_error_position(self):
+        document = lazy_loads('{"good": [1, 2],\n "bad": [1 2]}')
+
+        try:
+            document["bad"]
+        except json.JSONDecodeError:
+            error = sys.exc_info()[1]
+        else:
+            self.fail("No error raised")
+
+        self.assertEqual((error.pos, error.lineno, error.colno), (28, 2, 12))
+
+    def test_missing_key(self):
+        self.assertRaises(KeyError, lambda: lazy_loads(DOCUMENT)["missing"])
+
+    def test_exported(self):
+        self.assertEqual(json.lazy_loads, lazy_loads)
+
+
+class LazyArrayTestCase(unittest.TestCase):
+    def test_items(self):
+        document = lazy_loads('[1, "two", [3, {"four": 4}], null, true]')
+
+        self.assertTrue(isinstance(document, LazyArray))
+        self.assertEqual(len(document), 5)
+        self.assertEqual(document[1], "two")
+        self.assertEqual(document[-3], [3, {"four": 4}])
+        self.assertEqual(document.to_list(), [1, "two", [3, {"four": 4}], None, 1 == 1])
+        self.assertRaises(IndexError, lambda: document[5])
+
+    def test_iteration(self):
+        items = []
+        for item in lazy_loads("[1, 2, 3]"):
+            items.append(item)
+
+        self.assertEqual(items, [1, 2, 3])
+
+    def test_empty(self):
+        self.assertEqual(len(lazy_loads("[]")), 0)
+        self.assertEqual(len(lazy_loads(" { } ")), 0)
+
+
+class LazyLoadsTestCase(unittest.TestCase):
+    def test_scalar(self):
+        self.assertEqual(lazy_loads(' "value" '), "value")
+        self.assertEqual(lazy_loads("12"), 12)
+
+    def test_invalid_structure(self):
+        self.assertRaises(json.JSONDecodeError, lazy_loads, '{"key" 1}')
+        self.assertRaises(json.JSONDecodeError, lazy_loads, '{"key": 1')
+        self.assertRaises(json.JSONDecodeError, lazy_loads, '{"key": 1 "other": 2}')
+        self.assertRaises(json.JSONDecodeError, lazy_loads, '{"key": [1, 2}')
+        self.assertRaises(json.JSONDecodeError, lazy_loads, '[1, 2')
+        self.assertRaises(json.JSONDecodeError, lazy_loads, '[1, 2] [3]')
+        self.assertRaises(json.JSONDecodeError, lazy_loads, "['key']")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from polyfills.json import lines
+
+
+class _WriteCounter:
+    """ File-like object that keeps track of the number of `write()` calls. """
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+
+class IterLoadTestCase(unittest.TestCase):
+    def test_records(self):
+        fh = StringIO('{"id": 1}\n{"id": 2, "tags": ["a", "b"]}\n[3]\n')
+        records = []
+        for record in lines.iter_load(fh):
+            records.append(record)
+
+        self.assertEqual(records, [{"id": 1}, {"id": 2, "tags": ["a", "b"]}, [3]])
+
+    def test_small_chunks(self):
+        """ Lines split across chunks must be decoded correctly """
+        text = '{"id": 1}\n\n{"id": 22}\r\n{"id": 333}'
+        for chunk_size in range(1, len(text) + 1):
+            records = []
+            for record in lines.iter_load(StringIO(text), chunk_size=chunk_size):
+                records.append(record)
+
+            self.assertEqual(records, [{"id": 1}, {"id": 22}, {"id": 333}])
+
+    def test_shared_keys(self):
+        records = []
+        memo = {}
+        for record in lines.iter_load(StringIO('{"hostname": "a"}\n{"hostname": "b"}\n'), memo=memo):
+            records.append(record)
+
+        self.assertTrue(list(records[0].keys())[0] is list(records[1].keys())[0])
+        self.assertEqual(len(memo), 1)
+
+    def test_no_memo(self):
+        records = []
+        for record in lines.iter_load(StringIO('{"id1": 1}\n{"id2": 2}\n')):
+            records.append(record)
+
+        self.assertEqual(records, [{"id1": 1}, {"id2": 2}])
+
+    def test_empty(self):
+        records = []
+        for record in lines.iter_load(StringIO("")):
+            records.append(record)
+
+        self.assertEqual(records, [])
+
+
+class DumpLinesTestCase(unittest.TestCase):
+    def test_output(self):
+        fh = StringIO()
+        count = lines.dump_lines(fh, [{"id": 1}, ["a", None], "text"])
+
+        self.assertEqual(count, 3)
+        self.assertEqual(fh.getvalue(), '{"id": 1}\n["a", null]\n"text"\n')
+
+    def test_batches(self):
+        fh = _WriteCounter()
+        count = lines.dump_lines(fh, range(10), batch_size=4)
+
+        self.assertEqual(count, 10)
+        self.assertEqual(fh.writes, ["0\n1\n2\n3\n", "4\n5\n6\n7\n", "8\n9\n"])
+
+    def test_round_trip(self):
+        records = [{"id": i, "name": "record %d" % i} for i in range(25)]
+
+        fh = StringIO()
+        lines.dump_lines(fh, records, batch_size=7)
+        fh.seek(0)
+
+        decoded = []
+        for record in lines.iter_load(fh, chunk_size=16):
+            decoded.append(record)
+
+        self.assertEqual(decoded, records)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,6 +1,13 @@
+import sys
 import unittest
 
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 import polyfills.json as json
+from polyfills.collections import OrderedDict
 
 IS_BOOLEAN_DEFINED = str(1==1) == 'True'
 IS_POLYFILL_AVAILABLE = 0 == 1
@@ -33,6 +40,29 @@ class BaseTestCase(unittest.TestCase):
             "Strings should work (with double quotes inside)"
 		)
         
+    def test_string_escapes(self):
+        self.assertEqual(
+            json.loads(r'"\" \\ \/ \b \f \n \r \t"'),
+            "\" \\ / \b \f \n \r \t",
+            "All the escape sequences should be converted"
+        )
+        self.assertEqual(
+            json.loads(r'"\\n"'),
+            "\\n",
+            "Escaped backslashes should not start a new escape sequence"
+        )
+        self.assertRaises(json.JSONDecodeError, json.loads, r'"\x"')
+
+    def test_string_unicode(self):
+        self.assertEqual(
+            json.loads(r'"\u1eb7 \u00a3 \u0041"'),
+            u"\u1eb7 \u00a3 A",
+        )
+        self.assertEqual(
+            json.loads(r'{"\u00e8": "\u00e8"}'),
+            {u"\u00e8": u"\u00e8"},
+        )
+
     def test_null(self):
         self.assertEqual(
 			json.loads('null'),
@@ -143,6 +173,130 @@ class ObjectTestCase(unittest.TestCase):
         	{"string": "value","dict": {"nested_key": "nested_value","test": True}, "last": 1}
 		)
     
+class NestingTestCase(unittest.TestCase):
+    def test_deeply_nested(self):
+        expected = 1
+        for _ in range(100):
+            expected = [expected]
+
+        self.assertEqual(json.loads("[" * 100 + "1" + "]" * 100), expected)
+
+    def test_siblings_after_nested(self):
+        self.assertEqual(
+            json.loads('{"a": {"b": {"c": [1, [2, [3]]]}}, "d": [{}, []], "e": "end"}'),
+            {"a": {"b": {"c": [1, [2, [3]]]}}, "d": [{}, []], "e": "end"}
+        )
+
+    def test_beyond_recursion_limit(self):
+        value = json.loads("[" * 100000 + "]" * 100000)
+        for _ in range(99999):
+            value = value[0]
+
+        self.assertEqual(value, [])
+
+    def test_max_depth(self):
+        self.assertEqual(json.loads('{"a": [1]}', max_depth=2), {"a": [1]})
+        self.assertEqual(json.loads('1', max_depth=0), 1)
+        self.assertRaises(json.JSONDecodeError, json.loads, '{"a": [[1]]}', max_depth=2)
+        self.assertRaises(json.JSONDecodeError, json.loads, "[" * 100000 + "]" * 100000, max_depth=1000)
+
+    def test_escaped_backslash_before_quote(self):
+        self.assertEqual(
+            json.loads(r"""["a\\", "b"]"""),
+            ["a\\", "b"]
+        )
+
+class HooksTestCase(unittest.TestCase):
+    def test_object_pairs_hook(self):
+        document = '{"z": 1, "a": {"y": [{"x": 2, "b": 3}], "c": {}}, "m": null}'
+
+        self.assertEqual(
+            json.loads(document, object_pairs_hook=list),
+            [("z", 1), ("a", [("y", [[("x", 2), ("b", 3)]]), ("c", [])]), ("m", None)],
+        )
+
+    def test_ordered_dict(self):
+        result = json.loads('{"z": 1, "a": {"y": 2, "b": 3}}', object_pairs_hook=OrderedDict)
+
+        self.assertTrue(isinstance(result, OrderedDict))
+        self.assertEqual(result.keys(), ["z", "a"])
+        self.assertTrue(isinstance(result["a"], OrderedDict))
+        self.assertEqual(result["a"].keys(), ["y", "b"])
+
+    def test_object_hook(self):
+        calls = []
+
+        def hook(obj, calls=calls):
+            calls.append(obj)
+            return len(obj)
+
+        self.assertEqual(json.loads('[{"a": {"b": 1}}, {}]', object_hook=hook), [1, 0])
+        self.assertEqual(calls, [{"b": 1}, {"a": 1}, {}])
+
+    def test_pairs_hook_takes_precedence(self):
+        self.assertEqual(
+            json.loads('{"a": 1}', object_hook=lambda obj: "dict", object_pairs_hook=lambda pairs: "pairs"),
+            "pairs",
+        )
+
+    def test_load(self):
+        self.assertEqual(json.load(StringIO('{"b": 1, "a": 2}'), object_pairs_hook=list), [("b", 1), ("a", 2)])
+
+
+class MemoTestCase(unittest.TestCase):
+    def test_shared_keys(self):
+        memo = {}
+        first = json.loads('{"hostname": "a"}', memo=memo)
+        second = json.loads('[{"hostname": "b"}]', memo=memo)
+
+        self.assertEqual(memo, {"hostname": "hostname"})
+        self.assertTrue(list(first.keys())[0] is list(second[0].keys())[0])
+
+    def test_escaped_keys(self):
+        memo = {}
+        self.assertEqual(json.loads('{"a\\"b": 1}', memo=memo), {'a"b': 1})
+        self.assertEqual(json.loads('{"a\\"b": 2}', memo=memo), {'a"b': 2})
+        self.assertEqual(memo, {'a\\"b': 'a"b'})
+
+
+class ErrorPositionTestCase(unittest.TestCase):
+    def _error(self, document):
+        try:
+            json.loads(document)
+        except json.JSONDecodeError:
+            return sys.exc_info()[1]
+
+        self.fail("No error raised for %s" % repr(document))
+
+    def test_position(self):
+        error = self._error('{"a": 1,\n "b" 2}')
+
+        self.assertEqual(error.msg, "Malformed JSON input: Object key was not properly closed")
+        self.assertEqual((error.pos, error.lineno, error.colno), (14, 2, 6))
+        self.assertEqual(str(error), "Malformed JSON input: Object key was not properly closed: line 2 column 6 (char 14)")
+
+    def test_invalid_value(self):
+        error = self._error('[1,\n\n  tru]')
+        self.assertEqual((error.pos, error.lineno, error.colno), (7, 3, 3))
+
+    def test_invalid_escape(self):
+        # The position is the one of the escape sequence, not of the string
+        self.assertEqual(self._error('["ok", "\\x"]').pos, 8)
+
+        error = self._error('{"ok": "a\\n",\n "key\\q": 1}')
+        self.assertEqual((error.pos, error.lineno, error.colno), (19, 2, 6))
+
+    def test_end_of_input(self):
+        error = self._error('[1, 2')
+        self.assertEqual((error.pos, error.lineno, error.colno), (5, 1, 6))
+
+    def test_without_position(self):
+        error = json.JSONDecodeError("Custom message")
+
+        self.assertEqual((error.pos, error.lineno, error.colno), (None, None, None))
+        self.assertEqual(str(error), "Custom message")
+
+
 class CommentsTestCase(unittest.TestCase):
     """ Comments are not allowed in standard JSON (only in JSON5) """
     def test_single_line(self):
@@ -198,6 +352,18 @@ class InvalidJSONTestCase(unittest.TestCase):
 
         self.assertRaises(Exception, json.loads, r"""[string string]""")
 
+    def test_invalid_separators(self):
+        # Trailing commas and missing separators are not allowed
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""{"key": 1,}""")
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""[1,]""")
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""[1 2]""")
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""{"key" 1}""")
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""{"key"}""")
+
+        # Brackets must be closed in the same order they were opened
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""[1}""")
+        self.assertRaises(json.JSONDecodeError, json.loads, r"""{"key": [1}]""")
+
     def test_invalid_types(self):
         self.assertRaises(Exception, json.loads, r"""undefined""")
         self.assertRaises(Exception, json.loads, r"""random_string""")
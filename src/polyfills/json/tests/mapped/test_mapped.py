@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import polyfills.json as json
+from polyfills.json import mapped
+
+DOCUMENT = {
+    "servers": [{"name": "server%d" % _index, "port": 9080 + _index} for _index in range(100)],
+    "cell": u"caf\u00e8",
+}
+
+
+class LoadPathTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mktemp(".json")
+        self.write(json.dumps(DOCUMENT, indent=2))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, text):
+        fh = open(self.path, "wb")
+        fh.write(text.encode("utf-8"))
+        fh.close()
+
+    def test_load_path(self):
+        self.assertEqual(json.load_path(self.path), DOCUMENT)
+
+    def test_readers(self):
+        # Every method returns the same text (those not available return None)
+        text = mapped._read_buffered(self.path)
+
+        self.assertEqual(json.loads(text), DOCUMENT)
+        for read in [mapped._map_with_nio, mapped._map_with_mmap]:
+            result = read(self.path)
+            if result is not None:
+                self.assertEqual(result, text)
+
+    def test_non_ascii(self):
+        self.write(u'["caf\u00e8", "\u20ac"]')
+
+        self.assertEqual(json.load_path(self.path), [u"caf\u00e8", u"\u20ac"])
+
+        # Every method decodes the UTF-8 bytes (also on Python 2)
+        for read in [mapped._map_with_nio, mapped._map_with_mmap, mapped._read_buffered]:
+            result = read(self.path)
+            if result is not None:
+                self.assertEqual(result, u'["caf\u00e8", "\u20ac"]')
+
+    def test_options(self):
+        self.write('{"b": true, "a": [false]}')
+
+        self.assertEqual(json.load_path(self.path, truthy_value=1, falsy_value=0), {"b": 1, "a": [0]})
+        self.assertRaises(json.JSONDecodeError, json.load_path, self.path, max_depth=1)
+
+    def test_empty_file(self):
+        self.write("")
+
+        self.assertRaises(json.JSONDecodeError, json.load_path, self.path)
+
+    def test_missing_file(self):
+        self.assertRaises(IOError, json.load_path, self.path + ".missing")
+
+        for read in [mapped._map_with_mmap, mapped._read_buffered]:
+            self.assertRaises(IOError, read, self.path + ".missing")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,103 @@
+import os
+import sys
+import tempfile
+import traceback
+import unittest
+
+import polyfills.json as json
+from polyfills.json import parallel
+
+RECORDS = []
+for _index in range(50):
+    RECORDS.append({"id": _index, "name": "record %d" % _index, "tags": ["a", "b"]})
+
+
+class ParallelLoadLinesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mktemp(".jsonl")
+
+        fh = open(self.path, "w")
+        for record in RECORDS:
+            fh.write(json.dumps(record) + "\n")
+        fh.close()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_ranges(self):
+        size = os.path.getsize(self.path)
+
+        for parts in range(1, 10):
+            ranges = parallel._split_ranges(self.path, parts)
+
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], size)
+            for position in range(1, len(ranges)):
+                self.assertEqual(ranges[position][0], ranges[position - 1][1])
+
+    def test_order(self):
+        for workers in [1, 2, 3, 7]:
+            self.assertEqual(json.parallel_load_lines(self.path, workers=workers), RECORDS)
+
+    def test_more_workers_than_lines(self):
+        fh = open(self.path, "w")
+        fh.write('{"id": 1}\n\n')
+        fh.close()
+
+        self.assertEqual(json.parallel_load_lines(self.path, workers=8), [{"id": 1}])
+
+    def test_threads(self):
+        tasks = []
+        for start, end in parallel._split_ranges(self.path, 4):
+            tasks.append((self.path, start, end, None, None))
+
+        records = []
+        for chunk in parallel._map_with_threads(tasks):
+            records.extend(chunk)
+
+        self.assertEqual(records, RECORDS)
+
+    def test_invalid_line(self):
+        fh = open(self.path, "a")
+        fh.write('{"id": }\n')
+        fh.close()
+
+        self.assertRaises(json.JSONDecodeError, json.parallel_load_lines, self.path, 2)
+
+    def test_thread_error_traceback(self):
+        fh = open(self.path, "a")
+        fh.write('{"id": }\n')
+        fh.close()
+
+        try:
+            parallel._map_with_threads([(self.path, 0, os.path.getsize(self.path), None, None)])
+        except json.JSONDecodeError:
+            functions = [frame[2] for frame in traceback.extract_tb(sys.exc_info()[2])]
+        else:
+            self.fail("No error raised")
+
+        # The traceback of the worker is kept
+        self.assertTrue("_decode_range" in functions)
+
+    def test_pool_not_available(self):
+        try:
+            import multiprocessing
+        except ImportError:
+            return
+
+        def broken_pool(processes):
+            raise OSError("Function not implemented")
+
+        original = multiprocessing.Pool
+        multiprocessing.Pool = broken_pool
+        try:
+            self.assertEqual(json.parallel_load_lines(self.path, workers=3), RECORDS)
+        finally:
+            multiprocessing.Pool = original
+
+    def test_invalid_workers(self):
+        self.assertRaises(ValueError, json.parallel_load_lines, self.path, 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
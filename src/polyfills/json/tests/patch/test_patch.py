@@ -0,0 +1,114 @@
+import copy
+import unittest
+
+import polyfills.json as json
+from polyfills.json.patch import diff, apply_patch, JSONPatchError
+
+
+def _round_trip(a, b):
+    """ Returns the result of applying the diff of `a` and `b` to a copy of `a` """
+    return apply_patch(copy.deepcopy(a), diff(a, b))
+
+
+class DiffTestCase(unittest.TestCase):
+    def test_identical(self):
+        document = {"servers": [{"name": "server1"}]}
+
+        self.assertEqual(diff(document, document), [])
+        self.assertEqual(diff(document, copy.deepcopy(document)), [])
+
+    def test_replace_leaf(self):
+        self.assertEqual(
+            diff({"servers": [{"name": "server1", "port": 80}]}, {"servers": [{"name": "server1", "port": 443}]}),
+            [{"op": "replace", "path": "/servers/0/port", "value": 443}],
+        )
+
+    def test_members(self):
+        self.assertEqual(diff({"a": 1}, {"b": 2}), [
+            {"op": "remove", "path": "/a"},
+            {"op": "add", "path": "/b", "value": 2},
+        ])
+
+    def test_arrays(self):
+        self.assertEqual(diff([1, 2, 3], [1, 5, 3]), [{"op": "replace", "path": "/1", "value": 5}])
+
+    def test_arrays_length(self):
+        # Arrays whose length differs are replaced without comparing their items
+        self.assertEqual(diff([1, 2, 3], [1, 5]), [{"op": "replace", "path": "", "value": [1, 5]}])
+        self.assertEqual(diff({"a": [1]}, {"a": [1, 2, 3]}), [{"op": "replace", "path": "/a", "value": [1, 2, 3]}])
+
+    def test_tuples(self):
+        self.assertEqual(diff({"a": (1, 2)}, {"a": (1, 2)}), [])
+        self.assertEqual(diff({"a": (1, [2])}, {"a": (1, [3])}), [{"op": "replace", "path": "/a", "value": (1, [3])}])
+        self.assertEqual(_round_trip({"a": (1, [2])}, {"a": (1, [3])}), {"a": (1, [3])})
+
+    def test_types(self):
+        self.assertEqual(diff({"a": [1]}, {"a": {"0": 1}}), [{"op": "replace", "path": "/a", "value": {"0": 1}}])
+        self.assertEqual(diff({"a": 1}, {"a": "1"}), [{"op": "replace", "path": "/a", "value": "1"}])
+        self.assertEqual(diff(1, 2), [{"op": "replace", "path": "", "value": 2}])
+
+    def test_escaped_keys(self):
+        self.assertEqual(diff({"a/b": {"c~d": 1}}, {"a/b": {"c~d": 2}}), [{"op": "replace", "path": "/a~1b/c~0d", "value": 2}])
+
+    def test_non_ascii_keys(self):
+        a = json.loads('{"\\u00e8": {"x": 1}}')
+        b = json.loads('{"\\u00e8": {"x": 2}}')
+
+        self.assertEqual(diff(a, b), [{"op": "replace", "path": u"/\u00e8/x", "value": 2}])
+        self.assertEqual(_round_trip(a, b), b)
+
+    def test_round_trip(self):
+        cases = [
+            ({"a": [1, 2, {"b": None}], "c": "x"}, {"a": [1, {"b": 1 == 1}], "d": []}),
+            ([[1, 2], [3]], [[1], [3, 4], [5]]),
+            ({"a/b": {"~": 1}}, {"a/b": {"~": 2, "/": 3}}),
+            ({}, {"a": {"b": {"c": [1]}}}),
+            ([1, 2, 3], []),
+            ([(1, 2), {"a": (3,)}], [(1, 5), {"a": (3, 4)}]),
+        ]
+        for a, b in cases:
+            self.assertEqual(_round_trip(a, b), b)
+
+
+class ApplyPatchTestCase(unittest.TestCase):
+    def test_add(self):
+        self.assertEqual(apply_patch({"a": [1, 3]}, [{"op": "add", "path": "/a/1", "value": 2}]), {"a": [1, 2, 3]})
+        self.assertEqual(apply_patch({"a": [1]}, [{"op": "add", "path": "/a/-", "value": 2}]), {"a": [1, 2]})
+        self.assertEqual(apply_patch({}, [{"op": "add", "path": "", "value": [1]}]), [1])
+
+    def test_move_and_copy(self):
+        self.assertEqual(
+            apply_patch({"a": {"b": 1}, "c": {}}, [{"op": "move", "from": "/a/b", "path": "/c/d"}]),
+            {"a": {}, "c": {"d": 1}},
+        )
+        self.assertEqual(
+            apply_patch({"a": [1]}, [{"op": "copy", "from": "/a", "path": "/b"}]),
+            {"a": [1], "b": [1]},
+        )
+        self.assertRaises(JSONPatchError, apply_patch, {"a": {}}, [{"op": "move", "from": "/a", "path": "/a/b"}])
+
+    def test_test(self):
+        self.assertEqual(apply_patch({"a": 1}, [{"op": "test", "path": "/a", "value": 1}]), {"a": 1})
+        self.assertRaises(JSONPatchError, apply_patch, {"a": 1}, [{"op": "test", "path": "/a", "value": 2}])
+
+    def test_invalid(self):
+        invalid_patches = [
+            [{"op": "remove", "path": "/missing"}],
+            [{"op": "replace", "path": "/a/5", "value": 1}],
+            [{"op": "add", "path": "/a/01", "value": 1}],
+            [{"op": "add", "path": "a", "value": 1}],
+            [{"op": "add", "path": "/a/0/b", "value": 1}],
+            [{"op": "unknown", "path": "/a"}],
+            [{"op": "add", "path": "/b"}],
+            [{"path": "/a"}],
+        ]
+        for ops in invalid_patches:
+            self.assertRaises(JSONPatchError, apply_patch, {"a": [1]}, ops)
+
+    def test_exported(self):
+        self.assertEqual(json.diff, diff)
+        self.assertEqual(json.apply_patch, apply_patch)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
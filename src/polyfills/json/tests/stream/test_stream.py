@@ -0,0 +1,114 @@
+import sys
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import polyfills.json as json
+from polyfills.json.stream import IncrementalDecoder, iterparse
+
+DOCUMENT = '{"name": "server\\"1\\"", "ports": [80, 443, 8.5e1], "enabled": true, "parent": null, "tags": {}}'
+EVENTS = [
+    ("start_map", None),
+    ("map_key", "name"),
+    ("string", 'server"1"'),
+    ("map_key", "ports"),
+    ("start_array", None),
+    ("number", 80),
+    ("number", 443),
+    ("number", 85.0),
+    ("end_array", None),
+    ("map_key", "enabled"),
+    ("boolean", 1 == 1),
+    ("map_key", "parent"),
+    ("null", None),
+    ("map_key", "tags"),
+    ("start_map", None),
+    ("end_map", None),
+    ("end_map", None),
+]
+
+
+class IncrementalDecoderTestCase(unittest.TestCase):
+    def test_single_chunk(self):
+        decoder = IncrementalDecoder()
+        events = decoder.feed(DOCUMENT)
+        events = events + decoder.close()
+
+        self.assertEqual(events, EVENTS)
+
+    def test_every_chunk_size(self):
+        """ Tokens split across chunks must produce the same events """
+        for chunk_size in range(1, len(DOCUMENT) + 1):
+            decoder = IncrementalDecoder()
+            events = []
+            for start in range(0, len(DOCUMENT), chunk_size):
+                events = events + decoder.feed(DOCUMENT[start:start+chunk_size])
+            events = events + decoder.close()
+
+            self.assertEqual(events, EVENTS, "Wrong events with chunk size %d" % chunk_size)
+
+    def test_number_at_the_end(self):
+        decoder = IncrementalDecoder()
+        self.assertEqual(decoder.feed("12"), [])
+        self.assertEqual(decoder.feed("34"), [])
+        self.assertEqual(decoder.close(), [("number", 1234)])
+
+    def test_custom_bool(self):
+        decoder = IncrementalDecoder(truthy_value="__TEST_TRUE__", falsy_value="__TEST_FALSE__")
+        self.assertEqual(
+            decoder.feed("[true, false]") + decoder.close(),
+            [("start_array", None), ("boolean", "__TEST_TRUE__"), ("boolean", "__TEST_FALSE__"), ("end_array", None)],
+        )
+
+    def test_invalid(self):
+        self.assertRaises(json.JSONDecodeError, IncrementalDecoder().feed, '["key": "val"]')
+        self.assertRaises(json.JSONDecodeError, IncrementalDecoder().feed, "{'key': 1}")
+        self.assertRaises(json.JSONDecodeError, IncrementalDecoder().feed, "{}[]")
+
+        decoder = IncrementalDecoder()
+        decoder.feed('{"key": [1, 2')
+        self.assertRaises(json.JSONDecodeError, decoder.close)
+
+        decoder = IncrementalDecoder()
+        decoder.feed('"unterminated')
+        self.assertRaises(json.JSONDecodeError, decoder.close)
+
+    def test_error_position(self):
+        decoder = IncrementalDecoder()
+        decoder.feed('{"key": [1, ')
+        decoder.feed('2], ')
+
+        try:
+            decoder.feed('"other" 3}')
+        except json.JSONDecodeError:
+            error = sys.exc_info()[1]
+        else:
+            self.fail("No error raised")
+
+        self.assertEqual(error.pos, 24)
+
+    def test_feed_after_close(self):
+        decoder = IncrementalDecoder()
+        decoder.feed("[]")
+        decoder.close()
+        self.assertRaises(ValueError, decoder.feed, "[]")
+
+
+class IterparseTestCase(unittest.TestCase):
+    def test_iterparse(self):
+        events = []
+        for event in iterparse(StringIO(DOCUMENT), chunk_size=7):
+            events.append(event)
+
+        self.assertEqual(events, EVENTS)
+
+    def test_exported(self):
+        self.assertEqual(json.iterparse, iterparse)
+        self.assertEqual(json.IncrementalDecoder, IncrementalDecoder)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -6,7 +6,11 @@ wsadmin>dir(os.path)
 ```
 """
 import os as _os
+import errno as _errno
 import glob as _glob
+import stat as _stat
+import sys as _sys
+import tempfile as _tempfile
 import time
 import unittest as _unittest
 
@@ -18,7 +22,99 @@ else:
     pathlib_available = 1
 
 
-__all__ = ["Path"]
+__all__ = ["Path", "enable_stat_cache", "disable_stat_cache", "clear_stat_cache"]
+
+
+# Errors of the `stat` system call meaning that the path does not exist
+#   (some Jython versions do not set `errno` at all)
+_MISSING_ERRNOS = (None, 0, _errno.ENOENT, _errno.ENOTDIR)
+
+
+# ---> Stat cache
+#
+#      When enabled, the result of every `stat` call is kept for `_stat_cache_ttl`
+#      seconds, so that checking `exists()`, `is_file()` and `is_dir()` on the
+#      same path makes a single system call. Missing paths are cached too.
+_stat_cache = {}            # type: dict[str, tuple[float, tuple|None]]
+_stat_cache_ttl = None      # type: float|None
+
+
+def enable_stat_cache(ttl=1.0):
+    """Enable the stat cache shared by all the `Path` objects.
+
+    Changes made to the filesystem by other programs (or without using
+    `Path` methods) are only seen once the cached entry expires.
+
+    Args:
+        ttl (float, optional): How many seconds each entry is kept. Defaults to 1.0.
+    """
+    global _stat_cache_ttl
+
+    _stat_cache_ttl = ttl
+    _stat_cache.clear()
+
+
+def disable_stat_cache():
+    """Disable the stat cache (the default) and drop its entries."""
+    global _stat_cache_ttl
+
+    _stat_cache_ttl = None
+    _stat_cache.clear()
+
+
+def clear_stat_cache(path=None):
+    """Drop the cached entry of a path, or of all the paths.
+
+    Args:
+        path (str|Path, optional): The path whose entry should be dropped. Defaults to None (all the entries).
+    """
+    if path is None:
+        _stat_cache.clear()
+        return
+
+    path = Path(path)._resolved_path()
+    if _stat_cache.get(path) is not None:
+        del _stat_cache[path]
+
+
+def _stat_entry(path):
+    """Return the stat record of a path, together with its type.
+
+    Some Jython versions do not report the mode in the stat record: in that
+    case the type is detected with `os.path`.
+
+    Args:
+        path (str): The resolved path.
+
+    Raises:
+        OSError: The path cannot be checked (e.g. permission denied).
+
+    Returns:
+        tuple|None: The `(stat_result, is_dir, is_file)` triple, or None if the path does not exist.
+    """
+    if _stat_cache_ttl is not None:
+        cached = _stat_cache.get(path)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
+    try:
+        result = _os.stat(path)
+    except _os.error:
+        if getattr(_sys.exc_info()[1], "errno", None) not in _MISSING_ERRNOS:
+            raise
+
+        entry = None
+    else:
+        mode = result[_stat.ST_MODE]
+        if mode:
+            entry = (result, _stat.S_ISDIR(mode), _stat.S_ISREG(mode))
+        else:
+            entry = (result, _os.path.isdir(path), _os.path.isfile(path))
+
+    if _stat_cache_ttl is not None:
+        _stat_cache[path] = (time.time() + _stat_cache_ttl, entry)
+
+    return entry
 
 
 class _Flavour:
@@ -231,13 +327,41 @@ class Path(Base):
         """
         return Path(_os.path.expanduser(self._path))
 
+    def _resolved_path(self):
+        """Return the string of the resolved path (see `resolve()`) without creating a new `Path`.
+
+        Returns:
+            str: The absolute and normalized path.
+        """
+        return _os.path.abspath(_os.path.normpath(self._path))
+
+    def stat(self):
+        """Return the result of the `stat` system call on this path.
+
+        When the stat cache is enabled (see `enable_stat_cache()`) the
+        record may come from the cache.
+
+        Raises:
+            OSError: The path does not exist (or cannot be checked).
+
+        Returns:
+            os.stat_result: The stat record of the path.
+        """
+        path = self._resolved_path()
+
+        entry = _stat_entry(path)
+        if entry is None:
+            raise OSError(_errno.ENOENT, "No such file or directory", path)
+
+        return entry[0]
+
     def exists(self):
         """Whether this path exists.
 
         Returns:
             bool: True if the path exists, False otherwise.
         """
-        return _os.path.exists(str(Path(self._path).resolve()))
+        return _stat_entry(self._resolved_path()) is not None
 
     def glob(self, pattern):
         # type: (str) -> list[str]
@@ -258,16 +382,19 @@ class Path(Base):
         """Remove this file or link.  If the path is a directory, use rmdir() instead.
 
         Raises:
-            OSError: If the path is a directory and `missing_ok` is False.
+            OSError: If the path is a directory, or if it does not exist and `missing_ok` is False.
 
         Returns:
             None: No return value.
         """
         try:
             _os.remove(str(Path(self._path).resolve()))
-        except FileNotFoundError:
-            if not missing_ok:
+        except OSError:
+            # `FileNotFoundError` is not available on Python 2
+            if not missing_ok or getattr(_sys.exc_info()[1], "errno", None) != _errno.ENOENT:
                 raise
+
+        clear_stat_cache(self)
     
     def rename(self, target):
         """Rename this file or directory to the given target.
@@ -280,6 +407,9 @@ class Path(Base):
         """
         _os.rename(str(Path(self._path).resolve()), str(Path(target).resolve()))
 
+        clear_stat_cache(self)
+        clear_stat_cache(target)
+
     def read_bytes(self):
         """Open the file in bytes mode, read it, and close the file.
 
@@ -306,6 +436,7 @@ class Path(Base):
             None: No return value.
         """
         self._safe_write(self._path, data, mode="wb")
+        clear_stat_cache(self)
 
     def write_text(self, data):
         """Open the file in text mode, write to it, and close the file.
@@ -317,6 +448,7 @@ class Path(Base):
             None: No return value.
         """
         self._safe_write(self._path, data, mode="w")
+        clear_stat_cache(self)
 
     def _safe_read(self, filename, mode="r"):
         """Wrapper around the classic `open` function which makes sure to always
@@ -370,7 +502,9 @@ class Path(Base):
         Returns:
             bool: True if the path is a file, False otherwise.
         """
-        return _os.path.isfile(str(self.resolve()))
+        entry = _stat_entry(self._resolved_path())
+
+        return entry is not None and entry[2]
 
     def is_dir(self):
         """Whether this path is a directory.
@@ -378,7 +512,9 @@ class Path(Base):
         Returns:
             bool: True if the path is a directory, False otherwise.
         """
-        return _os.path.isdir(str(self.resolve()))
+        entry = _stat_entry(self._resolved_path())
+
+        return entry is not None and entry[1]
 
 
 class PathTestCase(_unittest.TestCase):
@@ -510,6 +646,66 @@ class PathTestCase(_unittest.TestCase):
         )
 
 
+class StatCacheTestCase(_unittest.TestCase):
+    def setUp(self):
+        self.path = Path(_tempfile.mktemp(".txt"))
+
+    def tearDown(self):
+        disable_stat_cache()
+        self.path.unlink(missing_ok=1 == 1)
+
+    def test_unlink_missing(self):
+        self.assertRaises(OSError, self.path.unlink)
+        self.path.unlink(missing_ok=1 == 1)
+
+    def test_method_stat(self):
+        self.path.write_text("12345")
+
+        self.assertEqual(self.path.stat()[_stat.ST_SIZE], 5)
+        self.assertRaises(OSError, Path("/should/not/exist").stat)
+
+    def test_predicates_without_cache(self):
+        self.assertEqual(self.path.exists(), 1 == 0)
+
+        self.path.write_text("data")
+        self.assertEqual(self.path.exists(), 1 == 1)
+        self.assertEqual(self.path.is_file(), 1 == 1)
+        self.assertEqual(self.path.is_dir(), 1 == 0)
+
+    def test_cached_entries(self):
+        enable_stat_cache(60)
+        self.assertEqual(self.path.exists(), 1 == 0)
+
+        # Changes made without `Path` methods are seen only once the entry is dropped
+        file = open(str(self.path), "w")
+        file.write("data")
+        file.close()
+        self.assertEqual(self.path.exists(), 1 == 0)
+        self.assertRaises(OSError, self.path.stat)
+
+        clear_stat_cache(self.path)
+        self.assertEqual(self.path.exists(), 1 == 1)
+        self.assertEqual(self.path.is_file(), 1 == 1)
+
+    def test_cache_updated_by_path_methods(self):
+        enable_stat_cache(60)
+        self.assertEqual(self.path.exists(), 1 == 0)
+
+        self.path.write_text("data")
+        self.assertEqual(self.path.exists(), 1 == 1)
+
+        self.path.unlink()
+        self.assertEqual(self.path.exists(), 1 == 0)
+
+    def test_expired_entries(self):
+        enable_stat_cache(0)
+        self.assertEqual(self.path.exists(), 1 == 0)
+
+        file = open(str(self.path), "w")
+        file.close()
+        self.assertEqual(self.path.exists(), 1 == 1)
+
+
 if __name__ == "__main__":
     _globals = globals()
 
@@ -3,3 +3,7 @@
 # Introduced in Python 2.2
 class NotImplementedError(RuntimeError):
 	"""Method or function hasn't been implemented yet."""
+
+# Introduced in Python 2.2 (together with the iterator protocol)
+class StopIteration(Exception):
+	"""Signal the end from iterator.next()."""